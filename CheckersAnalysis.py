@@ -0,0 +1,102 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Scores large batches of Checkers boards at once with NumPy.
+
+import numpy as np
+from CheckersGame import SQUARE_LOCATIONS, RAYS
+
+#Number stored in a board array for each piece name returned by get_checker_details. Black pieces are positive and
+#White pieces are negative, with 1 for men, 2 for kings and 3 for triple kings.
+BOARD_CODES = {None: 0, "Black": 1, "Black_king": 2, "Black_Triple_King": 3,
+               "White": -1, "White_king": -2, "White_Triple_King": -3}
+
+#Names of the columns returned by board_features
+FEATURE_NAMES = ("black_men", "black_kings", "black_triple_kings", "white_men", "white_kings", "white_triple_kings",
+                 "black_back_row_guards", "white_back_row_guards", "black_mobility", "white_mobility")
+
+#Weights used by evaluate_boards, one per feature, matching the engine's piece values
+DEFAULT_WEIGHTS = np.array([100, 160, 220, -100, -160, -220, 6, -6, 2, -2], dtype=np.float32)
+
+#Rows and columns of the 32 dark squares, used to pack an 8 x 8 board into 32 squares
+_DARK_ROWS = np.array([row for row, column in SQUARE_LOCATIONS])
+_DARK_COLUMNS = np.array([column for row, column in SQUARE_LOCATIONS])
+
+#Squares along each diagonal from each square, RAY_INDEXES[direction, square, step], padded with 32. Square 32 is an
+#extra column added to packed boards that always holds a piece, so a ray stops there.
+RAY_INDEXES = np.full((4, 32, 7), 32, dtype=np.intp)
+for _direction in range(4):
+    for _square in range(32):
+        _ray = RAYS[_direction][_square]
+        RAY_INDEXES[_direction, _square, :len(_ray)] = _ray
+
+#Back row squares: Black's is row 7 (squares 28-31) and White's is row 0 (squares 0-3)
+_BLACK_BACK_ROW = np.arange(28, 32)
+_WHITE_BACK_ROW = np.arange(0, 4)
+
+def boards_to_array(boards):
+    """
+    Converts a list of boards in the form of Checkers._current_board (lists of 8 rows of piece names) into an
+    (N, 8, 8) int8 array of BOARD_CODES. The conversion compares whole arrays at once, one comparison per piece name,
+    rather than looking at each square in Python.
+    """
+    names = np.empty((len(boards), 8, 8), dtype=object)
+    names[...] = boards
+    codes = np.zeros(names.shape, dtype=np.int8)
+    for name, code in BOARD_CODES.items():
+        if name is not None:
+            codes[names == name] = code
+    return codes
+
+def pack_boards(boards):
+    """
+    Returns the boards as an (N, 32) int8 array of the dark squares, in square number order (see SQUARE_LOCATIONS).
+    Takes an (N, 8, 8) or (N, 32) array or list of BOARD_CODES, or a list of boards as in Checkers._current_board.
+    A list of 8 x 8 boards is read as piece names if its first board holds any name or None, and as codes otherwise.
+    """
+    if not isinstance(boards, np.ndarray):
+        if len(boards) and np.shape(boards[0]) == (8, 8) and \
+                any(cell is None or isinstance(cell, str) for row in boards[0] for cell in row):
+            boards = boards_to_array(boards)
+        else:
+            boards = np.asarray(boards, dtype=np.int8)
+    if boards.ndim == 3:
+        return boards[:, _DARK_ROWS, _DARK_COLUMNS]
+    if boards.ndim == 2 and boards.shape[1] == 32:
+        return boards
+    raise ValueError("boards must have shape (N, 8, 8) or (N, 32)")
+
+def board_features(boards):
+    """
+    Returns an (N, 10) float32 array of features for the boards, one column per name in FEATURE_NAMES: the number
+    of each kind of piece, the men still guarding each side's back row, and each side's mobility (the number of
+    moves that don't capture). Takes boards in any form pack_boards accepts.
+    """
+    packed = pack_boards(boards)
+    count = len(packed)
+    features = np.empty((count, len(FEATURE_NAMES)), dtype=np.float32)
+    for column, code in enumerate((1, 2, 3, -1, -2, -3)):
+        features[:, column] = (packed == code).sum(axis=1)
+    features[:, 6] = (packed[:, _BLACK_BACK_ROW] == 1).sum(axis=1)
+    features[:, 7] = (packed[:, _WHITE_BACK_ROW] == -1).sum(axis=1)
+    #Length of the empty run along every ray from every square: (N, 4, 32)
+    empty = np.zeros((count, 33), dtype=bool)
+    empty[:, :32] = packed == 0
+    slides = np.logical_and.accumulate(empty[:, RAY_INDEXES], axis=3).sum(axis=3, dtype=np.int8)
+    steps = empty[:, RAY_INDEXES[:, :, 0]]
+    black_men = packed == 1
+    white_men = packed == -1
+    black_kings = packed >= 2
+    white_kings = packed <= -2
+    features[:, 8] = (steps[:, 0] & black_men).sum(axis=1) + (steps[:, 1] & black_men).sum(axis=1) + \
+        (slides * black_kings[:, np.newaxis, :]).sum(axis=(1, 2))
+    features[:, 9] = (steps[:, 2] & white_men).sum(axis=1) + (steps[:, 3] & white_men).sum(axis=1) + \
+        (slides * white_kings[:, np.newaxis, :]).sum(axis=(1, 2))
+    return features
+
+def evaluate_boards(boards, weights=DEFAULT_WEIGHTS):
+    """
+    Returns an (N,) float32 array of scores for the boards from Black's point of view (negate for White), computed
+    as the board features times the weights. Takes boards in any form pack_boards accepts.
+    """
+    return board_features(boards) @ np.asarray(weights, dtype=np.float32)
@@ -0,0 +1,97 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Unit tests for the CheckersAnalysis program.
+
+import random
+import unittest
+from CheckersGame import Checkers
+
+try:
+    import numpy as np
+    from CheckersAnalysis import boards_to_array, pack_boards, board_features, evaluate_boards, FEATURE_NAMES
+except ImportError:
+    np = None
+
+def random_boards(count, seed):
+    """Returns boards from random games, in the form of Checkers._current_board."""
+    random_moves = random.Random(seed)
+    boards = []
+    for _ in range(count):
+        game = Checkers(bitboard=True)
+        for _ in range(random_moves.randrange(60)):
+            moves = game.get_moves()
+            if not moves:
+                break
+            game.make_move(random_moves.choice(moves))
+        boards.append(game._current_board)
+    return boards
+
+def slow_mobility(board, checker_color):
+    """Counts the moves that don't capture for the color by looking at every square, to check the fast version."""
+    total = 0
+    for row in range(8):
+        for column in range(8):
+            piece = board[row][column]
+            if piece is None or not piece.startswith(checker_color):
+                continue
+            if piece == "Black":
+                directions = ((-1, -1), (-1, 1))
+            elif piece == "White":
+                directions = ((1, -1), (1, 1))
+            else:
+                directions = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+            for row_direction, column_direction in directions:
+                next_row, next_column = row + row_direction, column + column_direction
+                while 0 <= next_row <= 7 and 0 <= next_column <= 7 and board[next_row][next_column] is None:
+                    total += 1
+                    if piece in ("Black", "White"):
+                        break
+                    next_row, next_column = next_row + row_direction, next_column + column_direction
+    return total
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestAnalysis(unittest.TestCase):
+    """Contains unit tests for the batch board analysis functions."""
+
+    def test_1(self):
+        """Tests the features and score of the starting board."""
+        features = board_features([Checkers()._current_board])
+        self.assertEqual(features.shape, (1, len(FEATURE_NAMES)))
+        self.assertEqual(list(features[0]), [12, 0, 0, 12, 0, 0, 4, 4, 7, 7])
+        self.assertEqual(evaluate_boards([Checkers()._current_board])[0], 0)
+
+    def test_2(self):
+        """Tests that the features of random boards match counts made one square at a time."""
+        boards = random_boards(40, 8)
+        features = board_features(boards)
+        for board, board_features_row in zip(boards, features):
+            pieces = [piece for row in board for piece in row]
+            self.assertEqual(board_features_row[1], pieces.count("Black_king"))
+            self.assertEqual(board_features_row[5], pieces.count("White_Triple_King"))
+            self.assertEqual(board_features_row[8], slow_mobility(board, "Black"))
+            self.assertEqual(board_features_row[9], slow_mobility(board, "White"))
+
+    def test_3(self):
+        """Tests that lists of boards, 8 x 8 arrays and packed 32 square arrays all give the same scores."""
+        boards = random_boards(20, 9)
+        array_boards = boards_to_array(boards)
+        self.assertEqual(array_boards.shape, (20, 8, 8))
+        self.assertEqual(array_boards.dtype, np.int8)
+        packed_boards = pack_boards(array_boards)
+        self.assertEqual(packed_boards.shape, (20, 32))
+        scores = evaluate_boards(boards)
+        self.assertTrue(np.array_equal(scores, evaluate_boards(array_boards)))
+        self.assertTrue(np.array_equal(scores, evaluate_boards(packed_boards)))
+        self.assertRaises(ValueError, pack_boards, np.zeros((2, 5), dtype=np.int8))
+
+    def test_4(self):
+        """Tests that lists of boards holding codes, 8 x 8 or packed, pack like the same boards as arrays."""
+        array_boards = boards_to_array(random_boards(10, 4))
+        packed_boards = pack_boards(array_boards)
+        self.assertTrue(np.array_equal(pack_boards(array_boards.tolist()), packed_boards))
+        self.assertTrue(np.array_equal(pack_boards(list(array_boards)), packed_boards))
+        self.assertTrue(np.array_equal(pack_boards(packed_boards.tolist()), packed_boards))
+        self.assertTrue(np.array_equal(pack_boards([[[0] * 8] * 8]), np.zeros((1, 32), dtype=np.int8)))
+        self.assertTrue(np.array_equal(pack_boards([[[None] * 8] * 8]), np.zeros((1, 32), dtype=np.int8)))
+        self.assertTrue(np.any(packed_boards))
@@ -0,0 +1,333 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Performance benchmarks for the Checkers game and engine.
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from CheckersGame import Checkers, BitBoard, STARTING_BOARD
+from CheckersEngine import Engine, ParallelEngine
+from CheckersPerft import perft
+from CheckersRecord import RecordReader
+
+#Opening moves played before the search benchmarks, so the position has plenty of root moves to share out
+BENCHMARK_OPENING = [((5, 2), (4, 3)), ((2, 1), (3, 2)), ((6, 1), (5, 2)), ((1, 0), (2, 1))]
+
+#Game replayed by the play_game benchmark when no archive is given, as (starting square, destination square) moves.
+#Black plays the first move, and a move by the same player as the one before continues a capture sequence.
+BENCHMARK_GAME = [((5, 0), (4, 1)), ((2, 1), (3, 2)), ((4, 1), (3, 0)), ((1, 0), (2, 1)), ((5, 6), (4, 7)),
+                  ((3, 2), (4, 3)), ((5, 4), (3, 2)), ((3, 2), (1, 0)), ((1, 2), (2, 1)), ((3, 0), (1, 2)),
+                  ((0, 3), (2, 1)), ((5, 2), (4, 3)), ((0, 1), (1, 2)), ((1, 0), (0, 1)), ((2, 1), (3, 0)),
+                  ((6, 1), (5, 2)), ((1, 2), (2, 1)), ((0, 1), (3, 4)), ((2, 1), (3, 2)), ((4, 3), (2, 1))]
+
+#The number each benchmark is judged by when comparing with a baseline, and whether higher is better
+BENCHMARK_METRICS = {"perft": ("nodes_per_second", True), "play_game": ("moves_per_second", True),
+                     "play_move": ("microseconds_per_move", False),
+                     "checker_details": ("lookups_per_second", True), "engine": ("nodes_per_second", True),
+                     "search": ("seconds", False), "parallel_search": ("seconds", False),
+                     "game_memory": ("bytes_per_game", False), "startup": ("first_move_ms", False)}
+
+#Fields that tell apart results of the same benchmark, for matching them with the baseline
+IDENTITY_FIELDS = ("name", "depth", "workers", "bitboard", "games", "module", "backend")
+
+#Run in a new interpreter by the startup benchmark: imports the module and plays the first move, then prints the
+#seconds taken to import and to get to the end of the first move
+STARTUP_SCRIPT = """
+import time
+start_time = time.perf_counter()
+import {module}
+from CheckersGame import Checkers
+imported_time = time.perf_counter()
+game = Checkers()
+game.create_player("Black player", "Black")
+game.create_player("White player", "White")
+game.play_game("Black player", (5, 0), (4, 1))
+print(imported_time - start_time, time.perf_counter() - start_time)
+"""
+
+def make_benchmark_game(bitboard=True):
+    """Returns a new game between two players with the benchmark opening played, on a bitboard unless told not to."""
+    game = Checkers(bitboard)
+    game.create_player("Black player", "Black")
+    game.create_player("White player", "White")
+    for starting_square, destination_square in BENCHMARK_OPENING:
+        if game.get_player_turn() == "Black":
+            game.play_game("Black player", starting_square, destination_square)
+        else:
+            game.play_game("White player", starting_square, destination_square)
+    return game
+
+def benchmark_parallel_search(depth=9, worker_counts=(1, 2, 4, 8)):
+    """
+    Times a search to a fixed depth from the benchmark position with a single process engine and with a parallel
+    engine for each number of workers. Returns a list of results with the wall-clock seconds, the speedup over one
+    worker and the number of worker processes the engine used, which is never more than the CPUs (see
+    ParallelEngine). A depth 1 search starts each parallel engine's workers before the timing starts.
+    """
+    results = []
+    game = make_benchmark_game()
+    player = game.get_player_by_color("Black")
+    start_time = time.perf_counter()
+    Engine(game, player).choose_internal_move(time_budget_ms=10 ** 9, max_depth=depth)
+    results.append({"name": "search", "workers": 0, "depth": depth,
+                    "seconds": time.perf_counter() - start_time})
+    one_worker_seconds = None
+    for workers in worker_counts:
+        with ParallelEngine(game, player, workers=workers) as engine:
+            engine.choose_internal_move(time_budget_ms=10 ** 9, max_depth=1)
+            start_time = time.perf_counter()
+            engine.choose_internal_move(time_budget_ms=10 ** 9, max_depth=depth)
+            seconds = time.perf_counter() - start_time
+            processes = engine.get_workers()
+        if one_worker_seconds is None:
+            one_worker_seconds = seconds
+        results.append({"name": "parallel_search", "workers": workers, "depth": depth, "seconds": seconds,
+                        "speedup": one_worker_seconds / seconds, "processes": processes})
+    return results
+
+def benchmark_perft(depth=7):
+    """
+    Counts the positions depth moves from the starting position with CheckersPerft.perft and returns the count and
+    nodes per second. No transposition table is used, so every node goes through the move generator.
+    """
+    start_time = time.perf_counter()
+    nodes = perft(BitBoard(STARTING_BOARD).get_masks(), "Black", depth)
+    seconds = time.perf_counter() - start_time
+    return {"name": "perft", "depth": depth, "nodes": nodes, "seconds": seconds, "nodes_per_second": nodes / seconds}
+
+def load_archive(paths):
+    """Returns the moves of each record file (see CheckersRecord) as a list of lists of (start, destination) pairs."""
+    games = []
+    for path in paths:
+        with RecordReader(path) as reader:
+            games.append(list(reader.moves()))
+    return games
+
+def benchmark_play_game(games=None, repeat=2000, bitboard=False):
+    """
+    Replays the games (lists of moves as from load_archive, BENCHMARK_GAME if None) repeat times each with
+    play_game, and returns the moves played per second. Each replay works out whose turn it is from the game, so
+    capture sequences are replayed by the player who started them. The turn is read from the game's attribute rather
+    than with get_player_turn, here and in benchmark_play_move, so the method call isn't timed with every move.
+    """
+    if games is None:
+        games = [BENCHMARK_GAME]
+    moves_played = 0
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        for moves in games:
+            game = Checkers(bitboard)
+            game.create_player("Black player", "Black")
+            game.create_player("White player", "White")
+            for starting_square, destination_square in moves:
+                if game._player_turn == "Black":
+                    game.play_game("Black player", starting_square, destination_square)
+                else:
+                    game.play_game("White player", starting_square, destination_square)
+            moves_played += len(moves)
+    seconds = time.perf_counter() - start_time
+    return {"name": "play_game", "bitboard": bitboard, "games": len(games) * repeat, "moves": moves_played,
+            "seconds": seconds, "moves_per_second": moves_played / seconds}
+
+def benchmark_play_move(games=None, repeat=2000, bitboard=False):
+    """
+    Like benchmark_play_game, but the games are created and their players added before the clock starts, so only
+    the play_game calls are timed. Returns the microseconds taken per move.
+    """
+    if games is None:
+        games = [BENCHMARK_GAME]
+    replays = []
+    for _ in range(repeat):
+        for moves in games:
+            game = Checkers(bitboard)
+            game.create_player("Black player", "Black")
+            game.create_player("White player", "White")
+            replays.append((game, moves))
+    moves_played = 0
+    start_time = time.perf_counter()
+    for game, moves in replays:
+        for starting_square, destination_square in moves:
+            if game._player_turn == "Black":
+                game.play_game("Black player", starting_square, destination_square)
+            else:
+                game.play_game("White player", starting_square, destination_square)
+        moves_played += len(moves)
+    seconds = time.perf_counter() - start_time
+    return {"name": "play_move", "bitboard": bitboard, "games": len(replays), "moves": moves_played,
+            "seconds": seconds, "microseconds_per_move": seconds * 1000000 / moves_played}
+
+def benchmark_checker_details(repeat=20000, bitboard=False):
+    """Reads every square of a game with get_checker_details repeat times and returns the lookups per second."""
+    game = make_benchmark_game(bitboard)
+    locations = [(row, column) for row in range(8) for column in range(8)]
+    get_checker_details = game.get_checker_details
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        for location in locations:
+            get_checker_details(location)
+    seconds = time.perf_counter() - start_time
+    lookups = repeat * len(locations)
+    return {"name": "checker_details", "bitboard": bitboard, "lookups": lookups, "seconds": seconds,
+            "lookups_per_second": lookups / seconds}
+
+def benchmark_engine(depth=9, backend="python"):
+    """
+    Searches the benchmark position to the depth with one engine using the search backend and returns the nodes
+    searched per second. A compiled backend is compiled by a short search with another engine first, so the time
+    doesn't include it.
+    """
+    game = make_benchmark_game()
+    if backend != "python":
+        warm_up_engine = Engine(game, game.get_player_by_color("Black"), backend=backend)
+        warm_up_engine.choose_internal_move(time_budget_ms=10 ** 9, max_depth=1)
+    engine = Engine(game, game.get_player_by_color("Black"), backend=backend)
+    start_time = time.perf_counter()
+    engine.choose_internal_move(time_budget_ms=10 ** 9, max_depth=depth)
+    seconds = time.perf_counter() - start_time
+    nodes = engine.get_search_info()["nodes"]
+    return {"name": "engine", "depth": depth, "backend": backend, "nodes": nodes, "seconds": seconds,
+            "nodes_per_second": nodes / seconds}
+
+def benchmark_startup(module="CheckersGame", repeat=10):
+    """
+    Starts a new Python interpreter repeat times, each importing the module (with CheckersGame) and playing a first
+    move, as a worker process does. Returns the median milliseconds from the start of the import to the end of the
+    import, to the end of the first move, and for the whole process including starting the interpreter. Imports are
+    timed inside the new interpreter, so they include compiling any module that has no cached bytecode.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    import_times = []
+    first_move_times = []
+    process_times = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        output = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT.format(module=module)], cwd=directory,
+                                capture_output=True, text=True, check=True).stdout
+        process_times.append(time.perf_counter() - start_time)
+        import_seconds, first_move_seconds = (float(value) for value in output.split())
+        import_times.append(import_seconds)
+        first_move_times.append(first_move_seconds)
+    middle = repeat // 2
+    return {"name": "startup", "module": module, "runs": repeat,
+            "import_ms": sorted(import_times)[middle] * 1000, "first_move_ms": sorted(first_move_times)[middle] * 1000,
+            "process_ms": sorted(process_times)[middle] * 1000}
+
+def compare_with_baseline(results, baseline, tolerance=0.1):
+    """
+    Adds a "baseline" value and a "change" ratio to each result that has a matching result in baseline (a list of
+    results from an earlier run), comparing the number named in BENCHMARK_METRICS. A result more than tolerance
+    worse than its baseline is marked "regression": true. Returns the list of regressed results.
+    """
+    baseline_values = {}
+    for result in baseline:
+        identity = tuple(result.get(field) for field in IDENTITY_FIELDS)
+        baseline_values[identity] = result
+    regressions = []
+    for result in results:
+        metric, higher_is_better = BENCHMARK_METRICS[result["name"]]
+        old_result = baseline_values.get(tuple(result.get(field) for field in IDENTITY_FIELDS))
+        if old_result is None or not old_result.get(metric):
+            continue
+        change = result[metric] / old_result[metric]
+        result["baseline"] = old_result[metric]
+        result["change"] = change
+        if higher_is_better:
+            result["regression"] = change < 1 - tolerance
+        else:
+            result["regression"] = change > 1 + tolerance
+        if result["regression"]:
+            regressions.append(result)
+    return regressions
+
+def read_results(path):
+    """Reads benchmark results written one JSON object per line, as main prints them."""
+    with open(path) as results_file:
+        return [json.loads(line) for line in results_file if line.strip()]
+
+def benchmark_game_memory(count=1000000, bitboard=False):
+    """
+    Creates count games with two players each and keeps them all alive, to measure how many games fit in memory.
+    Returns the seconds taken and the bytes allocated per game, traced with tracemalloc (which also slows the
+    creation down). The player names are shared strings, so longer unique names would add their own size.
+    """
+    games = [None] * count
+    tracemalloc.start()
+    try:
+        start_memory = tracemalloc.get_traced_memory()[0]
+        start_time = time.perf_counter()
+        for number in range(count):
+            game = Checkers(bitboard)
+            game.create_player("Black player", "Black")
+            game.create_player("White player", "White")
+            games[number] = game
+        seconds = time.perf_counter() - start_time
+        memory = tracemalloc.get_traced_memory()[0] - start_memory
+    finally:
+        tracemalloc.stop()
+    return {"name": "game_memory", "games": count, "bitboard": bitboard, "seconds": seconds,
+            "bytes_per_game": memory / count}
+
+def main():
+    """Runs the benchmarks named on the command line and prints one JSON result per line."""
+    parser = argparse.ArgumentParser(description="Checkers performance benchmarks")
+    parser.add_argument("benchmarks", nargs="*",
+                        default=["perft", "play_game", "play_move", "details", "engine", "search", "startup"],
+                        choices=("perft", "play_game", "play_move", "details", "engine", "search", "memory", "startup"),
+                        help="benchmarks to run (all but memory by default)")
+    parser.add_argument("--perft-depth", type=int, default=7, help="depth for the perft benchmark")
+    parser.add_argument("--engine-depth", type=int, default=9, help="depth for the engine benchmark")
+    parser.add_argument("--backend", choices=("python", "numba"), default="python",
+                        help="search backend for the engine benchmark")
+    parser.add_argument("--archive", nargs="+", default=None,
+                        help="record files to replay in the play_game benchmarks")
+    parser.add_argument("--baseline", help="results file from an earlier run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="how much worse than the baseline a result can be before it counts as a regression")
+    parser.add_argument("--output", help="file to write the results to, one JSON object per line")
+    parser.add_argument("--depth", type=int, default=9, help="search depth for the search benchmarks")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="worker counts for the parallel search benchmark")
+    parser.add_argument("--games", type=int, default=1000000, help="games to create for the memory benchmark")
+    arguments = parser.parse_args()
+    results = []
+    if "perft" in arguments.benchmarks:
+        results.append(benchmark_perft(arguments.perft_depth))
+    if "play_game" in arguments.benchmarks:
+        games = load_archive(arguments.archive) if arguments.archive else None
+        for bitboard in (False, True):
+            results.append(benchmark_play_game(games, bitboard=bitboard))
+    if "play_move" in arguments.benchmarks:
+        games = load_archive(arguments.archive) if arguments.archive else None
+        for bitboard in (False, True):
+            results.append(benchmark_play_move(games, bitboard=bitboard))
+    if "details" in arguments.benchmarks:
+        for bitboard in (False, True):
+            results.append(benchmark_checker_details(bitboard=bitboard))
+    if "engine" in arguments.benchmarks:
+        results.append(benchmark_engine(arguments.engine_depth, arguments.backend))
+    if "search" in arguments.benchmarks:
+        results.extend(benchmark_parallel_search(arguments.depth, arguments.workers))
+    if "memory" in arguments.benchmarks:
+        for bitboard in (False, True):
+            results.append(benchmark_game_memory(arguments.games, bitboard))
+    if "startup" in arguments.benchmarks:
+        for module in ("CheckersGame", "CheckersEngine"):
+            results.append(benchmark_startup(module))
+    regressions = []
+    if arguments.baseline:
+        regressions = compare_with_baseline(results, read_results(arguments.baseline), arguments.tolerance)
+    lines = [json.dumps(result) for result in results]
+    print("\n".join(lines))
+    if arguments.output:
+        with open(arguments.output, "w") as results_file:
+            results_file.write("\n".join(lines) + "\n")
+    if regressions:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Unit tests for the CheckersBenchmark program.
+
+import subprocess
+import sys
+import unittest
+from CheckersBenchmark import (benchmark_perft, benchmark_play_game, benchmark_play_move, benchmark_startup,
+                               compare_with_baseline)
+
+class TestBenchmark(unittest.TestCase):
+    """Contains unit tests for the benchmark results and the baseline comparison."""
+
+    def test_1(self):
+        """Tests the perft counts from the starting position and that the play_game benchmarks replay cleanly."""
+        self.assertEqual([benchmark_perft(depth)["nodes"] for depth in range(1, 5)], [7, 49, 302, 1469])
+        result = benchmark_play_game(repeat=3, bitboard=True)
+        self.assertEqual((result["games"], result["moves"]), (3, 60))
+        for bitboard in (False, True):
+            result = benchmark_play_move(repeat=3, bitboard=bitboard)
+            self.assertEqual((result["name"], result["moves"]), ("play_move", 60))
+            self.assertGreater(result["microseconds_per_move"], 0)
+
+    def test_2(self):
+        """Tests that results are matched with their baseline and regressions are found in the right direction."""
+        baseline = [{"name": "perft", "depth": 5, "nodes_per_second": 1000.0},
+                    {"name": "play_game", "bitboard": True, "games": 3, "moves_per_second": 500.0},
+                    {"name": "game_memory", "bitboard": False, "games": 10, "bytes_per_game": 700.0}]
+        results = [{"name": "perft", "depth": 5, "nodes_per_second": 850.0},
+                   {"name": "play_game", "bitboard": False, "games": 3, "moves_per_second": 100.0},
+                   {"name": "game_memory", "bitboard": False, "games": 10, "bytes_per_game": 760.0}]
+        regressions = compare_with_baseline(results, baseline, tolerance=0.1)
+        self.assertEqual([result["name"] for result in regressions], ["perft"])
+        self.assertAlmostEqual(results[0]["change"], 0.85)
+        self.assertNotIn("baseline", results[1])
+        self.assertFalse(results[2]["regression"])
+
+    def test_3(self):
+        """Tests the startup benchmark, and that the engine doesn't import the process pool at startup."""
+        result = benchmark_startup("CheckersEngine", repeat=1)
+        self.assertEqual((result["name"], result["module"], result["runs"]), ("startup", "CheckersEngine", 1))
+        self.assertGreaterEqual(result["first_move_ms"], result["import_ms"])
+        self.assertGreater(result["process_ms"], result["first_move_ms"])
+        output = subprocess.run([sys.executable, "-c", "import sys, CheckersEngine, CheckersBook, CheckersTablebase; "
+                                 "print(sorted({'concurrent.futures'} & set(sys.modules)))"],
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "[]")
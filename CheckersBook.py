@@ -0,0 +1,156 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Builds an opening book from archived Checkers games and looks up book moves for the engine.
+
+import argparse
+import struct
+from CheckersGame import Checkers, InvalidSquare, OutofTurn, SQUARE_LOCATIONS, SQUARE_GRID
+
+#A book file is a BOOK_HEADER followed by fixed-size records sorted by position hash and then move. Each record is a
+#position hash (see Checkers.get_position_hash), a move (starting square << 5 | final square of the whole move, as
+#in CheckersDatabase), the number of archived games that played the move in the position and how many of those
+#the player who made it went on to win.
+BOOK_MAGIC = b"CKBOK1"
+BOOK_HEADER = struct.Struct("<6sQ")
+BOOK_RECORD = struct.Struct("<QHII")
+
+def _archived_moves(moves, max_plies):
+    """
+    Replays one archived game, a list of (starting square location, destination square location) pairs as passed to
+    play_game. Returns a list of (position hash, move, color to move) entries for its first max_plies whole moves,
+    where a capture sequence of several hops is one move, and the color of the winner of the whole game (None if
+    game_winner names no one). The game is replayed in a strict game, and a game with an illegal move is only used
+    up to that move.
+    """
+    game = Checkers(strict=True)
+    game.create_player("Black player", "Black")
+    game.create_player("White player", "White")
+    book_moves = []
+    position_hash = game.get_position_hash()
+    starting_square = None
+    for starting_square_location, destination_square_location in moves:
+        player_turn = game.get_player_turn()
+        try:
+            game.play_game(player_turn + " player", starting_square_location, destination_square_location)
+        except (InvalidSquare, OutofTurn):
+            break
+        if starting_square is None:
+            starting_square = SQUARE_GRID[starting_square_location[0]][starting_square_location[1]]
+        if game.get_player_turn() != player_turn:
+            if len(book_moves) < max_plies:
+                final_square = SQUARE_GRID[destination_square_location[0]][destination_square_location[1]]
+                book_moves.append((position_hash, starting_square << 5 | final_square, player_turn))
+            position_hash = game.get_position_hash()
+            starting_square = None
+    winner = game.game_winner()
+    if winner.endswith(" player"):
+        return book_moves, winner[:-len(" player")]
+    return book_moves, None
+
+def build_book(path, games, max_plies=20, min_games=1):
+    """
+    Writes a book file from games, an iterable of archived games given as lists of (starting square location,
+    destination square location) pairs (see CheckersBenchmark.load_archive). The first max_plies whole moves of each
+    game are counted, and moves played in fewer than min_games games are left out. Returns the number of records
+    written.
+    """
+    statistics = {} #(position hash, move): [games, wins]
+    for moves in games:
+        book_moves, winner = _archived_moves(moves, max_plies)
+        for position_hash, move, checker_color in book_moves:
+            entry = statistics.setdefault((position_hash, move), [0, 0])
+            entry[0] += 1
+            if winner == checker_color:
+                entry[1] += 1
+    records = [(key, entry) for key, entry in sorted(statistics.items()) if entry[0] >= min_games]
+    with open(path, "wb") as book_file:
+        book_file.write(BOOK_HEADER.pack(BOOK_MAGIC, len(records)))
+        for (position_hash, move), (games_played, wins) in records:
+            book_file.write(BOOK_RECORD.pack(position_hash, move, games_played, wins))
+    return len(records)
+
+class OpeningBook:
+    """
+    Reads a book file written by build_book. Only the header is read when the book is opened, so a worker can open
+    the book at startup for free. The whole file is read the first time a position is looked up and kept as a
+    dictionary from position hash to its book moves, so a lookup is one dictionary probe and positions that aren't
+    in the book cost nothing more. Books only cover the first moves of games, so they stay small enough for this.
+    """
+
+    def __init__(self, path):
+        self._path = path
+        with open(path, "rb") as book_file:
+            magic, self._count = BOOK_HEADER.unpack(book_file.read(BOOK_HEADER.size))
+        if magic != BOOK_MAGIC:
+            raise ValueError("not a Checkers opening book")
+        self._positions = None
+
+    def _load(self):
+        """Reads the book moves from the file, the first time they are needed, and returns them."""
+        if self._positions is None:
+            with open(self._path, "rb") as book_file:
+                data = book_file.read()
+            positions = {}
+            for position_hash, move, games_played, wins in BOOK_RECORD.iter_unpack(data[BOOK_HEADER.size:]):
+                positions.setdefault(position_hash, []).append((move >> 5, move & 31, games_played, wins))
+            self._positions = {position_hash: tuple(book_moves) for position_hash, book_moves in positions.items()}
+        return self._positions
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, position_hash):
+        return position_hash in self._load()
+
+    def lookup(self, position_hash):
+        """
+        Returns the book moves of the position as a list of ((starting square location, destination square location),
+        games, wins) entries, most played first, or an empty list if the position isn't in the book.
+        """
+        book_moves = sorted(self._load().get(position_hash, ()), key=lambda book_move: -book_move[2])
+        return [((SQUARE_LOCATIONS[starting_square], SQUARE_LOCATIONS[final_square]), games_played, wins)
+                for starting_square, final_square, games_played, wins in book_moves]
+
+    def choose(self, position_hash, moves, random_moves=None):
+        """
+        Returns the book move for the position out of moves, its legal moves as (path, captured) pairs (see
+        Checkers.get_moves), or None if none of them is in the book. Each book move is weighted by the games it was
+        played in plus the games it won. The move with the largest weight is chosen, or with random_moves (a
+        random.Random) a move is picked at random in proportion to its weight.
+        """
+        book_moves = self._load().get(position_hash)
+        if book_moves is None:
+            return None
+        candidates = []
+        for starting_square, final_square, games_played, wins in book_moves:
+            for move in moves:
+                path = move[0]
+                if path[0] == starting_square and path[-1] == final_square:
+                    candidates.append((games_played + wins, move))
+                    break
+        if not candidates:
+            return None
+        if random_moves is None:
+            return max(candidates, key=lambda candidate: candidate[0])[1]
+        pick = random_moves.random() * sum(weight for weight, move in candidates)
+        for weight, move in candidates:
+            pick -= weight
+            if pick < 0:
+                return move
+        return candidates[-1][1]
+
+def main():
+    """Builds an opening book from record files (see CheckersRecord) on the command line."""
+    from CheckersBenchmark import load_archive
+    parser = argparse.ArgumentParser(description="Build a Checkers opening book from archived games.")
+    parser.add_argument("book", help="book file to write")
+    parser.add_argument("archive", nargs="+", help="record files of the games to build the book from")
+    parser.add_argument("--plies", type=int, default=20, help="number of moves of each game to put in the book")
+    parser.add_argument("--min-games", type=int, default=1, help="leave out moves played in fewer games")
+    arguments = parser.parse_args()
+    count = build_book(arguments.book, load_archive(arguments.archive), arguments.plies, arguments.min_games)
+    print("wrote", count, "book moves")
+
+if __name__ == '__main__':
+    main()
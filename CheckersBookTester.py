@@ -0,0 +1,126 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Unit tests for the CheckersBook program.
+
+import os
+import random
+import tempfile
+import unittest
+from CheckersGame import Checkers, SQUARE_LOCATIONS
+from CheckersBook import OpeningBook, build_book
+from CheckersEngine import Engine
+
+def random_game(random_moves, plies):
+    """
+    Returns a random game as a list of (starting square location, destination square location) hops, and the same
+    game as a list of (path, captured) moves.
+    """
+    game = Checkers(bitboard=True)
+    hops = []
+    played = []
+    for ply in range(plies):
+        moves = game.get_moves()
+        if not moves:
+            break
+        move = random_moves.choice(moves)
+        hops.extend((SQUARE_LOCATIONS[start], SQUARE_LOCATIONS[end]) for start, end in zip(move[0], move[0][1:]))
+        game.make_move(move)
+        played.append(move)
+    return hops, played
+
+def finished_game(random_moves):
+    """Returns a random game played until it is over as a list of hops (see random_game), and its winning color."""
+    game = Checkers(bitboard=True)
+    hops = []
+    while game.game_winner() == "Game has not ended":
+        move = random_moves.choice(game.get_moves())
+        hops.extend((SQUARE_LOCATIONS[start], SQUARE_LOCATIONS[end]) for start, end in zip(move[0], move[0][1:]))
+        game.make_move(move)
+    return hops, game.game_winner()
+
+class TestBook(unittest.TestCase):
+    """Contains unit tests for building and reading opening books."""
+
+    def test_1(self):
+        """Tests that every archived move is counted under the position it was played in, whole moves at a time."""
+        random_moves = random.Random(20)
+        games = [random_game(random_moves, 30) for _ in range(40)]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "openings.book")
+            count = build_book(path, [hops for hops, played in games], max_plies=12)
+            book = OpeningBook(path)
+            self.assertEqual(len(book), count)
+            opening_moves = book.lookup(Checkers().get_position_hash())
+            self.assertEqual(sum(games_played for move, games_played, wins in opening_moves), 40)
+            self.assertEqual(opening_moves, sorted(opening_moves, key=lambda book_move: -book_move[1]))
+            start = Checkers()
+            start.create_player("Ashley", "Black")
+            start.create_player("Tiffany", "White")
+            for move, games_played, wins in opening_moves:
+                self.assertIn(move, start.legal_moves("Ashley"))
+                self.assertLessEqual(wins, games_played)
+            for hops, played in games:
+                game = Checkers(bitboard=True)
+                for move in played[:12]:
+                    book_moves = [move for move, games_played, wins in book.lookup(game.get_position_hash())]
+                    self.assertIn((SQUARE_LOCATIONS[move[0][0]], SQUARE_LOCATIONS[move[0][-1]]), book_moves)
+                    self.assertIn(book.choose(game.get_position_hash(), game.get_moves()), game.get_moves())
+                    game.make_move(move)
+                self.assertNotIn(game.get_position_hash(), book) #only the first 12 moves are in the book
+            self.assertNotIn(Checkers().get_position_hash() ^ 1, book)
+            self.assertIsNone(book.choose(Checkers().get_position_hash() ^ 1, start.get_moves()))
+
+    def test_2(self):
+        """Tests that the engine plays the most played book move without searching, and searches once out of book."""
+        games = [[((5, 6), (4, 7)), ((2, 1), (3, 0))]] * 3 + [[((5, 0), (4, 1))]]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "openings.book")
+            build_book(path, games)
+            book = OpeningBook(path)
+            game = Checkers()
+            player1 = game.create_player("Ashley", "Black")
+            player2 = game.create_player("Tiffany", "White")
+            engine = Engine(game, player1, book=book)
+            self.assertEqual(engine.choose_move(time_budget_ms=100), ((5, 6), (4, 7)))
+            self.assertTrue(engine.get_search_info()["book"])
+            self.assertEqual(engine.get_search_info()["nodes"], 0)
+            game.play_game("Ashley", (5, 6), (4, 7))
+            self.assertEqual(Engine(game, player2, book=book).choose_move(time_budget_ms=100), ((2, 1), (3, 0)))
+            game.play_game("Tiffany", (2, 1), (3, 0))
+            engine.choose_move(time_budget_ms=100)
+            self.assertFalse(engine.get_search_info()["book"])
+            self.assertGreater(engine.get_search_info()["depth"], 0)
+            weighted_moves = []
+            for seed in range(200):
+                game = Checkers()
+                player1 = game.create_player("Ashley", "Black")
+                game.create_player("Tiffany", "White")
+                engine = Engine(game, player1, book=book, book_random=random.Random(seed))
+                weighted_moves.append(engine.choose_move(100))
+            self.assertEqual(set(weighted_moves), {((5, 6), (4, 7)), ((5, 0), (4, 1))})
+
+    def test_3(self):
+        """Tests that the moves of a finished game count as wins for the player who went on to win it."""
+        random_moves = random.Random(3)
+        games = [finished_game(random_moves) for _ in range(20)]
+        black_wins = sum(winner == "Black" for hops, winner in games)
+        white_wins = sum(winner == "White" for hops, winner in games)
+        self.assertGreater(black_wins, 0)
+        self.assertGreater(white_wins, 0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "openings.book")
+            build_book(path, [hops for hops, winner in games], max_plies=2)
+            book = OpeningBook(path)
+            opening_moves = book.lookup(Checkers().get_position_hash())
+            self.assertEqual(sum(wins for move, games_played, wins in opening_moves), black_wins)
+            hops, winner = next(game for game in games if game[1] == "White")
+            game = Checkers()
+            game.create_player("Ashley", "Black")
+            game.play_game("Ashley", hops[0][0], hops[0][1])
+            reply = (hops[1][0], hops[1][1])
+            reply_entry = [entry for entry in book.lookup(game.get_position_hash()) if entry[0] == reply][0]
+            self.assertGreater(reply_entry[2], 0)
+
+if __name__ == '__main__':
+    unittest.main()
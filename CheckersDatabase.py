@@ -0,0 +1,134 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: An on-disk database of Checkers positions and their statistics, read through a memory map.
+
+import mmap
+import struct
+from CheckersGame import PIECE_CODES, SQUARE_LOCATIONS, SQUARE_GRID
+
+#A database file is a DATABASE_HEADER followed by fixed-size records sorted by key. A key is KEY_SIZE bytes: the 32
+#dark squares packed two to a byte (square 0 in the high half of the first byte), each half holding 0 for an empty
+#square or 1 + the piece's code in PIECE_CODES, followed by b"B" or b"W" for whose turn it is.
+DATABASE_MAGIC = b"CKPDB1"
+DATABASE_HEADER = struct.Struct("<6sQ")
+KEY_SIZE = 17
+
+#Key, then the win, loss and draw counts for the player to move, the best move (starting square << 5 | destination
+#square, or NO_MOVE) and the engine score
+RECORD = struct.Struct("<17sIIIHi")
+NO_MOVE = 0xFFFF
+
+def position_key(rows, checker_color):
+    """
+    Returns the database key of a board, given as a list of 8 rows of piece names like Checkers._current_board, and
+    the color whose turn it is.
+    """
+    key = bytearray(KEY_SIZE)
+    for square, (row, column) in enumerate(SQUARE_LOCATIONS):
+        piece = rows[row][column]
+        if piece is not None:
+            key[square >> 1] |= (PIECE_CODES[piece] + 1) << (4 if square % 2 == 0 else 0)
+    if checker_color == "Black":
+        key[16] = ord("B")
+    else:
+        key[16] = ord("W")
+    return bytes(key)
+
+def game_key(game):
+    """Returns the database key of the game's current position."""
+    return position_key(game.get_board(), game.get_player_turn())
+
+def _encode_move(best_move):
+    """Returns the 2-byte number for a (starting square location, destination square location) move, or NO_MOVE."""
+    if best_move is None:
+        return NO_MOVE
+    starting_square_location, destination_square_location = best_move
+    return SQUARE_GRID[starting_square_location[0]][starting_square_location[1]] << 5 | \
+        SQUARE_GRID[destination_square_location[0]][destination_square_location[1]]
+
+def build_database(path, positions):
+    """
+    Writes a database file from positions, an iterable of (key, statistics) pairs. The statistics are a dictionary
+    with the keys "wins", "losses", "draws", "best_move" (a (starting square location, destination square location)
+    pair or None) and "score". If a key appears more than once, the last statistics for it are kept. The records are
+    sorted in memory before they are written. Returns the number of positions written.
+    """
+    records = {}
+    for key, statistics in positions:
+        records[key] = RECORD.pack(key, statistics.get("wins", 0), statistics.get("losses", 0),
+                                   statistics.get("draws", 0), _encode_move(statistics.get("best_move")),
+                                   statistics.get("score", 0))
+    with open(path, "wb") as database_file:
+        database_file.write(DATABASE_HEADER.pack(DATABASE_MAGIC, len(records)))
+        for key in sorted(records):
+            database_file.write(records[key])
+    return len(records)
+
+class PositionDatabase:
+    """
+    Reads a database file written by build_database. The file is memory-mapped and only its header is read when
+    it is opened, so opening takes the same time however big the database is. Lookups binary search the sorted
+    records in place, so only the pages they touch are read from disk.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count = DATABASE_HEADER.unpack_from(self._map, 0)
+        if magic != DATABASE_MAGIC:
+            self.close()
+            raise ValueError("not a Checkers position database")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        """Closes the memory map and the file."""
+        self._map.close()
+        self._file.close()
+
+    def _find(self, key):
+        """Returns the offset of the record with the key, or None if the key isn't in the database."""
+        position_map = self._map
+        low = 0
+        high = self._count
+        while low < high:
+            middle = (low + high) // 2
+            offset = DATABASE_HEADER.size + middle * RECORD.size
+            middle_key = position_map[offset:offset + KEY_SIZE]
+            if middle_key < key:
+                low = middle + 1
+            elif middle_key > key:
+                high = middle
+            else:
+                return offset
+        return None
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def lookup(self, key):
+        """
+        Returns the statistics stored for the key as a dictionary (see build_database), or None if the position
+        isn't in the database.
+        """
+        offset = self._find(key)
+        if offset is None:
+            return None
+        key, wins, losses, draws, best_move, score = RECORD.unpack_from(self._map, offset)
+        if best_move == NO_MOVE:
+            best_move = None
+        else:
+            best_move = (SQUARE_LOCATIONS[best_move >> 5], SQUARE_LOCATIONS[best_move & 31])
+        return {"wins": wins, "losses": losses, "draws": draws, "best_move": best_move, "score": score}
+
+    def lookup_game(self, game):
+        """Returns the statistics stored for the game's current position, or None if it isn't in the database."""
+        return self.lookup(game_key(game))
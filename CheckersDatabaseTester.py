@@ -0,0 +1,52 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Unit tests for the CheckersDatabase program.
+
+import os
+import random
+import tempfile
+import unittest
+from CheckersGame import Checkers
+from CheckersDatabase import PositionDatabase, build_database, position_key, game_key
+
+class TestDatabase(unittest.TestCase):
+    """Contains unit tests for building and reading position databases."""
+
+    def test_1(self):
+        """Tests that every position written can be looked up, and positions not written can't."""
+        random_moves = random.Random(10)
+        positions = []
+        for game_number in range(30):
+            game = Checkers(bitboard=True)
+            for ply in range(40):
+                moves = game.get_moves()
+                if not moves:
+                    break
+                game.make_move(random_moves.choice(moves))
+                positions.append((game_key(game), {"wins": game_number, "losses": ply, "draws": 1,
+                                                   "best_move": ((5, 0), (4, 1)), "score": -ply}))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "positions.db")
+            count = build_database(path, positions)
+            expected = dict(positions)
+            self.assertEqual(count, len(expected))
+            with PositionDatabase(path) as database:
+                self.assertEqual(len(database), count)
+                for key, statistics in expected.items():
+                    self.assertEqual(database.lookup(key), statistics)
+                starting_key = position_key(Checkers()._current_board, "White")
+                self.assertNotIn(starting_key, database)
+                self.assertIsNone(database.lookup(starting_key))
+
+    def test_2(self):
+        """Tests that keys tell apart the side to move, and that a position with no best move reads back as None."""
+        game = Checkers()
+        self.assertEqual(len(game_key(game)), 17)
+        self.assertNotEqual(position_key(game._current_board, "Black"), position_key(game._current_board, "White"))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "positions.db")
+            build_database(path, [(game_key(game), {"wins": 3})])
+            with PositionDatabase(path) as database:
+                self.assertEqual(database.lookup_game(game),
+                                 {"wins": 3, "losses": 0, "draws": 0, "best_move": None, "score": 0})
@@ -0,0 +1,465 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: A computer player for the Checkers game, using alpha-beta search.
+
+import os
+import time
+from CheckersGame import Checkers, BitBoard, TranspositionTable, InvalidPlayer, OutofTurn, SQUARE_LOCATIONS, \
+    PROMOTIONS, ZOBRIST_KEYS, ZOBRIST_BLACK_TO_MOVE, generate_moves
+
+#Piece values used by the evaluation, in the order of PIECE_TYPES
+PIECE_VALUES = (100, 160, 220, 100, 160, 220)
+
+#Score of a won position. Wins found sooner score higher, so the engine takes the quickest win it can find. Scores
+#further from 0 than WIN_THRESHOLD are wins or losses a known number of moves away.
+WIN_SCORE = 100000
+WIN_THRESHOLD = WIN_SCORE - 1000
+
+#Squares on each side's back row, which guard against the opponent's men becoming kings, and the squares where a
+#man is close to becoming a king.
+BLACK_BACK_ROW = sum(1 << square for square, (row, column) in enumerate(SQUARE_LOCATIONS) if row == 7)
+WHITE_BACK_ROW = sum(1 << square for square, (row, column) in enumerate(SQUARE_LOCATIONS) if row == 0)
+BLACK_ADVANCED = sum(1 << square for square, (row, column) in enumerate(SQUARE_LOCATIONS) if 1 <= row <= 3)
+WHITE_ADVANCED = sum(1 << square for square, (row, column) in enumerate(SQUARE_LOCATIONS) if 4 <= row <= 6)
+
+def evaluate(masks, checker_color):
+    """
+    Scores a position from the point of view of the checker color, given the six board masks. Counts material, men
+    still guarding their back row and men close to becoming kings. A positive score is good for the checker color.
+    """
+    score = 0
+    for code in range(6):
+        value = masks[code].bit_count() * PIECE_VALUES[code]
+        if code < 3:
+            score += value
+        else:
+            score -= value
+    score += 6 * ((masks[0] & BLACK_BACK_ROW).bit_count() - (masks[3] & WHITE_BACK_ROW).bit_count())
+    score += 8 * ((masks[0] & BLACK_ADVANCED).bit_count() - (masks[3] & WHITE_ADVANCED).bit_count())
+    if checker_color == "Black":
+        return score
+    return -score
+
+def play_masks(masks, position_hash, move):
+    """
+    Plays a move from generate_moves on a copy of the six board masks. Returns the new masks and the position hash
+    (see Checkers.get_position_hash) after the move, worked out from the hash before it. The search plays moves this
+    way instead of with make_move and unmake_move, as a list of six numbers is cheaper to copy than a move is to undo.
+    """
+    path, captured = move
+    masks = masks[:]
+    starting_square = path[0]
+    starting_bit = 1 << starting_square
+    code = 0
+    while not masks[code] & starting_bit:
+        code += 1
+    masks[code] ^= starting_bit
+    position_hash ^= ZOBRIST_KEYS[code][starting_square] ^ ZOBRIST_BLACK_TO_MOVE
+    final_code = code
+    for square in path[1:]:
+        final_code = PROMOTIONS[final_code][square]
+    for square in captured:
+        bit = 1 << square
+        opponent_code = 3 if code < 3 else 0
+        while not masks[opponent_code] & bit:
+            opponent_code += 1
+        masks[opponent_code] ^= bit
+        position_hash ^= ZOBRIST_KEYS[opponent_code][square]
+    destination_square = path[-1]
+    masks[final_code] |= 1 << destination_square
+    position_hash ^= ZOBRIST_KEYS[final_code][destination_square]
+    return masks, position_hash
+
+def score_to_table(score, ply):
+    """
+    Returns the score of a position searched at the ply as stored in the transposition table. A win or loss is
+    stored as its distance from the position rather than from the root, so the entry is right at any other ply.
+    """
+    if score > WIN_THRESHOLD:
+        return score + ply
+    if score < -WIN_THRESHOLD:
+        return score - ply
+    return score
+
+def score_from_table(score, ply):
+    """Returns a score stored by score_to_table as the score of the position at the ply."""
+    if score > WIN_THRESHOLD:
+        return score - ply
+    if score < -WIN_THRESHOLD:
+        return score + ply
+    return score
+
+class SearchTimeout(Exception):
+    """Exception raised inside the search when the time budget for a move has run out."""
+    pass
+
+class Engine:
+    """
+    Chooses and plays moves for one player of a Checkers game. Uses alpha-beta search with iterative deepening, so
+    it searches one move deeper each round until the time budget runs out and then plays the best move of the last
+    finished round. Moves are ordered with the best move from the transposition table first, then captures (more
+    pieces first, so a triple king's double capture comes early), then killer moves and the history heuristic.
+    The search plays moves on copies of the board masks, so the game itself is never changed while searching. If a
+    Tablebase (see CheckersTablebase) is given, positions with few enough pieces are scored from it instead. If an
+    OpeningBook (see CheckersBook) is given, positions in the book are played from it without searching.
+
+    With backend="numba" the search below the root moves runs compiled (see CheckersFastSearch), which needs Numba
+    installed and can't probe a tablebase. It searches the same nodes as the default backend="python", many times
+    faster.
+    """
+
+    def __init__(self, game, player, table_size=1 << 18, tablebase=None, book=None, book_random=None,
+                 backend="python"):
+        if backend == "numba":
+            if tablebase is not None:
+                raise ValueError("the numba backend can't probe a tablebase")
+            from CheckersFastSearch import FastSearch #imported when asked for, as Numba is optional and slow to import
+            self._fast_search = FastSearch(table_size)
+        elif backend == "python":
+            self._fast_search = None
+        else:
+            raise ValueError("unknown search backend: " + str(backend))
+        self._backend = backend
+        self._game = game
+        self._player = player
+        self._table = TranspositionTable(table_size)
+        self._tablebase = tablebase
+        self._tablebase_pieces = tablebase.get_max_pieces() if tablebase is not None else 0
+        self._book = book
+        self._book_random = book_random #random.Random to vary the book moves played, or None for the most played
+        self._history = [[0] * 32 for _ in range(32)] #history[starting square][destination square]
+        self._killers = []
+        self._deadline = None
+        self._nodes = 0
+        self._search_info = {"depth": 0, "nodes": 0, "score": 0, "book": False, "time_ms": 0.0}
+
+    def get_search_info(self):
+        """
+        Returns the depth reached, nodes searched, score, whether the move came from the opening book and time taken
+        by the last call to choose_move.
+        """
+        return self._search_info
+
+    def _check_player(self):
+        """Raises InvalidPlayer if the engine's player isn't in the game, or OutofTurn if it isn't their turn."""
+        if self._game.get_player_by_color(self._player.get_checker_color()) is not self._player:
+            raise InvalidPlayer
+        if self._game.get_player_turn() != self._player.get_checker_color():
+            raise OutofTurn
+
+    def choose_internal_move(self, time_budget_ms=1000, max_depth=64):
+        """
+        Searches the game's current position for the engine's player for at most time_budget_ms milliseconds and
+        returns the best move found as a (path, captured) pair (see Checkers.get_moves), or None if the player has
+        no legal move. Raises InvalidPlayer or OutofTurn if the engine's player can't move now.
+        """
+        self._check_player()
+        start_time = time.perf_counter()
+        search_game = Checkers(bitboard=True)
+        search_game._set_board(BitBoard(self._game.get_board()), self._game.get_player_turn())
+        root_moves = search_game.get_moves()
+        best_move = root_moves[0] if root_moves else None
+        best_score = 0
+        depth_reached = 0
+        self._nodes = 0
+        if self._book is not None and len(root_moves) > 1:
+            book_move = self._book.choose(search_game.get_position_hash(), root_moves, self._book_random)
+            if book_move is not None:
+                self._search_info = {"depth": 0, "nodes": 0, "score": 0, "book": True,
+                                     "time_ms": (time.perf_counter() - start_time) * 1000}
+                return book_move
+        if len(root_moves) > 1:
+            results = self.search_root_moves(search_game, root_moves, max_depth, start_time + time_budget_ms / 1000)
+            if results:
+                depth_reached, best_score, best_move = results[-1]
+        self._search_info = {"depth": depth_reached, "nodes": self._nodes, "score": best_score, "book": False,
+                             "time_ms": (time.perf_counter() - start_time) * 1000}
+        return best_move
+
+    def search_root_moves(self, search_game, root_moves, max_depth, deadline):
+        """
+        Runs the iterative deepening search over the root moves in the search game's position until max_depth is
+        finished or the clock passes the deadline (a time.perf_counter value). Returns a list with a (depth, score,
+        best move) entry for every depth that was finished, deepest last. The search game is left as it was.
+        """
+        self._deadline = deadline
+        self._table.new_search()
+        if self._fast_search is not None:
+            self._fast_search.new_search()
+        masks = search_game.get_masks()
+        checker_color = search_game.get_player_turn()
+        position_hash = search_game.get_position_hash()
+        results = []
+        best_move = root_moves[0]
+        for depth in range(1, max_depth + 1):
+            try:
+                best_score, best_move = self._search_root(masks, checker_color, position_hash, root_moves, best_move,
+                                                          depth)
+            except SearchTimeout:
+                break
+            results.append((depth, best_score, best_move))
+            if abs(best_score) > WIN_THRESHOLD:
+                break
+        return results
+
+    def choose_move(self, time_budget_ms=1000, max_depth=64):
+        """
+        Returns the best move found for the engine's player within time_budget_ms milliseconds, as a tuple of square
+        locations in the same form as Checkers.legal_moves, or None if the player has no legal move.
+        """
+        move = self.choose_internal_move(time_budget_ms, max_depth)
+        if move is None:
+            return None
+        return tuple(SQUARE_LOCATIONS[square] for square in move[0])
+
+    def play_turn(self, time_budget_ms=1000, max_depth=64):
+        """
+        Chooses a move for the engine's player and plays the whole move in the game with make_move. Returns the
+        number of pieces captured, or None if the player has no legal move.
+        """
+        move = self.choose_internal_move(time_budget_ms, max_depth)
+        if move is None:
+            return None
+        return self._game.make_move(move)
+
+    def _search_root(self, masks, checker_color, position_hash, root_moves, previous_best_move, depth):
+        """
+        Searches every root move in the position (the board masks, the color to move and the position hash) to the
+        depth and returns the best (score, move), previous best move first.
+        """
+        root_moves.sort(key=lambda move: move != previous_best_move)
+        alpha = -WIN_SCORE - 1
+        best_move = root_moves[0]
+        opponent_color = "White" if checker_color == "Black" else "Black"
+        fast_search = self._fast_search
+        for move in root_moves:
+            new_masks, new_hash = play_masks(masks, position_hash, move)
+            if fast_search is None:
+                score = -self._search(new_masks, opponent_color, new_hash, depth - 1, -WIN_SCORE - 1, -alpha, 1)
+            else:
+                try:
+                    score = -fast_search.search(new_masks, opponent_color, new_hash, depth - 1, -WIN_SCORE - 1, -alpha,
+                                                1, self._deadline, self._nodes)
+                finally:
+                    self._nodes = fast_search.nodes
+            if score > alpha:
+                alpha = score
+                best_move = move
+        if fast_search is None:
+            self._table.store(position_hash, (alpha, 0, best_move), depth)
+        else:
+            fast_search.store(masks, checker_color, position_hash, alpha, 0, best_move, depth)
+        return alpha, best_move
+
+    def _order_moves(self, moves, table_move, ply):
+        """Sorts the moves so the ones most likely to be best are searched first."""
+        killers = self._killers[ply] if ply < len(self._killers) else ()
+        history = self._history
+
+        def move_order(move):
+            path, captured = move
+            if move == table_move:
+                return -10000000
+            if captured:
+                return -1000000 - len(captured)
+            if move in killers:
+                return -900000
+            return -history[path[0]][path[-1]]
+
+        moves.sort(key=move_order)
+
+    def _search(self, masks, checker_color, position_hash, depth, alpha, beta, ply):
+        """
+        Negamax alpha-beta search of the position given by the board masks, the color to move and the position hash.
+        Returns the score for the side to move. Captures are still searched once the depth runs out, so the score
+        isn't taken in the middle of an exchange.
+        """
+        self._nodes += 1
+        if self._nodes & 127 == 0 and time.perf_counter() > self._deadline:
+            raise SearchTimeout
+        moves = generate_moves(masks, checker_color)
+        if not moves:
+            return -WIN_SCORE + ply
+        if self._tablebase_pieces:
+            if sum(mask.bit_count() for mask in masks) <= self._tablebase_pieces:
+                result = self._tablebase.probe(masks, checker_color)
+                if result is not None:
+                    if result[0] == "win":
+                        return WIN_SCORE - ply - result[1]
+                    if result[0] == "loss":
+                        return -WIN_SCORE + ply + result[1]
+                    return 0
+        if depth <= 0 and not moves[0][1]:
+            return evaluate(masks, checker_color)
+        entry = self._table.probe(position_hash)
+        table_move = None
+        if entry is not None:
+            entry_depth = entry[1]
+            score, bound, table_move = entry[3]
+            if entry_depth >= depth:
+                score = score_from_table(score, ply)
+                if bound == 0 or (bound < 0 and score <= alpha) or (bound > 0 and score >= beta):
+                    return score
+        if len(moves) > 1:
+            self._order_moves(moves, table_move, ply)
+        opponent_color = "White" if checker_color == "Black" else "Black"
+        original_alpha = alpha
+        best_score = -WIN_SCORE - 1
+        best_move = None
+        for move in moves:
+            new_masks, new_hash = play_masks(masks, position_hash, move)
+            score = -self._search(new_masks, opponent_color, new_hash, depth - 1, -beta, -alpha, ply + 1)
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        if not move[1]:
+                            self._add_killer(move, ply)
+                            self._history[move[0][0]][move[0][-1]] += depth * depth
+                        break
+        if best_score <= original_alpha:
+            bound = -1 #upper bound, no move raised alpha
+        elif best_score >= beta:
+            bound = 1 #lower bound, the search was cut off
+        else:
+            bound = 0
+        self._table.store(position_hash, (score_to_table(best_score, ply), bound, best_move), depth)
+        return best_score
+
+    def _add_killer(self, move, ply):
+        """Remembers a quiet move that caused a cut off at the ply, keeping the two most recent ones."""
+        while len(self._killers) <= ply:
+            self._killers.append([])
+        killers = self._killers[ply]
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]
+
+def pack_position(game):
+    """
+    Packs the game's board and whose turn it is into 25 bytes: the board's six masks (see BitBoard.to_bytes) then
+    b"B" or b"W". This is how positions are sent to worker processes instead of pickling the game and its players.
+    """
+    if game.get_player_turn() == "Black":
+        turn = b"B"
+    else:
+        turn = b"W"
+    return BitBoard(game.get_board()).to_bytes() + turn
+
+def unpack_position(data):
+    """Returns a new bitboard game, without players, set up from bytes written by pack_position."""
+    game = Checkers(bitboard=True)
+    if data[24:25] == b"B":
+        game._set_board(BitBoard.from_bytes(data), "Black")
+    else:
+        game._set_board(BitBoard.from_bytes(data), "White")
+    return game
+
+#Each worker process keeps one engine, so its transposition table and history carry over between moves, along with
+#the tablebase directory and backend it was made with.
+_worker_engine = None
+_worker_settings = None
+
+def _search_in_worker(position, root_moves, max_depth, time_budget_ms, tablebase_directory=None, backend="python"):
+    """
+    Runs in a worker process of a ParallelEngine. Searches the root moves in the packed position and returns the
+    search results (see Engine.search_root_moves) and the number of nodes searched. The tablebase is opened from its
+    directory in the worker, as a Tablebase can't be sent between processes.
+    """
+    global _worker_engine, _worker_settings
+    deadline = time.perf_counter() + time_budget_ms / 1000
+    if _worker_engine is None or _worker_settings != (tablebase_directory, backend):
+        tablebase = None
+        if tablebase_directory is not None:
+            from CheckersTablebase import Tablebase #imported when needed, like the executor
+            tablebase = Tablebase(tablebase_directory)
+        _worker_engine = Engine(None, None, tablebase=tablebase, backend=backend)
+        _worker_settings = (tablebase_directory, backend)
+    _worker_engine._nodes = 0
+    results = _worker_engine.search_root_moves(unpack_position(position), list(root_moves), max_depth, deadline)
+    return results, _worker_engine._nodes
+
+class ParallelEngine(Engine):
+    """
+    An Engine that splits the root moves between worker processes of a ProcessPoolExecutor. Each worker searches its
+    share of the root moves with iterative deepening, and the best move is taken from the deepest depth every worker
+    finished. The workers keep running between moves, so call close (or use the engine in a with statement) when the
+    game is over. The tablebase and backend are used by the workers as well as by the engine itself. There are never
+    more workers than CPUs (os.cpu_count), as extra processes only take turns on the same CPUs, and with one worker
+    the engine searches in its own process like Engine, without starting any.
+    """
+
+    def __init__(self, game, player, workers=None, table_size=1 << 18, tablebase=None, book=None, book_random=None,
+                 backend="python"):
+        super().__init__(game, player, table_size, tablebase, book, book_random, backend)
+        cpus = os.cpu_count() or 1
+        if workers is None or workers > cpus:
+            workers = cpus
+        self._workers = workers
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_workers(self):
+        """Returns the number of worker processes the engine searches with."""
+        return self._workers
+
+    def close(self):
+        """Shuts down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def choose_internal_move(self, time_budget_ms=1000, max_depth=64):
+        """
+        Searches for the best move like Engine.choose_internal_move, but with the root moves searched in parallel by
+        the worker processes when there is more than one.
+        """
+        self._check_player()
+        start_time = time.perf_counter()
+        position = pack_position(self._game)
+        search_game = unpack_position(position)
+        root_moves = search_game.get_moves()
+        if self._workers <= 1 or len(root_moves) <= 1 or \
+                self._book is not None and search_game.get_position_hash() in self._book:
+            return super().choose_internal_move(time_budget_ms, max_depth)
+        if self._executor is None:
+            from concurrent.futures import ProcessPoolExecutor #imported when first needed, as it is slow to import
+            self._executor = ProcessPoolExecutor(self._workers)
+        shares = [root_moves[worker::self._workers] for worker in range(min(self._workers, len(root_moves)))]
+        tablebase_directory = self._tablebase.get_directory() if self._tablebase is not None else None
+        futures = [self._executor.submit(_search_in_worker, position, share, max_depth, time_budget_ms,
+                                         tablebase_directory, self._backend) for share in shares]
+        worker_results = []
+        self._nodes = 0
+        for future in futures:
+            results, nodes = future.result()
+            worker_results.append(results)
+            self._nodes += nodes
+        #A worker that found a forced win or loss stops early, and its last result stands for every deeper depth
+        open_depths = [len(results) for results in worker_results
+                       if results and abs(results[-1][1]) <= WIN_THRESHOLD]
+        if open_depths:
+            depth_reached = min(open_depths)
+        else:
+            depth_reached = max(len(results) for results in worker_results)
+        best_score = None
+        best_move = root_moves[0]
+        for results in worker_results:
+            if results and depth_reached:
+                depth, score, move = results[min(depth_reached, len(results)) - 1]
+                if best_score is None or score > best_score:
+                    best_score, best_move = score, move
+        if best_score is None:
+            best_score = 0
+            depth_reached = 0
+        self._search_info = {"depth": depth_reached, "nodes": self._nodes, "score": best_score, "book": False,
+                             "time_ms": (time.perf_counter() - start_time) * 1000}
+        return best_move
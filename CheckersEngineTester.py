@@ -0,0 +1,164 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Unit tests for the CheckersEngine program.
+
+import os
+import time
+import unittest
+from CheckersGame import Checkers, OutofTurn
+from CheckersEngine import Engine, ParallelEngine, evaluate, pack_position, unpack_position, score_to_table, \
+    score_from_table, WIN_SCORE
+from CheckersBenchmark import make_benchmark_game
+from CheckersGameTester import make_game, empty_rows
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+class TestEngine(unittest.TestCase):
+    """Contains unit tests for the Engine class."""
+
+    def test_1(self):
+        """Tests that the engine picks a legal opening move within its time budget and doesn't change the game."""
+        game = Checkers()
+        player1 = game.create_player("Ashley", "Black")
+        game.create_player("Tiffany", "White")
+        engine = Engine(game, player1)
+        move = engine.choose_move(time_budget_ms=200)
+        self.assertIn(move, game.legal_moves("Ashley"))
+        self.assertEqual(game._current_board, Checkers()._current_board)
+        self.assertLess(engine.get_search_info()["time_ms"], 400)
+        self.assertGreater(engine.get_search_info()["depth"], 0)
+
+    def test_2(self):
+        """Tests that the engine plays the capture sequence that ends in a triple king's double capture."""
+        rows = empty_rows()
+        rows[4][3] = "Black_Triple_King"
+        rows[3][2] = "White"
+        rows[2][1] = "White"
+        rows[5][4] = "White"
+        rows[0][7] = "White"
+        game = make_game(rows)
+        engine = Engine(game, game._players["Ashley"])
+        self.assertEqual(engine.choose_move(time_budget_ms=200), ((4, 3), (6, 5), (1, 0)))
+        self.assertEqual(engine.play_turn(time_budget_ms=200), 3)
+        self.assertEqual(game._players["Ashley"].get_captured_pieces_count(), 3)
+        self.assertEqual(game._player_turn, "White")
+
+    def test_3(self):
+        """Tests that the engine finds a win by leaving the opponent with no legal move."""
+        rows = empty_rows()
+        rows[7][0] = "Black"
+        rows[7][2] = "White_king"
+        rows[5][2] = "White"
+        game = make_game(rows)
+        game._player_turn = "White"
+        engine = Engine(game, game._players["Tiffany"])
+        self.assertEqual(engine.choose_move(time_budget_ms=500), ((7, 2), (6, 1)))
+        self.assertGreater(engine.get_search_info()["score"], 1000)
+
+    def test_4(self):
+        """Tests that the engine raises OutofTurn when it isn't its player's turn, and the evaluation is symmetric."""
+        game = Checkers()
+        game.create_player("Ashley", "Black")
+        player2 = game.create_player("Tiffany", "White")
+        self.assertRaises(OutofTurn, Engine(game, player2).choose_move, 100)
+        masks = game._board.get_masks()
+        self.assertEqual(evaluate(masks, "Black"), 0)
+        self.assertEqual(evaluate(masks, "White"), 0)
+
+    def test_5(self):
+        """Tests that a packed position unpacks to the same board and turn."""
+        game = Checkers()
+        game.create_player("Ashley", "Black")
+        game.create_player("Tiffany", "White")
+        game.play_game("Ashley", (5, 0), (4, 1))
+        position = pack_position(game)
+        self.assertEqual(len(position), 25)
+        unpacked_game = unpack_position(position)
+        self.assertEqual(unpacked_game._current_board, game._current_board)
+        self.assertEqual(unpacked_game._player_turn, "White")
+        self.assertEqual(unpacked_game.get_position_hash(), game.get_position_hash())
+
+    def test_6(self):
+        """Tests that the parallel engine finds the same winning move as the single process engine."""
+        rows = empty_rows()
+        rows[7][0] = "Black"
+        rows[7][2] = "White_king"
+        rows[5][2] = "White"
+        game = make_game(rows)
+        game._player_turn = "White"
+        with ParallelEngine(game, game._players["Tiffany"], workers=2) as engine:
+            self.assertEqual(engine.choose_move(time_budget_ms=2000, max_depth=4), ((7, 2), (6, 1)))
+            self.assertGreater(engine.get_search_info()["score"], 1000)
+            self.assertEqual(engine.play_turn(time_budget_ms=2000, max_depth=4), 0)
+        self.assertEqual(game.get_checker_details((6, 1)), "White_king")
+
+    def test_7(self):
+        """
+        Tests that mate scores are stored in the transposition table as distances from the position, so a table
+        filled by one search gives the right distance to a search from another ply.
+        """
+        self.assertEqual(score_to_table(WIN_SCORE - 7, 3), WIN_SCORE - 4)
+        self.assertEqual(score_from_table(WIN_SCORE - 4, 3), WIN_SCORE - 7)
+        self.assertEqual(score_to_table(-WIN_SCORE + 6, 2), -WIN_SCORE + 4)
+        self.assertEqual(score_from_table(-WIN_SCORE + 4, 2), -WIN_SCORE + 6)
+        self.assertEqual(score_to_table(250, 9), 250)
+        rows = empty_rows()
+        rows[2][3] = "White"
+        rows[3][0] = "White"
+        rows[3][6] = "White_king"
+        rows[4][3] = "Black"
+        rows[5][0] = "White"
+        rows[5][6] = "Black"
+        game = make_game(rows, bitboard=True)
+        game._player_turn = "White"
+        engine = Engine(None, None)
+        depth, score, move = engine.search_root_moves(game, game.get_moves(), 12, time.perf_counter() + 60)[-1]
+        self.assertEqual(score, WIN_SCORE - 7)
+        game.make_move(move)
+        depth, score, move = engine.search_root_moves(game, game.get_moves(), 12, time.perf_counter() + 60)[-1]
+        self.assertEqual(score, -WIN_SCORE + 6)
+
+    def test_8(self):
+        """Tests that an unknown backend, or the numba backend with a tablebase, is refused."""
+        game = Checkers()
+        player1 = game.create_player("Ashley", "Black")
+        self.assertRaises(ValueError, Engine, game, player1, backend="cython")
+        self.assertRaises(ValueError, Engine, game, player1, tablebase=object(), backend="numba")
+        self.assertRaises(ValueError, ParallelEngine, game, player1, backend="cython")
+
+    @unittest.skipIf(numba is None, "Numba is not installed")
+    def test_9(self):
+        """Tests that the numba backend searches the same nodes and finds the same move and score as Python."""
+        rows = empty_rows()
+        rows[4][3] = "Black_Triple_King"
+        rows[3][2] = "White"
+        rows[2][1] = "White"
+        rows[5][4] = "White"
+        rows[0][7] = "White"
+        for game, max_depth in ((make_benchmark_game(), 7), (make_game(rows), 6)):
+            player = game.get_player_by_color(game._player_turn)
+            results = []
+            for backend in ("python", "numba"):
+                engine = Engine(game, player, backend=backend)
+                move = engine.choose_move(time_budget_ms=120000, max_depth=max_depth)
+                info = engine.get_search_info()
+                results.append((move, info["depth"], info["nodes"], info["score"]))
+            self.assertEqual(results[0], results[1])
+
+    def test_10(self):
+        """
+        Tests that a parallel engine has no more workers than CPUs, and that with one worker it searches in its own
+        process, finding the same move as the single process engine.
+        """
+        game = make_benchmark_game()
+        player = game.get_player_by_color(game._player_turn)
+        with ParallelEngine(game, player, workers=(os.cpu_count() or 1) + 3) as engine:
+            self.assertEqual(engine.get_workers(), os.cpu_count() or 1)
+        with ParallelEngine(game, player, workers=1) as engine:
+            move = engine.choose_internal_move(time_budget_ms=120000, max_depth=4)
+            self.assertIsNone(engine._executor)
+        self.assertEqual(move, Engine(game, player).choose_internal_move(time_budget_ms=120000, max_depth=4))
@@ -0,0 +1,445 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: An optional compiled search backend for the Checkers engine, using Numba.
+
+import time
+import numba
+import numpy as np
+from CheckersGame import RAYS, PROMOTIONS, ZOBRIST_KEYS, ZOBRIST_BLACK_TO_MOVE, generate_moves
+from CheckersEngine import PIECE_VALUES, WIN_SCORE, WIN_THRESHOLD, BLACK_BACK_ROW, WHITE_BACK_ROW, BLACK_ADVANCED, \
+    WHITE_ADVANCED, SearchTimeout
+
+#This is the search of Engine._search compiled with Numba, move for move: the same move generator order, move
+#ordering, transposition table replacement, killer moves and history, so it visits the same nodes and finds the same
+#scores. Moves are kept in per-ply buffers as their path and captured squares, and a move is known by its index in
+#generate_moves order, which is what the transposition table stores. Sides are 0 for Black and 1 for White.
+
+#Size limits of the move buffers: plies searched from the root, moves in one position, and squares in a move's path
+#or in its captured squares
+MAX_PLY = 160
+MAX_MOVES = 256
+MAX_PATH = 16
+
+#RAY_SQUARES[direction, square, step] holds RAYS padded with -1, and RAY_LENGTHS[direction, square] their lengths
+RAY_SQUARES = np.full((4, 32, 7), -1, dtype=np.int64)
+RAY_LENGTHS = np.zeros((4, 32), dtype=np.int64)
+for _direction in range(4):
+    for _square in range(32):
+        _ray = RAYS[_direction][_square]
+        RAY_SQUARES[_direction, _square, :len(_ray)] = _ray
+        RAY_LENGTHS[_direction, _square] = len(_ray)
+PROMOTION_TABLE = np.array(PROMOTIONS, dtype=np.int64)
+ZOBRIST_TABLE = np.array(ZOBRIST_KEYS, dtype=np.uint64)
+BLACK_TO_MOVE = np.uint64(ZOBRIST_BLACK_TO_MOVE)
+PIECE_VALUE_TABLE = np.array(PIECE_VALUES, dtype=np.int64)
+
+#Columns of the transposition table's data array, and entries of the meta array
+TABLE_USED, TABLE_DEPTH, TABLE_GENERATION, TABLE_SCORE, TABLE_BOUND, TABLE_MOVE = range(6)
+META_NODES, META_GENERATION = range(2)
+#Columns of the capture sequence stack of _add_capture_sequences, and rows of its scratch array, which holds the path
+#and captured squares of the sequence so far
+LEVEL_CODE, LEVEL_OCCUPIED, LEVEL_OPPONENTS, LEVEL_JUMPS, LEVEL_NEXT, LEVEL_CAPTURED = range(6)
+SCRATCH_PATH, SCRATCH_CAPTURED = range(2)
+
+@numba.njit(cache=True)
+def _bit_count(mask):
+    """Returns the number of bits set in a 32-bit mask."""
+    mask = mask - ((mask >> 1) & 0x55555555)
+    mask = (mask & 0x33333333) + ((mask >> 2) & 0x33333333)
+    mask = (mask + (mask >> 4)) & 0x0F0F0F0F
+    return ((mask * 0x01010101) & 0xFFFFFFFF) >> 24
+
+@numba.njit(cache=True)
+def _evaluate(masks, ply, side):
+    """CheckersEngine.evaluate of masks[ply] for the side to move."""
+    score = 0
+    for code in range(6):
+        value = _bit_count(masks[ply, code]) * PIECE_VALUE_TABLE[code]
+        if code < 3:
+            score += value
+        else:
+            score -= value
+    score += 6 * (_bit_count(masks[ply, 0] & BLACK_BACK_ROW) - _bit_count(masks[ply, 3] & WHITE_BACK_ROW))
+    score += 8 * (_bit_count(masks[ply, 0] & BLACK_ADVANCED) - _bit_count(masks[ply, 3] & WHITE_ADVANCED))
+    if side == 0:
+        return score
+    return -score
+
+@numba.njit(cache=True)
+def _find_jumps(code, square, occupied, opponents, jumps, level):
+    """
+    CheckersGame._find_jumps: fills the rows of jumps[level] with the landing square, the jumped square and the
+    second jumped square (-1 for a jump over one piece) of each jump of the piece, in the same order, and returns how
+    many there are.
+    """
+    count = 0
+    if code == 0 or code == 3:
+        first_direction = 0 if code == 0 else 2
+        for direction in range(first_direction, first_direction + 2):
+            if RAY_LENGTHS[direction, square] > 1:
+                jumped = RAY_SQUARES[direction, square, 0]
+                landing = RAY_SQUARES[direction, square, 1]
+                if opponents >> jumped & 1 and not occupied >> landing & 1:
+                    jumps[level, count, 0] = landing
+                    jumps[level, count, 1] = jumped
+                    jumps[level, count, 2] = -1
+                    count += 1
+        return count
+    for direction in range(4):
+        length = RAY_LENGTHS[direction, square]
+        index = 0
+        while index < length and not occupied >> RAY_SQUARES[direction, square, index] & 1:
+            index += 1
+        if index + 1 >= length or not opponents >> RAY_SQUARES[direction, square, index] & 1:
+            continue
+        if not occupied >> RAY_SQUARES[direction, square, index + 1] & 1:
+            jumps[level, count, 0] = RAY_SQUARES[direction, square, index + 1]
+            jumps[level, count, 1] = RAY_SQUARES[direction, square, index]
+            jumps[level, count, 2] = -1
+            count += 1
+        elif (code == 2 or code == 5) and index + 2 < length and \
+                opponents >> RAY_SQUARES[direction, square, index + 1] & 1 and \
+                not occupied >> RAY_SQUARES[direction, square, index + 2] & 1:
+            jumps[level, count, 0] = RAY_SQUARES[direction, square, index + 2]
+            jumps[level, count, 1] = RAY_SQUARES[direction, square, index]
+            jumps[level, count, 2] = RAY_SQUARES[direction, square, index + 1]
+            count += 1
+    return count
+
+@numba.njit(cache=True)
+def _can_jump(code, square, occupied, opponents):
+    """Returns whether _find_jumps would find any jump, without keeping them."""
+    if code == 0 or code == 3:
+        first_direction = 0 if code == 0 else 2
+        for direction in range(first_direction, first_direction + 2):
+            if RAY_LENGTHS[direction, square] > 1 and opponents >> RAY_SQUARES[direction, square, 0] & 1 and \
+                    not occupied >> RAY_SQUARES[direction, square, 1] & 1:
+                return True
+        return False
+    for direction in range(4):
+        length = RAY_LENGTHS[direction, square]
+        index = 0
+        while index < length and not occupied >> RAY_SQUARES[direction, square, index] & 1:
+            index += 1
+        if index + 1 >= length or not opponents >> RAY_SQUARES[direction, square, index] & 1:
+            continue
+        if not occupied >> RAY_SQUARES[direction, square, index + 1] & 1:
+            return True
+        if (code == 2 or code == 5) and index + 2 < length and \
+                opponents >> RAY_SQUARES[direction, square, index + 1] & 1 and \
+                not occupied >> RAY_SQUARES[direction, square, index + 2] & 1:
+            return True
+    return False
+
+@numba.njit(cache=True)
+def _add_capture_sequences(code, square, occupied, opponents, ply, count, buffers):
+    """
+    CheckersGame._add_capture_sequences: adds the capture sequences of the piece on the square to the moves of ply
+    from index count, and returns the new number of moves. The recursion is kept on a stack, with jumps[level]
+    holding the jumps found after level jumps and levels[level] the state at that point, so the cached code doesn't
+    call itself.
+    """
+    paths, path_lengths, captures, capture_lengths, scratch, jumps, levels = buffers
+    scratch[SCRATCH_PATH, 0] = square
+    occupied &= ~(1 << square)
+    levels[0, LEVEL_CODE] = code
+    levels[0, LEVEL_OCCUPIED] = occupied
+    levels[0, LEVEL_OPPONENTS] = opponents
+    levels[0, LEVEL_JUMPS] = _find_jumps(code, square, occupied, opponents, jumps, 0)
+    levels[0, LEVEL_NEXT] = 0
+    levels[0, LEVEL_CAPTURED] = 0
+    level = 0
+    while level >= 0:
+        jump = levels[level, LEVEL_NEXT]
+        if jump == levels[level, LEVEL_JUMPS]:
+            level -= 1
+            continue
+        levels[level, LEVEL_NEXT] = jump + 1
+        code = levels[level, LEVEL_CODE]
+        occupied = levels[level, LEVEL_OCCUPIED]
+        opponents = levels[level, LEVEL_OPPONENTS]
+        landing = jumps[level, jump, 0]
+        second_jumped = jumps[level, jump, 2]
+        new_opponents = opponents & ~(1 << jumps[level, jump, 1])
+        captured_length = levels[level, LEVEL_CAPTURED]
+        scratch[SCRATCH_CAPTURED, captured_length] = jumps[level, jump, 1]
+        captured_length += 1
+        if second_jumped >= 0:
+            new_opponents &= ~(1 << second_jumped)
+            scratch[SCRATCH_CAPTURED, captured_length] = second_jumped
+            captured_length += 1
+        new_occupied = (occupied & ~(opponents ^ new_opponents)) | 1 << landing
+        scratch[SCRATCH_PATH, level + 1] = landing
+        if second_jumped < 0 and _can_jump(code, landing, new_occupied, new_opponents):
+            level += 1
+            if level + 1 >= MAX_PATH:
+                raise ValueError("capture sequence too long for the search's move buffers")
+            code = PROMOTION_TABLE[code, landing]
+            new_occupied &= ~(1 << landing)
+            levels[level, LEVEL_CODE] = code
+            levels[level, LEVEL_OCCUPIED] = new_occupied
+            levels[level, LEVEL_OPPONENTS] = new_opponents
+            levels[level, LEVEL_JUMPS] = _find_jumps(code, landing, new_occupied, new_opponents, jumps, level)
+            levels[level, LEVEL_NEXT] = 0
+            levels[level, LEVEL_CAPTURED] = captured_length
+        else:
+            if count >= MAX_MOVES:
+                raise ValueError("too many moves for the search's move buffers")
+            for index in range(level + 2):
+                paths[ply, count, index] = scratch[SCRATCH_PATH, index]
+            path_lengths[ply, count] = level + 2
+            for index in range(captured_length):
+                captures[ply, count, index] = scratch[SCRATCH_CAPTURED, index]
+            capture_lengths[ply, count] = captured_length
+            count += 1
+    return count
+
+@numba.njit(cache=True)
+def _generate_moves(masks, ply, side, first_quiet, buffers):
+    """
+    CheckersGame.generate_moves of masks[ply]: fills the moves of ply in the move buffers with the legal moves in
+    order and returns how many. With first_quiet set, a position without captures stops at its first move, which is
+    all a leaf of the search needs to know.
+    """
+    paths, path_lengths, captures, capture_lengths, scratch, jumps, levels = buffers
+    if side == 0:
+        opponents = masks[ply, 3] | masks[ply, 4] | masks[ply, 5]
+    else:
+        opponents = masks[ply, 0] | masks[ply, 1] | masks[ply, 2]
+    occupied = masks[ply, 0] | masks[ply, 1] | masks[ply, 2] | masks[ply, 3] | masks[ply, 4] | masks[ply, 5]
+    count = 0
+    for code in range(3 * side, 3 * side + 3):
+        mask = masks[ply, code]
+        for square in range(32):
+            if mask >> square & 1 and _can_jump(code, square, occupied & ~(1 << square), opponents):
+                count = _add_capture_sequences(code, square, occupied, opponents, ply, count, buffers)
+    if count:
+        return count
+    for code in range(3 * side, 3 * side + 3):
+        mask = masks[ply, code]
+        for square in range(32):
+            if not mask >> square & 1:
+                continue
+            if code == 0 or code == 3:
+                first_direction = 0 if code == 0 else 2
+                last_direction = first_direction + 2
+                steps = 1
+            else:
+                first_direction = 0
+                last_direction = 4
+                steps = 7
+            for direction in range(first_direction, last_direction):
+                for step in range(min(steps, RAY_LENGTHS[direction, square])):
+                    destination = RAY_SQUARES[direction, square, step]
+                    if occupied >> destination & 1:
+                        break
+                    if count >= MAX_MOVES:
+                        raise ValueError("too many moves for the search's move buffers")
+                    paths[ply, count, 0] = square
+                    paths[ply, count, 1] = destination
+                    path_lengths[ply, count] = 2
+                    capture_lengths[ply, count] = 0
+                    count += 1
+                    if first_quiet:
+                        return count
+    return count
+
+@numba.njit(cache=True)
+def _play_move(masks, ply, position_hash, move, buffers):
+    """
+    CheckersEngine.play_masks of the move of ply with index move: writes the masks after the move from masks[ply] into
+    masks[ply + 1] and returns the new hash.
+    """
+    paths, path_lengths, captures, capture_lengths, scratch, jumps, levels = buffers
+    for code in range(6):
+        masks[ply + 1, code] = masks[ply, code]
+    starting_square = paths[ply, move, 0]
+    code = 0
+    while not masks[ply, code] >> starting_square & 1:
+        code += 1
+    masks[ply + 1, code] ^= 1 << starting_square
+    position_hash ^= ZOBRIST_TABLE[code, starting_square] ^ BLACK_TO_MOVE
+    final_code = code
+    path_length = path_lengths[ply, move]
+    for index in range(1, path_length):
+        final_code = PROMOTION_TABLE[final_code, paths[ply, move, index]]
+    for index in range(capture_lengths[ply, move]):
+        square = captures[ply, move, index]
+        opponent_code = 3 if code < 3 else 0
+        while not masks[ply, opponent_code] >> square & 1:
+            opponent_code += 1
+        masks[ply + 1, opponent_code] ^= 1 << square
+        position_hash ^= ZOBRIST_TABLE[opponent_code, square]
+    destination_square = paths[ply, move, path_length - 1]
+    masks[ply + 1, final_code] |= 1 << destination_square
+    return position_hash ^ ZOBRIST_TABLE[final_code, destination_square]
+
+@numba.njit(cache=True)
+def _store(table_keys, table_data, bucket_mask, generation, position_hash, score, bound, move, depth):
+    """TranspositionTable.store, for a table kept as an array of hashes and an array of entries."""
+    index = np.int64(position_hash & bucket_mask) << 1
+    if not table_data[index, TABLE_USED] or table_keys[index] == position_hash or \
+            depth >= table_data[index, TABLE_DEPTH] or table_data[index, TABLE_GENERATION] != generation:
+        if table_data[index, TABLE_USED] and table_keys[index] != position_hash:
+            table_keys[index + 1] = table_keys[index]
+            table_data[index + 1, :] = table_data[index, :]
+        elif table_data[index + 1, TABLE_USED] and table_keys[index + 1] == position_hash:
+            table_data[index + 1, TABLE_USED] = 0
+    else:
+        index += 1
+    table_keys[index] = position_hash
+    table_data[index, TABLE_USED] = 1
+    table_data[index, TABLE_DEPTH] = depth
+    table_data[index, TABLE_GENERATION] = generation
+    table_data[index, TABLE_SCORE] = score
+    table_data[index, TABLE_BOUND] = bound
+    table_data[index, TABLE_MOVE] = move
+
+#Numba can crash loading a cached recursive function, so this one is compiled anew in each process
+@numba.njit
+def _search(side, position_hash, depth, alpha, beta, ply, deadline, meta, table_keys, table_data, bucket_mask,
+            killers, history, masks, order, keys, buffers):
+    """
+    Engine._search of the position in masks[ply]. The nodes searched are counted in meta, and SearchTimeout is raised
+    when the clock passes the deadline.
+    """
+    paths, path_lengths, captures, capture_lengths, scratch, jumps, levels = buffers
+    meta[META_NODES] += 1
+    if meta[META_NODES] & 127 == 0:
+        with numba.objmode(now="float64"):
+            now = time.perf_counter()
+        if now > deadline:
+            raise SearchTimeout
+    if ply + 1 >= MAX_PLY:
+        raise ValueError("search too deep for the search's move buffers")
+    move_count = _generate_moves(masks, ply, side, depth <= 0, buffers)
+    if move_count == 0:
+        return -WIN_SCORE + ply
+    if depth <= 0 and capture_lengths[ply, 0] == 0:
+        return _evaluate(masks, ply, side)
+    index = np.int64(position_hash & bucket_mask) << 1
+    if not (table_data[index, TABLE_USED] and table_keys[index] == position_hash):
+        index += 1
+        if not (table_data[index, TABLE_USED] and table_keys[index] == position_hash):
+            index = -1
+    table_move = -1
+    if index >= 0:
+        table_move = table_data[index, TABLE_MOVE]
+        if table_data[index, TABLE_DEPTH] >= depth:
+            score = table_data[index, TABLE_SCORE]
+            if score > WIN_THRESHOLD:
+                score -= ply
+            elif score < -WIN_THRESHOLD:
+                score += ply
+            bound = table_data[index, TABLE_BOUND]
+            if bound == 0 or (bound < 0 and score <= alpha) or (bound > 0 and score >= beta):
+                return score
+    for move in range(move_count):
+        if move == table_move:
+            key = -10000000
+        elif capture_lengths[ply, move]:
+            key = -1000000 - capture_lengths[ply, move]
+        else:
+            quiet_move = paths[ply, move, 0] * 32 + paths[ply, move, 1]
+            if killers[ply, 0] == quiet_move or killers[ply, 1] == quiet_move:
+                key = -900000
+            else:
+                key = -history[paths[ply, move, 0], paths[ply, move, path_lengths[ply, move] - 1]]
+        #insertion sort, which keeps moves with the same key in order like list.sort
+        position = move
+        while position > 0 and keys[ply, position - 1] > key:
+            keys[ply, position] = keys[ply, position - 1]
+            order[ply, position] = order[ply, position - 1]
+            position -= 1
+        keys[ply, position] = key
+        order[ply, position] = move
+    original_alpha = alpha
+    best_score = -WIN_SCORE - 1
+    best_move = -1
+    for position in range(move_count):
+        move = order[ply, position]
+        new_hash = _play_move(masks, ply, position_hash, move, buffers)
+        score = -_search(1 - side, new_hash, depth - 1, -beta, -alpha, ply + 1, deadline, meta, table_keys,
+                         table_data, bucket_mask, killers, history, masks, order, keys, buffers)
+        if score > best_score:
+            best_score = score
+            best_move = move
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    if not capture_lengths[ply, move]:
+                        quiet_move = paths[ply, move, 0] * 32 + paths[ply, move, 1]
+                        if killers[ply, 0] != quiet_move and killers[ply, 1] != quiet_move:
+                            killers[ply, 1] = killers[ply, 0]
+                            killers[ply, 0] = quiet_move
+                        history[paths[ply, move, 0], paths[ply, move, 1]] += depth * depth
+                    break
+    if best_score <= original_alpha:
+        bound = -1
+    elif best_score >= beta:
+        bound = 1
+    else:
+        bound = 0
+    stored_score = best_score
+    if stored_score > WIN_THRESHOLD:
+        stored_score += ply
+    elif stored_score < -WIN_THRESHOLD:
+        stored_score -= ply
+    _store(table_keys, table_data, bucket_mask, meta[META_GENERATION], position_hash, stored_score, bound, best_move,
+           depth)
+    return best_score
+
+class FastSearch:
+    """
+    The state of the compiled search for one Engine: its transposition table, killer moves, history and move
+    buffers. Engine uses it in place of its own _search when made with backend="numba". The first search in a process
+    compiles the functions above, which takes a few seconds, or about ten the first time, before Numba has cached
+    them in __pycache__.
+    """
+
+    def __init__(self, table_size=1 << 18):
+        buckets = 1
+        while buckets * 2 < table_size:
+            buckets *= 2
+        self._table_keys = np.zeros(buckets * 2, dtype=np.uint64)
+        self._table_data = np.zeros((buckets * 2, 6), dtype=np.int64)
+        self._bucket_mask = np.uint64(buckets - 1)
+        self._meta = np.zeros(2, dtype=np.int64)
+        self.nodes = 0 #nodes searched, counted on from the nodes passed to search
+        self._killers = np.full((MAX_PLY, 2), -1, dtype=np.int64)
+        self._history = np.zeros((32, 32), dtype=np.int64)
+        self._masks = np.zeros((MAX_PLY, 6), dtype=np.int64)
+        self._order = np.zeros((MAX_PLY, MAX_MOVES), dtype=np.int64)
+        self._keys = np.zeros((MAX_PLY, MAX_MOVES), dtype=np.int64)
+        #the moves of each ply (paths, path lengths, captured squares and their counts) and the capture sequence
+        #work space, passed together to the move generator
+        self._buffers = (np.zeros((MAX_PLY, MAX_MOVES, MAX_PATH), dtype=np.int64),
+                         np.zeros((MAX_PLY, MAX_MOVES), dtype=np.int64),
+                         np.zeros((MAX_PLY, MAX_MOVES, MAX_PATH), dtype=np.int64),
+                         np.zeros((MAX_PLY, MAX_MOVES), dtype=np.int64), np.zeros((2, MAX_PATH), dtype=np.int64),
+                         np.zeros((MAX_PATH, 4, 3), dtype=np.int64), np.zeros((MAX_PATH, 6), dtype=np.int64))
+
+    def new_search(self):
+        """TranspositionTable.new_search for the compiled search's table."""
+        self._meta[META_GENERATION] += 1
+
+    def search(self, masks, checker_color, position_hash, depth, alpha, beta, ply, deadline, nodes):
+        """
+        Engine._search of the position (the six board masks, the color to move and the position hash), counting on
+        from nodes searched so far. Returns the score or raises SearchTimeout, with the nodes searched in the nodes
+        attribute either way.
+        """
+        self._meta[META_NODES] = nodes
+        self._masks[ply, :] = masks
+        try:
+            return int(_search(0 if checker_color == "Black" else 1, np.uint64(position_hash), depth, alpha, beta,
+                               ply, deadline, self._meta, self._table_keys, self._table_data, self._bucket_mask,
+                               self._killers, self._history, self._masks, self._order, self._keys, self._buffers))
+        finally:
+            self.nodes = int(self._meta[META_NODES])
+
+    def store(self, masks, checker_color, position_hash, score, bound, move, depth):
+        """Stores the score of a position searched at the root and its best move (a move from generate_moves)."""
+        _store(self._table_keys, self._table_data, self._bucket_mask, self._meta[META_GENERATION],
+               np.uint64(position_hash), score, bound, generate_moves(masks, checker_color).index(move), depth)
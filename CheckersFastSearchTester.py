@@ -0,0 +1,51 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Unit tests for the CheckersFastSearch program.
+
+import random
+import unittest
+from CheckersGame import Checkers
+from CheckersEngine import Engine
+
+try:
+    from CheckersFastSearch import FastSearch
+except ImportError:
+    FastSearch = None
+
+def random_games(count, seed):
+    """Returns games between Ashley (Black) and Tiffany (White) after random moves, that aren't over."""
+    random_moves = random.Random(seed)
+    games = []
+    while len(games) < count:
+        game = Checkers(bitboard=True)
+        game.create_player("Ashley", "Black")
+        game.create_player("Tiffany", "White")
+        for _ in range(random_moves.randrange(50)):
+            moves = game.get_moves()
+            if not moves:
+                break
+            game.make_move(random_moves.choice(moves))
+        if not game.is_game_over():
+            games.append(game)
+    return games
+
+@unittest.skipIf(FastSearch is None, "Numba is not installed")
+class TestFastSearch(unittest.TestCase):
+    """Contains unit tests for the FastSearch class, which only run where Numba is installed."""
+
+    def test_1(self):
+        """Tests that a new search has counted no nodes."""
+        self.assertEqual(FastSearch(1024).nodes, 0)
+
+    def test_2(self):
+        """Tests that the compiled search finds the same best move and score as the Python search at a fixed depth."""
+        for game in random_games(12, 5):
+            player = game.get_player_by_color(game._player_turn)
+            results = []
+            for backend in ("python", "numba"):
+                engine = Engine(game, player, backend=backend)
+                move = engine.choose_move(time_budget_ms=120000, max_depth=5)
+                info = engine.get_search_info()
+                results.append((move, info["depth"], info["score"]))
+            self.assertEqual(results[0], results[1])
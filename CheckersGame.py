@@ -3,6 +3,10 @@
 # Date: 03/15/2023
 # Description: Allows two players to play a game of Checkers.
 
+import random
+import struct
+from time import perf_counter
+
 class InvalidSquare(Exception):
     """Exception raised if a square location does not exist on the game board."""
     pass
@@ -15,6 +19,429 @@ class InvalidPlayer(Exception):
     """Exception raised if a player not listed as one of the players of the game tries to make a game move."""
     pass
 
+#The board at the start of a game, one tuple per row
+STARTING_BOARD = (
+    (None, "White", None, "White", None, "White", None, "White"),
+    ("White", None, "White", None, "White", None, "White", None),
+    (None, "White", None, "White", None, "White", None, "White"),
+    (None, None, None, None, None, None, None, None), (None, None, None, None, None, None, None, None),
+    ("Black", None, "Black", None, "Black", None, "Black", None),
+    (None, "Black", None, "Black", None, "Black", None, "Black"),
+    ("Black", None, "Black", None, "Black", None, "Black", None))
+
+#Pieces can only stand on the 32 dark squares. These are numbered 0-31 row by row, so square 0 is (0, 1) and square
+#31 is (7, 6). SQUARE_LOCATIONS maps a square number to its (row, column) location and SQUARE_GRID maps a row and
+#column back to the square number (None for the light squares).
+SQUARE_LOCATIONS = tuple((row, column) for row in range(8) for column in range(8) if (row + column) % 2 == 1)
+SQUARE_GRID = tuple(tuple(SQUARE_LOCATIONS.index((row, column)) if (row + column) % 2 == 1 else None
+                          for column in range(8)) for row in range(8))
+
+#Piece names in the order of the BitBoard masks. Codes 0-2 are Black pieces and codes 3-5 are White pieces.
+PIECE_TYPES = ("Black", "Black_king", "Black_Triple_King", "White", "White_king", "White_Triple_King")
+PIECE_CODES = {piece: code for code, piece in enumerate(PIECE_TYPES)}
+COLOR_CODES = {"Black": (0, 1, 2), "White": (3, 4, 5)}
+COLOR_PIECE_CODES = {"Black": {"Black": 0, "Black_king": 1, "Black_Triple_King": 2},
+                     "White": {"White": 3, "White_king": 4, "White_Triple_King": 5}}
+
+#Diagonal directions as (row direction, column direction): up & left, up & right, down & left, down & right.
+#Black men move up the board and White men move down it.
+DIAGONAL_DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+FORWARD_DIRECTIONS = ((0, 1), (), (), (2, 3), (), ())
+
+def _build_rays():
+    """Returns the ray table, RAYS[direction][square] is the tuple of squares along that diagonal, nearest first."""
+    rays = []
+    for row_direction, column_direction in DIAGONAL_DIRECTIONS:
+        direction_rays = []
+        for row, column in SQUARE_LOCATIONS:
+            ray = []
+            row, column = row + row_direction, column + column_direction
+            while 0 <= row <= 7 and 0 <= column <= 7:
+                ray.append(SQUARE_GRID[row][column])
+                row, column = row + row_direction, column + column_direction
+            direction_rays.append(tuple(ray))
+        rays.append(tuple(direction_rays))
+    return tuple(rays)
+
+def _build_promotions():
+    """
+    Returns the promotion table, PROMOTIONS[code][square] is the piece code after a piece lands on the square. Men
+    become kings on the opponent's back row and kings become triple kings back on their own side.
+    """
+    promotions = []
+    for code in range(6):
+        promoted = []
+        for row, column in SQUARE_LOCATIONS:
+            if (code == 0 and row == 0) or (code == 3 and row == 7):
+                promoted.append(code + 1)
+            elif (code == 1 and row == 7) or (code == 4 and row == 0):
+                promoted.append(code + 1)
+            else:
+                promoted.append(code)
+        promotions.append(tuple(promoted))
+    return tuple(promotions)
+
+#Move tables, built once when the module is imported. JUMPS[direction][square] is the (jumped square, landing square)
+#pair for a one square jump, or None if the jump would leave the board.
+RAYS = _build_rays()
+JUMPS = tuple(tuple((ray[0], ray[1]) if len(ray) > 1 else None for ray in direction_rays) for direction_rays in RAYS)
+PROMOTIONS = _build_promotions()
+
+def _build_man_jump_shifts():
+    """
+    Returns the table used to test every man of one color for a jump at once. MAN_JUMP_SHIFTS[code] (for the two man
+    codes) is a tuple of (from mask, over shift, landing shift) groups: shifting the men on the from squares by the
+    over shift lands on the pieces they would jump, and shifting those by the landing shift lands on the squares
+    behind them. Black men jump towards lower squares, so their shifts go right, and White men's go left.
+    """
+    shifts = [(), (), (), (), (), ()]
+    for code in (0, 3):
+        groups = {}
+        for direction in FORWARD_DIRECTIONS[code]:
+            for square, jump in enumerate(JUMPS[direction]):
+                if jump is not None:
+                    key = (abs(jump[0] - square), abs(jump[1] - jump[0]))
+                    groups[key] = groups.get(key, 0) | 1 << square
+        shifts[code] = tuple((mask, over_shift, landing_shift) for (over_shift, landing_shift), mask in groups.items())
+    return tuple(shifts)
+
+MAN_JUMP_SHIFTS = _build_man_jump_shifts()
+
+#RAY_MOVES[direction][square] is the tuple of moves without a capture along RAYS[direction][square], as the
+#(path, captured) pairs returned by generate_moves, nearest first, so the move generator doesn't build them each time.
+RAY_MOVES = tuple(tuple(tuple(((square, destination), ()) for destination in ray) for square, ray in
+                        enumerate(direction_rays)) for direction_rays in RAYS)
+
+def _build_between():
+    """
+    Returns the table of squares between two squares, BETWEEN[start][end] is the tuple of squares passed over going
+    diagonally from start to end, or None if the two squares aren't on the same diagonal.
+    """
+    between = [[None] * 32 for _ in range(32)]
+    for direction_rays in RAYS:
+        for square in range(32):
+            ray = direction_rays[square]
+            for index, destination in enumerate(ray):
+                between[square][destination] = ray[:index]
+    return tuple(tuple(row) for row in between)
+
+BETWEEN = _build_between()
+
+def _hop_captures(code, between, opponents):
+    """
+    Returns the squares of the opponent pieces captured by a hop played with play_game, given the code of the piece
+    that moves, the squares it passes over (from BETWEEN) and the mask of the opponent's pieces. A man captures the
+    opponent piece it jumps over. A king captures the first opponent piece it passes over, and a triple king also
+    captures the piece right behind that one if it is an opponent piece too.
+    """
+    if not between:
+        return ()
+    if code == 0 or code == 3:
+        if len(between) == 1 and opponents >> between[0] & 1:
+            return between
+        return ()
+    for index, square in enumerate(between):
+        if opponents >> square & 1:
+            if (code == 2 or code == 5) and index + 1 < len(between) and opponents >> between[index + 1] & 1:
+                return between[index:index + 2]
+            return (square,)
+    return ()
+
+#Zobrist keys, one random 64-bit number per piece type and dark square plus one for Black to move. A position's hash
+#is the XOR of the keys of every piece on the board, so moving a piece only changes it by a couple of XORs. The keys
+#come from a fixed seed so that hashes stay the same between runs and processes, and saved position databases, opening
+#books and tablebases keep working: don't change the seed or the order the keys are drawn in.
+_zobrist_random = random.Random(20230315)
+ZOBRIST_KEYS = tuple(tuple(_zobrist_random.getrandbits(64) for square in range(32)) for code in range(6))
+ZOBRIST_BLACK_TO_MOVE = _zobrist_random.getrandbits(64)
+
+def zobrist_hash(masks, checker_color):
+    """
+    Computes the Zobrist hash of the position from scratch, given the six board masks and the color to move. Games
+    keep their hash up to date as pieces move, so this is only needed for boards that aren't part of a game.
+    """
+    position_hash = 0
+    for code, mask in enumerate(masks):
+        keys = ZOBRIST_KEYS[code]
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            position_hash ^= keys[bit.bit_length() - 1]
+    if checker_color == "Black":
+        position_hash ^= ZOBRIST_BLACK_TO_MOVE
+    return position_hash
+
+def _masks_from_rows(rows):
+    """Returns the six masks (see BitBoard) of the pieces on the dark squares of a board of 8 rows."""
+    masks = [0, 0, 0, 0, 0, 0]
+    for square, (row, column) in enumerate(SQUARE_LOCATIONS):
+        piece = rows[row][column]
+        if piece is not None:
+            masks[PIECE_CODES[piece]] |= 1 << square
+    return masks
+
+#The masks and hash of STARTING_BOARD, worked out once so new boards and games don't scan the starting rows.
+#STARTING_POSITION_HASH is the hash of a new game's position, with Black to move.
+STARTING_MASKS = tuple(_masks_from_rows(STARTING_BOARD))
+STARTING_HASH = zobrist_hash(STARTING_MASKS, None)
+STARTING_POSITION_HASH = STARTING_HASH ^ ZOBRIST_BLACK_TO_MOVE
+
+def _find_jumps(code, square, occupied, opponents):
+    """
+    Returns the jumps the piece with the code can make from the square as a list of (landing square, captured
+    squares) pairs. Men jump a neighbouring opponent piece going forward. Kings and triple kings move along any
+    diagonal and jump the first piece they reach if it is an opponent piece with an empty square behind it. A triple
+    king can instead jump two opponent pieces in a row if the square behind the second one is empty.
+    """
+    jumps = []
+    if code == 0 or code == 3:
+        for direction in FORWARD_DIRECTIONS[code]:
+            jump = JUMPS[direction][square]
+            if jump is not None and opponents >> jump[0] & 1 and not occupied >> jump[1] & 1:
+                jumps.append((jump[1], (jump[0],)))
+        return jumps
+    for direction_rays in RAYS:
+        ray = direction_rays[square]
+        length = len(ray)
+        index = 0
+        while index < length and not occupied >> ray[index] & 1:
+            index += 1
+        if index + 1 >= length or not opponents >> ray[index] & 1:
+            continue
+        if not occupied >> ray[index + 1] & 1:
+            jumps.append((ray[index + 1], (ray[index],)))
+        elif (code == 2 or code == 5) and index + 2 < length and opponents >> ray[index + 1] & 1 and \
+                not occupied >> ray[index + 2] & 1:
+            jumps.append((ray[index + 2], (ray[index], ray[index + 1])))
+    return jumps
+
+def _add_capture_sequences(code, square, occupied, opponents, path, captured, moves):
+    """
+    Adds every capture sequence that continues from the square to moves. As in play_game, a piece keeps jumping only
+    after a jump that captured exactly one piece, and only if it could capture again before any promotion from that
+    jump. A jump that captures two pieces always ends the turn.
+    """
+    occupied &= ~(1 << square)
+    for landing_square, jumped in _find_jumps(code, square, occupied, opponents):
+        new_opponents = opponents
+        for jumped_square in jumped:
+            new_opponents &= ~(1 << jumped_square)
+        new_occupied = (occupied & ~(opponents ^ new_opponents)) | 1 << landing_square
+        new_path = path + (landing_square,)
+        new_captured = captured + jumped
+        if len(jumped) == 1 and _find_jumps(code, landing_square, new_occupied, new_opponents):
+            _add_capture_sequences(PROMOTIONS[code][landing_square], landing_square, new_occupied, new_opponents,
+                                   new_path, new_captured, moves)
+        else:
+            moves.append((new_path, new_captured))
+
+def promote_along_path(code, path):
+    """
+    Takes the code of a piece and the path of its move, and returns the piece's code at the end of the move together
+    with the number of kings and triple kings it became on the way.
+    """
+    kings_added = 0
+    triple_kings_added = 0
+    for square in path[1:]:
+        promoted_code = PROMOTIONS[code][square]
+        if promoted_code != code:
+            if promoted_code == 1 or promoted_code == 4:
+                kings_added += 1
+            else:
+                triple_kings_added += 1
+            code = promoted_code
+    return code, kings_added, triple_kings_added
+
+def apply_move(masks, move):
+    """
+    Plays a move from generate_moves directly on a list (or array) of six board masks, without a game. Returns the
+    number of pieces captured and the number of kings and triple kings made, as a tuple.
+    """
+    path, captured = move
+    starting_bit = 1 << path[0]
+    code = 0
+    while not masks[code] & starting_bit:
+        code += 1
+    masks[code] ^= starting_bit
+    final_code, kings_added, triple_kings_added = promote_along_path(code, path)
+    if captured:
+        captured_bits = 0
+        for square in captured:
+            captured_bits |= 1 << square
+        for opponent_code in ((3, 4, 5) if code < 3 else (0, 1, 2)):
+            masks[opponent_code] &= ~captured_bits
+    masks[final_code] |= 1 << path[-1]
+    return len(captured), kings_added, triple_kings_added
+
+def generate_moves(masks, checker_color):
+    """
+    Takes the six board masks (see BitBoard) and a checker color, and returns every legal move for that color as a
+    list of (path, captured) pairs. The path is a tuple of square numbers starting with the square of the piece that
+    moves, followed by every square it lands on. Captured is a tuple of the squares of the captured pieces. Captures
+    are forced, so if any capture is possible only capture sequences are returned.
+    """
+    if checker_color == "Black":
+        own_codes = (0, 1, 2)
+        opponents = masks[3] | masks[4] | masks[5]
+    else:
+        own_codes = (3, 4, 5)
+        opponents = masks[0] | masks[1] | masks[2]
+    occupied = masks[0] | masks[1] | masks[2] | masks[3] | masks[4] | masks[5]
+    moves = []
+    for code in own_codes:
+        mask = masks[code]
+        if code == 0 or code == 3:
+            #Checks every man for a jump at once with MAN_JUMP_SHIFTS, then only follows a man into
+            #_add_capture_sequences if it has a jump, which most of them don't
+            empty = ~occupied
+            can_jump = 0
+            if code == 0:
+                for from_mask, over_shift, landing_shift in MAN_JUMP_SHIFTS[0]:
+                    can_jump |= ((mask & from_mask) >> over_shift & opponents) >> landing_shift & empty
+            else:
+                for from_mask, over_shift, landing_shift in MAN_JUMP_SHIFTS[3]:
+                    can_jump |= ((mask & from_mask) << over_shift & opponents) << landing_shift & empty
+            if not can_jump:
+                continue
+            directions = FORWARD_DIRECTIONS[code]
+            while mask:
+                bit = mask & -mask
+                mask ^= bit
+                square = bit.bit_length() - 1
+                for direction in directions:
+                    jump = JUMPS[direction][square]
+                    if jump is not None and opponents >> jump[0] & 1 and not occupied >> jump[1] & 1:
+                        _add_capture_sequences(code, square, occupied, opponents, (square,), (), moves)
+                        break
+        else:
+            while mask:
+                bit = mask & -mask
+                mask ^= bit
+                square = bit.bit_length() - 1
+                _add_capture_sequences(code, square, occupied, opponents, (square,), (), moves)
+    if moves:
+        return moves
+    for code in own_codes:
+        mask = masks[code]
+        if code == 0 or code == 3:
+            first_moves, second_moves = [RAY_MOVES[direction] for direction in FORWARD_DIRECTIONS[code]]
+            while mask:
+                bit = mask & -mask
+                mask ^= bit
+                square = bit.bit_length() - 1
+                direction_moves = first_moves[square]
+                if direction_moves and not occupied >> direction_moves[0][0][1] & 1:
+                    moves.append(direction_moves[0])
+                direction_moves = second_moves[square]
+                if direction_moves and not occupied >> direction_moves[0][0][1] & 1:
+                    moves.append(direction_moves[0])
+        else:
+            while mask:
+                bit = mask & -mask
+                mask ^= bit
+                square = bit.bit_length() - 1
+                for direction_moves in RAY_MOVES:
+                    for move in direction_moves[square]:
+                        if occupied >> move[0][1] & 1:
+                            break
+                        moves.append(move)
+    return moves
+
+#Header of an encoded change: flags (1 if the mover is White, 2 if it is White's turn after the change), the number of
+#vacated, captured, placed and promoted squares, then the mover's captured pieces, kings and triple kings deltas
+CHANGE_HEADER = struct.Struct("<BBBBBbbb")
+
+def board_change(masks_before, masks_after, checker_color, player_turn, counters=(0, 0, 0)):
+    """
+    Returns the change from one board to another as a dictionary, given the six masks of each board, the color that
+    moved, whose turn it is afterwards and the (captured pieces, kings, triple kings) count deltas of the player who
+    moved. "vacated" lists the square locations the mover's pieces left, "captured" the locations of the opponent's
+    pieces that were removed, "placed" the (location, piece) pairs of squares that have a new piece and "promoted"
+    the placed pieces that ended the move as a different kind of piece than they started it. Only squares that
+    changed are looked at, so the change is built in time proportional to its size.
+    """
+    own_codes = (0, 1, 2) if checker_color == "Black" else (3, 4, 5)
+    removed = {}
+    added = {}
+    for code in range(6):
+        difference = masks_before[code] ^ masks_after[code]
+        while difference:
+            bit = difference & -difference
+            difference ^= bit
+            if masks_before[code] & bit:
+                removed[bit.bit_length() - 1] = code
+            else:
+                added[bit.bit_length() - 1] = code
+    vacated = []
+    captured = []
+    moved_code = None
+    for square, code in removed.items():
+        if square in added:
+            continue
+        if code in own_codes:
+            vacated.append(SQUARE_LOCATIONS[square])
+            moved_code = code
+        else:
+            captured.append(SQUARE_LOCATIONS[square])
+    placed = []
+    promoted = []
+    for square, code in added.items():
+        placed.append((SQUARE_LOCATIONS[square], PIECE_TYPES[code]))
+        started_as = removed.get(square, moved_code)
+        if code in own_codes and started_as is not None and started_as != code:
+            promoted.append((SQUARE_LOCATIONS[square], PIECE_TYPES[code]))
+    return {"color": checker_color, "vacated": vacated, "captured": captured, "placed": placed,
+            "promoted": promoted, "turn": player_turn, "turn_changed": player_turn != checker_color,
+            "counters": tuple(counters)}
+
+def apply_change(rows, change):
+    """
+    Applies a change from board_change to a board given as a list of 8 rows of piece names, such as a copy of
+    Checkers._current_board kept by an observer.
+    """
+    for row, column in change["vacated"]:
+        rows[row][column] = None
+    for row, column in change["captured"]:
+        rows[row][column] = None
+    for (row, column), piece in change["placed"]:
+        rows[row][column] = piece
+
+def encode_change(change):
+    """
+    Packs a change from board_change into bytes: a CHANGE_HEADER, then one byte per vacated and captured square
+    (its square number) and one per placed square (square number << 3 | piece code), promoted squares first.
+    """
+    flags = 0
+    if change["color"] == "White":
+        flags |= 1
+    if change["turn"] == "White":
+        flags |= 2
+    promoted = set(change["promoted"])
+    placed = sorted(change["placed"], key=lambda entry: entry not in promoted)
+    data = bytearray(CHANGE_HEADER.pack(flags, len(change["vacated"]), len(change["captured"]), len(placed),
+                                        len(promoted), *change["counters"]))
+    for row, column in change["vacated"] + change["captured"]:
+        data.append(SQUARE_GRID[row][column])
+    for (row, column), piece in placed:
+        data.append(SQUARE_GRID[row][column] << 3 | PIECE_CODES[piece])
+    return bytes(data)
+
+def decode_change(data):
+    """Returns the change dictionary (see board_change) packed into bytes by encode_change."""
+    flags, vacated_count, captured_count, placed_count, promoted_count, *counters = CHANGE_HEADER.unpack_from(data)
+    position = CHANGE_HEADER.size
+    vacated = [SQUARE_LOCATIONS[square] for square in data[position:position + vacated_count]]
+    position += vacated_count
+    captured = [SQUARE_LOCATIONS[square] for square in data[position:position + captured_count]]
+    position += captured_count
+    placed = [(SQUARE_LOCATIONS[value >> 3], PIECE_TYPES[value & 7])
+              for value in data[position:position + placed_count]]
+    checker_color = "White" if flags & 1 else "Black"
+    player_turn = "White" if flags & 2 else "Black"
+    return {"color": checker_color, "vacated": vacated, "captured": captured, "placed": placed,
+            "promoted": placed[:promoted_count], "turn": player_turn, "turn_changed": player_turn != checker_color,
+            "counters": tuple(counters)}
+
 class Player:
     """
     An object that represents a player in the Checkers game. Initialized with the player's name and checker color.
@@ -24,6 +451,8 @@ class Player:
     have won the game.
     """
 
+    __slots__ = ("_player_name", "_checker_color", "_king_count", "_triple_king_count", "_captured_pieces_count")
+
     def __init__(self, player_name, checker_color):
         self._player_name = player_name
         self._checker_color = checker_color
@@ -47,21 +476,370 @@ class Player:
         """
         return self._captured_pieces_count
 
-    def add_captured_piece(self):
-        """Adds one captured piece to the player's captured piece count."""
-        self._captured_pieces_count += 1
+    def add_captured_piece(self, count=1):
+        """
+        Adds one captured piece, or count pieces, to the player's captured piece count. A negative count takes pieces
+        back off the count when a move is undone.
+        """
+        self._captured_pieces_count += count
+
+    def get_player_name(self):
+        """Returns the player's name."""
+        return self._player_name
 
     def get_checker_color(self):
         """Returns the checker color assigned to the player."""
         return self._checker_color
 
-    def add_king(self):
-        """Adds a king to the player's king count."""
-        self._king_count += 1
+    def add_king(self, count=1):
+        """Adds a king, or count kings, to the player's king count. A negative count is used when undoing a move."""
+        self._king_count += count
 
-    def add_triple_king(self):
-        """Adds a triple king to the player's king count."""
-        self._triple_king_count += 1
+    def add_triple_king(self, count=1):
+        """
+        Adds a triple king, or count triple kings, to the player's triple king count. A negative count is used when
+        undoing a move.
+        """
+        self._triple_king_count += count
+
+class ListBoard:
+    """
+    Stores the game board as a list of 8 rows, where each row is a list of 8 squares holding a piece name or None.
+    This is the default board used by the Checkers object. Squares can be read and written by (row, column) or by
+    square number (see SQUARE_LOCATIONS). The board also keeps the six masks of a BitBoard for the pieces on its dark
+    squares, updated as pieces are placed and removed, so moves, the move generator and piece counts don't have to
+    scan the rows. Its Zobrist hash is None while it is out of date, which only Checkers.play_game leaves it,
+    and is worked out again from the masks the next time get_hash is called.
+    """
+
+    __slots__ = ("_rows", "_hash", "_masks")
+
+    def __init__(self, rows=STARTING_BOARD):
+        self._rows = [list(row) for row in rows]
+        if rows is STARTING_BOARD:
+            self._masks = list(STARTING_MASKS)
+            self._hash = STARTING_HASH
+        else:
+            self._masks = _masks_from_rows(rows)
+            self._hash = zobrist_hash(self._masks, None)
+
+    def get(self, row, column):
+        """Returns the piece at the row and column, or None if the square is empty."""
+        return self._rows[row][column]
+
+    def set(self, row, column, piece):
+        """
+        Places the piece (or None) at the row and column and updates the board's masks and hash, unless the hash is
+        out of date. Pieces on light squares aren't part of either.
+        """
+        old_piece = self._rows[row][column]
+        self._rows[row][column] = piece
+        square = SQUARE_GRID[row][column]
+        if square is not None:
+            if old_piece is not None:
+                code = PIECE_CODES[old_piece]
+                self._masks[code] ^= 1 << square
+                if self._hash is not None:
+                    self._hash ^= ZOBRIST_KEYS[code][square]
+            if piece is not None:
+                code = PIECE_CODES[piece]
+                self._masks[code] |= 1 << square
+                if self._hash is not None:
+                    self._hash ^= ZOBRIST_KEYS[code][square]
+
+    def has_square(self, row, column):
+        """Returns True as a piece can be placed on any square of a list board."""
+        return True
+
+    def get_square(self, square):
+        """Returns the piece on the dark square with the given number, or None if it is empty."""
+        row, column = SQUARE_LOCATIONS[square]
+        return self._rows[row][column]
+
+    def set_square(self, square, piece):
+        """Places the piece (or None) on the dark square with the given number and updates the board's hash."""
+        row, column = SQUARE_LOCATIONS[square]
+        self.set(row, column, piece)
+
+    def move_square(self, starting_square, destination_square, code, final_code, captured=()):
+        """
+        Moves the piece with the code from the starting square to the destination square, which must be empty,
+        where it becomes final_code, and removes the pieces on the captured squares. The masks and hash are updated
+        by code, without looking piece names up. An out of date hash is left as it is.
+        """
+        rows = self._rows
+        masks = self._masks
+        position_hash = self._hash
+        row, column = SQUARE_LOCATIONS[starting_square]
+        rows[row][column] = None
+        masks[code] ^= 1 << starting_square
+        if position_hash is not None:
+            position_hash ^= ZOBRIST_KEYS[code][starting_square] ^ ZOBRIST_KEYS[final_code][destination_square]
+        for square in captured:
+            row, column = SQUARE_LOCATIONS[square]
+            captured_code = PIECE_CODES[rows[row][column]]
+            rows[row][column] = None
+            masks[captured_code] ^= 1 << square
+            if position_hash is not None:
+                position_hash ^= ZOBRIST_KEYS[captured_code][square]
+        row, column = SQUARE_LOCATIONS[destination_square]
+        rows[row][column] = PIECE_TYPES[final_code]
+        masks[final_code] |= 1 << destination_square
+        self._hash = position_hash
+
+    def get_hash(self):
+        """
+        Returns the Zobrist hash of the pieces on the board, not counting whose turn it is. An out of date hash is
+        worked out again from the masks.
+        """
+        if self._hash is None:
+            self._hash = zobrist_hash(self._masks, None)
+        return self._hash
+
+    def get_rows(self):
+        """Returns the board as a list of rows. This is the board itself, not a copy."""
+        return self._rows
+
+    def copy(self):
+        """Returns a new list board with the same pieces."""
+        board = ListBoard.__new__(ListBoard)
+        board._rows = [list(row) for row in self._rows]
+        board._hash = self._hash
+        board._masks = list(self._masks)
+        return board
+
+    def get_piece_counts(self):
+        """Returns the number of pieces of each type in PIECE_TYPES on the dark squares, as a tuple of six counts."""
+        masks = self._masks
+        return (masks[0].bit_count(), masks[1].bit_count(), masks[2].bit_count(), masks[3].bit_count(),
+                masks[4].bit_count(), masks[5].bit_count())
+
+    def get_masks(self):
+        """
+        Returns the list of six 32-bit masks of the pieces on the dark squares, one per piece type in PIECE_TYPES.
+        This is the board's own list, not a copy.
+        """
+        return self._masks
+
+class BitBoard:
+    """
+    Stores the game board as six 32-bit masks, one for each piece type in PIECE_TYPES. Bit n of a mask is set when
+    that piece type stands on dark square n (see SQUARE_LOCATIONS). Light squares are always empty and can't hold a
+    piece. Has the same methods as ListBoard, so the Checkers object can use either one. A board of masks is much
+    smaller than a list of lists and lets the move generator test many squares at once.
+    """
+
+    __slots__ = ("_masks", "_hash")
+
+    def __init__(self, rows=STARTING_BOARD):
+        if rows is STARTING_BOARD:
+            self._masks = list(STARTING_MASKS)
+            self._hash = STARTING_HASH
+        else:
+            self._masks = _masks_from_rows(rows)
+            self._hash = zobrist_hash(self._masks, None)
+
+    def get(self, row, column):
+        """
+        Returns the piece at the row and column, or None if the square is empty. Raises IndexError if the location
+        is off the board, like indexing a list board would.
+        """
+        if row < 0 or row > 7 or column < 0 or column > 7:
+            raise IndexError("board location out of range")
+        square = SQUARE_GRID[row][column]
+        if square is None:
+            return None
+        black_men, black_kings, black_triple_kings, white_men, white_kings, white_triple_kings = self._masks
+        if black_men >> square & 1:
+            return "Black"
+        if white_men >> square & 1:
+            return "White"
+        if black_kings >> square & 1:
+            return "Black_king"
+        if white_kings >> square & 1:
+            return "White_king"
+        if black_triple_kings >> square & 1:
+            return "Black_Triple_King"
+        if white_triple_kings >> square & 1:
+            return "White_Triple_King"
+        return None
+
+    def set(self, row, column, piece):
+        """Places the piece (or None) at the row and column. Raises InvalidSquare for a light square."""
+        if row < 0 or row > 7 or column < 0 or column > 7:
+            raise IndexError("board location out of range")
+        square = SQUARE_GRID[row][column]
+        if square is None:
+            if piece is None:
+                return
+            raise InvalidSquare
+        self.set_square(square, piece)
+
+    def has_square(self, row, column):
+        """Returns True if a piece can be placed at the row and column, meaning it is a dark square."""
+        return SQUARE_GRID[row][column] is not None
+
+    def get_square(self, square):
+        """Returns the piece on the dark square with the given number, or None if it is empty."""
+        code = 0
+        for mask in self._masks:
+            if mask >> square & 1:
+                return PIECE_TYPES[code]
+            code += 1
+        return None
+
+    def set_square(self, square, piece):
+        """Places the piece (or None) on the dark square with the given number and updates the board's hash."""
+        masks = self._masks
+        code = 0
+        for mask in masks:
+            if mask >> square & 1:
+                masks[code] = mask ^ 1 << square
+                self._hash ^= ZOBRIST_KEYS[code][square]
+                break
+            code += 1
+        if piece is not None:
+            code = PIECE_CODES[piece]
+            masks[code] |= 1 << square
+            self._hash ^= ZOBRIST_KEYS[code][square]
+
+    def move_square(self, starting_square, destination_square, code, final_code, captured=()):
+        """
+        Moves the piece with the code from the starting square to the destination square, which must be empty,
+        where it becomes final_code, and removes the pieces on the captured squares, updating the masks and hash.
+        """
+        masks = self._masks
+        masks[code] ^= 1 << starting_square
+        position_hash = self._hash ^ ZOBRIST_KEYS[code][starting_square]
+        for square in captured:
+            captured_code = 0
+            while not masks[captured_code] >> square & 1:
+                captured_code += 1
+            masks[captured_code] ^= 1 << square
+            position_hash ^= ZOBRIST_KEYS[captured_code][square]
+        masks[final_code] |= 1 << destination_square
+        self._hash = position_hash ^ ZOBRIST_KEYS[final_code][destination_square]
+
+    def get_hash(self):
+        """Returns the Zobrist hash of the pieces on the board, not counting whose turn it is."""
+        return self._hash
+
+    def get_rows(self):
+        """Returns a new list of rows built from the masks, in the same form as a list board."""
+        rows = [[None] * 8 for _ in range(8)]
+        for code, mask in enumerate(self._masks):
+            while mask:
+                bit = mask & -mask
+                row, column = SQUARE_LOCATIONS[bit.bit_length() - 1]
+                rows[row][column] = PIECE_TYPES[code]
+                mask ^= bit
+        return rows
+
+    def get_masks(self):
+        """Returns the list of six masks used by the board. This is the board's own list, not a copy."""
+        return self._masks
+
+    def get_piece_counts(self):
+        """Returns the number of pieces of each type in PIECE_TYPES, as a tuple of six counts."""
+        masks = self._masks
+        return (masks[0].bit_count(), masks[1].bit_count(), masks[2].bit_count(), masks[3].bit_count(),
+                masks[4].bit_count(), masks[5].bit_count())
+
+    def copy(self):
+        """Returns a new bitboard with the same pieces."""
+        board = BitBoard.__new__(BitBoard)
+        board._masks = list(self._masks)
+        board._hash = self._hash
+        return board
+
+    def to_bytes(self):
+        """Returns the board packed into 24 bytes: the six masks as little-endian 32-bit numbers."""
+        return struct.pack("<6I", *self._masks)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Returns a new BitBoard unpacked from the first 24 bytes of data, as written by to_bytes."""
+        board = cls.__new__(cls)
+        board._masks = list(struct.unpack_from("<6I", data))
+        board._hash = zobrist_hash(board._masks, None)
+        return board
+
+#A game snapshot: the six board masks, whose turn it is (b"B" or b"W"), the captured pieces, kings and triple kings
+#counts of the Black player and then the White player, then the SNAPSHOT_* flags
+SNAPSHOT = struct.Struct("<6Ic6HB")
+SNAPSHOT_BITBOARD = 1
+SNAPSHOT_BLACK_PLAYER = 2
+SNAPSHOT_WHITE_PLAYER = 4
+SNAPSHOT_STRICT = 8
+
+#A game is a draw when the same position (with the same player to move) comes up DRAW_REPETITIONS times without a
+#capture or a man moving in between, or after DRAW_MOVE_LIMIT moves in a row (counting both players' moves) without
+#one. The limit is 40 moves each, as in the usual 40-move rule, and can be changed per game.
+DRAW_REPETITIONS = 3
+DRAW_MOVE_LIMIT = 80
+
+class TranspositionTable:
+    """
+    A fixed-size table of values keyed by position hash (see Checkers.get_position_hash), shared by anything that
+    wants to remember positions: the search engine, repetition checks or removing duplicate positions. Each hash maps
+    to a bucket of two slots. The first slot keeps the entry with the greatest depth, unless it was stored before the
+    last call to new_search. The second slot always takes the newest entry, so a new position is never dropped.
+    """
+
+    __slots__ = ("_entries", "_bucket_mask", "_generation")
+
+    def __init__(self, size=65536):
+        buckets = 1
+        while buckets * 2 < size:
+            buckets *= 2
+        self._entries = [None] * (buckets * 2)
+        self._bucket_mask = buckets - 1
+        self._generation = 0
+
+    def get_size(self):
+        """Returns the number of entries the table can hold."""
+        return len(self._entries)
+
+    def new_search(self):
+        """Marks every entry already stored as old, so deeper old entries can be replaced by new ones."""
+        self._generation += 1
+
+    def clear(self):
+        """Removes every entry from the table."""
+        self._entries = [None] * len(self._entries)
+
+    def probe(self, position_hash):
+        """
+        Returns the entry stored for the hash as a (hash, depth, generation, value) tuple, or None if the hash isn't
+        in the table.
+        """
+        index = (position_hash & self._bucket_mask) << 1
+        entry = self._entries[index]
+        if entry is not None and entry[0] == position_hash:
+            return entry
+        entry = self._entries[index + 1]
+        if entry is not None and entry[0] == position_hash:
+            return entry
+        return None
+
+    def store(self, position_hash, value, depth=0):
+        """
+        Stores the value for the hash. Depth is how much work the value is worth (for the engine, the search depth),
+        and decides which entries are kept when two positions share a bucket.
+        """
+        index = (position_hash & self._bucket_mask) << 1
+        entries = self._entries
+        new_entry = (position_hash, depth, self._generation, value)
+        first = entries[index]
+        if first is None or first[0] == position_hash or depth >= first[1] or first[2] != self._generation:
+            entries[index] = new_entry
+            second = entries[index + 1]
+            if first is not None and first[0] != position_hash:
+                entries[index + 1] = first
+            elif second is not None and second[0] == position_hash:
+                entries[index + 1] = None
+        else:
+            entries[index + 1] = new_entry
 
 class Checkers:
     """
@@ -70,31 +848,487 @@ class Checkers:
     checkers to different locations and capturing pieces. The board can be printed out so the players can visually
     see where their pieces are on the board. Players can also use a method to get information about a particular
     location on the board and what it contains. Two players are needed to play the game.
+
+    Games use slots rather than a dictionary of attributes, as do their players and boards. With two players, a new
+    game takes about 1,920 bytes on a list board and about 880 bytes on a bitboard (CPython 3.11, measured by
+    CheckersBenchmark.benchmark_game_memory); most of a list board game is the 10 lists of the board.
     """
 
-    def __init__(self):
+    __slots__ = ("_player_name", "_piece_color", "_board", "_players", "_player_turn", "_undo_stack", "_subscribers",
+                 "_strict", "_legal_hops", "_metrics", "_game_over", "_history", "_quiet_moves", "_draw_move_limit")
+
+    def __init__(self, bitboard=False, strict=False, draw_move_limit=DRAW_MOVE_LIMIT):
+        """
+        Creates a new game with the pieces in their starting squares. The board is stored as a list of lists unless
+        bitboard is True, in which case it is stored as a BitBoard of 32-bit masks. Both boards give the same results
+        from play_game, get_checker_details and print_board. If strict is True, play_game only accepts moves that
+        follow every rule of the game: captures are forced, men only move forward, kings and triple kings move as in
+        generate_moves, and a capture sequence has to be finished by the same piece. draw_move_limit is the number
+        of moves without a capture or a man moving after which the game is a draw (see game_winner), or None for no
+        limit.
+        """
         self._player_name = None
         self._piece_color = None
-        self._current_board = [
-            [None, "White", None, "White", None, "White", None, "White"],
-            ["White", None, "White", None, "White", None, "White", None],
-            [None, "White", None, "White", None, "White", None, "White"],
-        [None, None, None, None, None, None, None, None], [None, None, None, None, None, None, None, None],
-        ["Black", None, "Black", None, "Black", None, "Black", None],
-            [None, "Black", None, "Black", None, "Black", None, "Black"],
-            ["Black", None, "Black", None, "Black", None, "Black", None]]
+        if bitboard:
+            self._board = BitBoard()
+        else:
+            self._board = ListBoard()
         self._players = {} #dictionary, key = player name, value = player object
         self._player_turn = "Black"
+        self._undo_stack = [] #undo records for make_move, most recent last
+        self._subscribers = () #functions called with a board_change after every move
+        self._strict = strict
+        self._legal_hops = None #(position hash, legal hops) cached by play_strict for the current turn
+        self._metrics = None #MetricsRegistry that play_game records into, see enable_metrics
+        self._game_over = None #result of game_winner, kept until a move changes the board
+        self._history = [STARTING_POSITION_HASH] #position hash after each move (or None, see play_game)
+        self._quiet_moves = 0 #moves in a row without a capture or a man moving
+        self._draw_move_limit = draw_move_limit
+
+    @classmethod
+    def from_record(cls, path, move_number=None, bitboard=False):
+        """
+        Returns a new game set up from a record file written by CheckersRecord.RecordWriter, as it was after
+        move_number moves, or at the end of the record if move_number is None. Starts from the nearest checkpoint in
+        the record instead of replaying every move from the start.
+        """
+        from CheckersRecord import RecordReader
+        with RecordReader(path) as reader:
+            return reader.replay(move_number, bitboard)
+
+    @property
+    def _current_board(self):
+        """
+        The board as a list of 8 rows of piece names. For a list board this is the board itself, for a bitboard it is
+        a new list built from the masks.
+        """
+        return self._board.get_rows()
+
+    def snapshot(self):
+        """
+        Returns the game packed into SNAPSHOT.size (38) bytes: the board, whose turn it is, each player's counts, the
+        kind of board and whether the game is strict. The bytes can be stored or sent anywhere and turned back into a
+        game with restore. Player names, the moves that can be undone, subscribers, a strict game's unfinished
+        capture sequence and the positions played so far (for draws) aren't part of a snapshot.
+        """
+        flags = 0
+        if isinstance(self._board, BitBoard):
+            flags |= SNAPSHOT_BITBOARD
+        if self.get_player_by_color("Black") is not None:
+            flags |= SNAPSHOT_BLACK_PLAYER
+        if self.get_player_by_color("White") is not None:
+            flags |= SNAPSHOT_WHITE_PLAYER
+        if self._strict:
+            flags |= SNAPSHOT_STRICT
+        if self._player_turn == "Black":
+            turn = b"B"
+        else:
+            turn = b"W"
+        return SNAPSHOT.pack(*self._board.get_masks(), turn, *self._player_counts("Black"),
+                             *self._player_counts("White"), flags)
+
+    @classmethod
+    def restore(cls, blob, player_names=("Black", "White")):
+        """
+        Returns a new game from a snapshot. Players that were in the snapshotted game are created with their counts,
+        named from player_names, a (Black player name, White player name) pair.
+        """
+        values = SNAPSHOT.unpack(blob)
+        flags = values[13]
+        game = cls(bool(flags & SNAPSHOT_BITBOARD), bool(flags & SNAPSHOT_STRICT))
+        board = BitBoard.from_bytes(blob)
+        if not flags & SNAPSHOT_BITBOARD:
+            board = ListBoard(board.get_rows())
+        if values[6] == b"B":
+            game._set_board(board, "Black")
+        else:
+            game._set_board(board, "White")
+        for checker_color, flag, player_name, counts in (
+                ("Black", SNAPSHOT_BLACK_PLAYER, player_names[0], values[7:10]),
+                ("White", SNAPSHOT_WHITE_PLAYER, player_names[1], values[10:13])):
+            if flags & flag:
+                player = game.create_player(player_name, checker_color)
+                player.add_captured_piece(counts[0])
+                player.add_king(counts[1])
+                player.add_triple_king(counts[2])
+        return game
+
+    def _set_board(self, board, player_turn=None):
+        """
+        Replaces the game's board with board (a ListBoard or BitBoard) and, unless player_turn is None, whose turn it
+        is. The new position starts the game again as far as draws go: the positions played so far and the count of
+        quiet moves start from it, and the moves that can be undone, the cached result and a strict game's legal
+        hops are dropped.
+        """
+        self._board = board
+        if player_turn is not None:
+            self._player_turn = player_turn
+        self._undo_stack = []
+        self._legal_hops = None
+        self._game_over = None
+        self._history = [self.get_position_hash()]
+        self._quiet_moves = 0
+
+    def fork(self):
+        """
+        Returns an independent copy of the game: the board, whose turn it is, the players (as new Player objects
+        with the same names and counts) and the moves that can be undone with unmake_move. Subscribers aren't copied.
+        """
+        game = Checkers.__new__(Checkers)
+        game._player_name = self._player_name
+        game._piece_color = self._piece_color
+        game._board = self._board.copy()
+        game._players = {}
+        for player_name, player in self._players.items():
+            new_player = game.create_player(player_name, player.get_checker_color())
+            new_player.add_captured_piece(player.get_captured_pieces_count())
+            new_player.add_king(player.get_king_count())
+            new_player.add_triple_king(player.get_triple_king_count())
+        game._player_turn = self._player_turn
+        game._undo_stack = list(self._undo_stack)
+        game._subscribers = ()
+        game._strict = self._strict
+        game._legal_hops = self._legal_hops
+        game._metrics = self._metrics
+        game._game_over = self._game_over
+        game._history = list(self._history)
+        game._quiet_moves = self._quiet_moves
+        game._draw_move_limit = self._draw_move_limit
+        return game
 
     def create_player(self, player_name, piece_color):
         """
         Takes the player's name and their piece color and returns a Player object with this information. Two player
-        objects must be created for the game to work.
+        objects must be created for the game to work. A result cached by game_winner is dropped, as it names players.
         """
         new_player = Player(player_name, piece_color)
         self._players[player_name] = new_player
+        self._game_over = None
         return new_player
 
+    def legal_moves(self, player_name):
+        """
+        Returns a list of every legal move for the player, whether or not it is their turn. Each move is a tuple of
+        square locations: the location of the piece to move, then every location it lands on. A simple move has two
+        locations and a capture sequence has one more for each extra jump, so a move is played by calling play_game
+        for each pair of neighbouring locations, in a strict game or not. If a capture is possible only captures are
+        returned. Raises an InvalidPlayer exception if the player's name is not valid.
+        """
+        if player_name not in self._players:
+            raise InvalidPlayer
+        checker_color = self._players[player_name].get_checker_color()
+        return [tuple(SQUARE_LOCATIONS[square] for square in path)
+                for path, captured in generate_moves(self._board.get_masks(), checker_color)]
+
+    def get_moves(self):
+        """
+        Returns the legal moves for the player whose turn it is, as (path, captured) pairs of square numbers from
+        generate_moves. These are the moves make_move takes.
+        """
+        return generate_moves(self._board.get_masks(), self._player_turn)
+
+    def get_hint(self, time_budget_ms=100, max_depth=64, cache=None):
+        """
+        Returns a hint of the best move for the player whose turn it is, as a tuple of square locations like
+        legal_moves, or None if they have no legal move. Hints are searched by the engine and kept in a
+        CheckersHints.HintCache (cache, or one shared by every game if None) keyed by position hash, time budget and
+        depth, so asking again in the same position with the same budget and depth, in this game or any other,
+        doesn't search again.
+        """
+        from CheckersHints import get_hint
+        return get_hint(self, time_budget_ms, max_depth, cache)
+
+    def get_destinations(self, starting_square_location, cache=None):
+        """
+        Returns the list of square locations the piece on starting_square_location can be moved to next with
+        play_game, for the player whose turn it is, or an empty list if it can't move. Raises InvalidSquare if the
+        location isn't on the board. Kept in the hint cache like get_hint.
+        """
+        from CheckersHints import get_destinations
+        return get_destinations(self, starting_square_location, cache)
+
+    def get_position_hash(self):
+        """
+        Returns the 64-bit Zobrist hash of the current position: the pieces on the board and whose turn it is. The
+        board keeps its part of the hash up to date every time a square changes, so this doesn't scan the board.
+        """
+        if self._player_turn == "Black":
+            return self._board.get_hash() ^ ZOBRIST_BLACK_TO_MOVE
+        return self._board.get_hash()
+
+    def subscribe(self, callback):
+        """
+        Has callback called with the change (see board_change) after every move made with play_game, make_move or
+        unmake_move, so an observer can keep its own copy of the board up to date with apply_change instead of
+        reading every square. Returns the callback, to pass to unsubscribe later.
+        """
+        self._subscribers += (callback,)
+        return callback
+
+    def unsubscribe(self, callback):
+        """Stops calling a callback passed to subscribe."""
+        subscribers = list(self._subscribers)
+        subscribers.remove(callback)
+        self._subscribers = tuple(subscribers)
+
+    def _player_counts(self, checker_color):
+        """Returns the captured pieces, king and triple king counts of the color's player, or zeros if there is none."""
+        player = self.get_player_by_color(checker_color)
+        if player is None:
+            return 0, 0, 0
+        return player.get_captured_pieces_count(), player.get_king_count(), player.get_triple_king_count()
+
+    def _publish_change(self, masks_before, checker_color, counts_before):
+        """Sends the change since masks_before, made by the checker color, to every subscriber."""
+        counts_after = self._player_counts(checker_color)
+        change = board_change(masks_before, self._board.get_masks(), checker_color, self._player_turn,
+                              tuple(after - before for after, before in zip(counts_after, counts_before)))
+        for callback in self._subscribers:
+            callback(change)
+
+    def get_piece_counts(self, checker_color):
+        """
+        Returns the color's (men, kings, triple kings) counts on the board. The board keeps these counts up to date as
+        pieces move, so this doesn't scan the board.
+        """
+        counts = self._board.get_piece_counts()
+        if checker_color == "Black":
+            return counts[0], counts[1], counts[2]
+        return counts[3], counts[4], counts[5]
+
+    def is_game_over(self):
+        """Returns True if the game has been won or drawn (see game_winner)."""
+        return self.game_winner() != "Game has not ended"
+
+    def _record_position(self, irreversible):
+        """
+        Adds the position after a turn played with play_game to the history used to find draws. After a capture or
+        a man moving (irreversible), no earlier position can come up again, so the count of quiet moves starts over
+        and only the positions since then are searched for repetitions.
+        """
+        position_hash = self._board.get_hash()
+        if self._player_turn == "Black":
+            position_hash ^= ZOBRIST_BLACK_TO_MOVE
+        if irreversible:
+            self._quiet_moves = 0
+        else:
+            self._quiet_moves += 1
+        self._history.append(position_hash)
+
+    def _fill_history(self):
+        """
+        Replaces the last position in the history with its hash if play_game left it as None. Called before a
+        quiet move changes the board, as the position the move starts from can then come up again.
+        """
+        if self._history and self._history[-1] is None:
+            self._history[-1] = self.get_position_hash()
+
+    def get_player_by_color(self, checker_color):
+        """Returns the Player object playing the checker color, or None if no player has that color."""
+        for player in self._players.values():
+            if player.get_checker_color() == checker_color:
+                return player
+        return None
+
+    def get_player(self, player_name):
+        """Returns the Player object with the player name, or None if there is no such player."""
+        return self._players.get(player_name)
+
+    def get_player_turn(self):
+        """Returns the checker color of the player whose turn it is, "Black" or "White"."""
+        return self._player_turn
+
+    def get_board(self):
+        """Returns a copy of the board as a list of 8 rows, where each row is a list of 8 piece names or None."""
+        return [list(row) for row in self._board.get_rows()]
+
+    def get_masks(self):
+        """
+        Returns a copy of the board as a list of six 32-bit masks of the pieces on the dark squares, one per piece type
+        in PIECE_TYPES (see BitBoard). These are what generate_moves, apply_move and zobrist_hash take.
+        """
+        return list(self._board.get_masks())
+
+    def make_move(self, move):
+        """
+        Plays a whole move for the player whose turn it is and returns the number of pieces captured. The move is a
+        (path, captured) pair as returned by get_moves and must be legal in the current position. Moves the piece,
+        removes the captured pieces, promotes the piece, updates the player's counts and passes the turn to the
+        opponent, then saves what it changed so that unmake_move can put the game back exactly as it was.
+        """
+        path, captured = move
+        board = self._board
+        self._game_over = None
+        if self._subscribers:
+            masks_before = list(board.get_masks())
+            checker_color = self._player_turn
+            counts_before = self._player_counts(checker_color)
+        starting_square = path[0]
+        piece = board.get_square(starting_square)
+        if not captured and piece != "Black" and piece != "White":
+            self._fill_history()
+        code, kings_added, triple_kings_added = promote_along_path(PIECE_CODES[piece], path)
+        captured_pieces = tuple(board.get_square(square) for square in captured)
+        board.set_square(starting_square, None)
+        for square in captured:
+            board.set_square(square, None)
+        board.set_square(path[-1], PIECE_TYPES[code])
+        player = self.get_player_by_color(self._player_turn)
+        if player is not None:
+            player.add_captured_piece(len(captured))
+            player.add_king(kings_added)
+            player.add_triple_king(triple_kings_added)
+        self._undo_stack.append((move, piece, captured_pieces, self._player_turn, kings_added, triple_kings_added,
+                                 self._quiet_moves))
+        if self._player_turn == "Black":
+            self._player_turn = "White"
+        else:
+            self._player_turn = "Black"
+        if captured or piece == "Black" or piece == "White":
+            self._quiet_moves = 0
+        else:
+            self._quiet_moves += 1
+        self._history.append(self.get_position_hash())
+        if self._subscribers:
+            self._publish_change(masks_before, checker_color, counts_before)
+        return len(captured)
+
+    def unmake_move(self):
+        """
+        Undoes the last move played with make_move: puts the moved and captured pieces back, takes back any promotion
+        and count changes, and gives the turn back to the player who made the move.
+        """
+        move, piece, captured_pieces, player_turn, kings_added, triple_kings_added, self._quiet_moves = \
+            self._undo_stack.pop()
+        if self._history:
+            self._history.pop()
+        path, captured = move
+        board = self._board
+        self._game_over = None
+        if self._subscribers:
+            masks_before = list(board.get_masks())
+            counts_before = self._player_counts(player_turn)
+        board.set_square(path[-1], None)
+        for square, captured_piece in zip(captured, captured_pieces):
+            board.set_square(square, captured_piece)
+        board.set_square(path[0], piece)
+        self._player_turn = player_turn
+        player = self.get_player_by_color(player_turn)
+        if player is not None:
+            player.add_captured_piece(-len(captured))
+            player.add_king(-kings_added)
+            player.add_triple_king(-triple_kings_added)
+        if self._subscribers:
+            self._publish_change(masks_before, player_turn, counts_before)
+
+    def _strict_hops(self):
+        """
+        Returns the legal hops for the current position as a dictionary from (starting square, destination square)
+        to the list of (move, hop number) pairs of the moves from get_moves that make that hop next. The dictionary
+        is built once per turn and kept until the position changes.
+        """
+        position_hash = self.get_position_hash()
+        if self._legal_hops is None or self._legal_hops[0] != position_hash:
+            hops = {}
+            for move in self.get_moves():
+                path = move[0]
+                hops.setdefault((path[0], path[1]), []).append((move, 1))
+            self._legal_hops = (position_hash, hops)
+        return self._legal_hops[1]
+
+    def _play_strict(self, player_name, starting_square_location, destination_square_location):
+        """
+        Plays one hop of a move for play_game in a strict game. The hop is looked up in the legal hops for the turn,
+        so an illegal move is turned down with one dictionary lookup, raising InvalidSquare. After a capture the turn
+        stays with the player only if the capture sequence they chose has more hops, which must come next. When
+        metrics are enabled, the same phases as in _play_move are timed.
+        """
+        metrics = self._metrics
+        if metrics is not None:
+            phase_time = perf_counter()
+
+        if player_name not in self._players:
+            raise InvalidPlayer
+        starting_row, starting_column = starting_square_location
+        destination_row, destination_column = destination_square_location
+        if not (0 <= starting_row <= 7 and 0 <= starting_column <= 7 and 0 <= destination_row <= 7 and
+                0 <= destination_column <= 7):
+            raise InvalidSquare
+        starting_square = SQUARE_GRID[starting_row][starting_column]
+        destination_square = SQUARE_GRID[destination_row][destination_column]
+        if starting_square is None or destination_square is None:
+            raise InvalidSquare
+        player = self._players[player_name]
+        checker_color = player.get_checker_color()
+        if checker_color != self._player_turn:
+            raise OutofTurn
+        candidates = self._strict_hops().get((starting_square, destination_square))
+        if candidates is None:
+            raise InvalidSquare
+        board = self._board
+        masks = board.get_masks()
+        if self._subscribers:
+            masks_before = list(masks)
+            counts_before = self._player_counts(checker_color)
+        code = 0
+        while not masks[code] >> starting_square & 1:
+            code += 1
+        if metrics is not None:
+            phase_time = metrics.lap("validate", phase_time, perf_counter())
+
+        occupied = masks[0] | masks[1] | masks[2] | masks[3] | masks[4] | masks[5]
+        captured = [square for square in BETWEEN[starting_square][destination_square] if occupied >> square & 1]
+        if metrics is not None:
+            phase_time = metrics.lap("capture", phase_time, perf_counter())
+
+        promoted_code = PROMOTIONS[code][destination_square]
+        board.move_square(starting_square, destination_square, code, promoted_code, captured)
+        if metrics is not None:
+            phase_time = metrics.lap("move_piece", phase_time, perf_counter())
+
+        #The hops that continue the capture sequences this hop was part of
+        hops = {}
+        for move, hop in candidates:
+            path = move[0]
+            if len(path) > hop + 1:
+                hops.setdefault((path[hop], path[hop + 1]), []).append((move, hop + 1))
+        if metrics is not None:
+            phase_time = metrics.lap("continuation", phase_time, perf_counter())
+
+        if hops:
+            self._legal_hops = (self.get_position_hash(), hops)
+        else:
+            self._legal_hops = None
+            if self._player_turn == "Black":
+                self._player_turn = "White"
+            else:
+                self._player_turn = "Black"
+        if metrics is not None:
+            phase_time = metrics.lap("turn", phase_time, perf_counter())
+
+        player.add_captured_piece(len(captured))
+        if promoted_code != code:
+            if promoted_code == 1 or promoted_code == 4:
+                player.add_king()
+            else:
+                player.add_triple_king()
+        if metrics is not None:
+            phase_time = metrics.lap("promotion", phase_time, perf_counter())
+
+        if not hops:
+            self._record_position(captured or code == 0 or code == 3)
+            if metrics is not None:
+                metrics.lap("history", phase_time, perf_counter())
+
+        if self._subscribers:
+            self._publish_change(masks_before, checker_color, counts_before)
+        return len(captured)
+
+    def _has_piece_of(self, checker_color, row, column):
+        """Returns True if the piece at the row and column is a man, king or triple king of the checker color."""
+        piece = self._board.get(row, column)
+        return piece is not None and piece.startswith(checker_color)
+
     def check_for_move_triple_king(self, row, column, checker_color, row_direction, column_direction):
         """Checks to see if any moves are possible within one diagonal direction for a triple king piece. Called by
         moves_to_check_triple_king function. Uses a recursive call if the first square in the
@@ -104,21 +1338,21 @@ class Checkers:
         elif row+row_direction > 7 or row+row_direction < 0 or column+column_direction > 7 or column+column_direction\
             < 0:
             return False
-        elif checker_color == self._current_board[row+row_direction][column+column_direction]:
+        elif self._has_piece_of(checker_color, row+row_direction, column+column_direction):
             return False
-        elif self._current_board[row+row_direction][column+column_direction] is None:
+        elif self._board.get(row+row_direction, column+column_direction) is None:
             return self.check_for_move_triple_king(row+row_direction, column+column_direction, checker_color, \
                                                      row_direction, column_direction)
         elif row+row_direction+row_direction > 7 or row+row_direction+row_direction < 0 or \
                 column+column_direction+column_direction > 7 or column+column_direction+column_direction < 0:
             return False
         else:
-            if self._current_board[row+row_direction+row_direction][column+column_direction+column_direction] is None:
+            if self._board.get(row+row_direction+row_direction, column+column_direction+column_direction) is None:
                 return True
-            elif self._current_board[row+row_direction+row_direction][column+column_direction+column_direction] is not\
+            elif self._board.get(row+row_direction+row_direction, column+column_direction+column_direction) is not\
                 None:
-                if self._current_board[row+row_direction+row_direction][column+column_direction+column_direction] ==\
-                    checker_color:
+                if self._has_piece_of(checker_color, row+row_direction+row_direction, \
+                                      column+column_direction+column_direction):
                     return False
                 else:
                     if row+row_direction+row_direction+row_direction > 7 or \
@@ -126,8 +1360,8 @@ class Checkers:
                             column+column_direction+column_direction+column_direction > 7 or \
                             column+column_direction+column_direction+column_direction < 0:
                         return False
-                    elif self._current_board[row+row_direction+row_direction+row_direction]\
-                        [column+column_direction+column_direction+column_direction] is None:
+                    elif self._board.get(row+row_direction+row_direction+row_direction, \
+                                         column+column_direction+column_direction+column_direction) is None:
                         return True
                     else:
                         return False
@@ -156,16 +1390,16 @@ class Checkers:
         elif row+row_direction > 7 or row+row_direction < 0 or column+column_direction > 7 or column+column_direction\
             < 0:
             return False
-        elif checker_color == self._current_board[row+row_direction][column+column_direction]:
+        elif self._has_piece_of(checker_color, row+row_direction, column+column_direction):
             return False
-        elif self._current_board[row+row_direction][column+column_direction] is None:
+        elif self._board.get(row+row_direction, column+column_direction) is None:
             return self.check_for_possible_move_king(row+row_direction, column+column_direction, checker_color, \
                                                      row_direction, column_direction)
         elif row+row_direction+row_direction > 7 or row+row_direction+row_direction < 0 or \
                 column+column_direction+column_direction > 7 or column+column_direction+column_direction < 0:
             return False
         else:
-            if self._current_board[row+row_direction+row_direction][column+column_direction+column_direction] is None:
+            if self._board.get(row+row_direction+row_direction, column+column_direction+column_direction) is None:
                 return True
             else:
                 return False
@@ -194,15 +1428,15 @@ class Checkers:
         elif row+row_direction > 7 or row+row_direction < 0 or column+column_direction > 7 or column+column_direction\
             < 0:
             return False
-        elif checker_color == self._current_board[row+row_direction][column+column_direction]:
+        elif self._has_piece_of(checker_color, row+row_direction, column+column_direction):
             return False
-        elif self._current_board[row+row_direction][column+column_direction] is None:
+        elif self._board.get(row+row_direction, column+column_direction) is None:
             return False
         elif row+row_direction+row_direction > 7 or row+row_direction+row_direction < 0 or \
                 column+column_direction+column_direction > 7 or column+column_direction+column_direction < 0:
             return False
         else:
-            if self._current_board[row+row_direction+row_direction][column+column_direction+column_direction] is None:
+            if self._board.get(row+row_direction+row_direction, column+column_direction+column_direction) is None:
                 return True
             else:
                 return False
@@ -238,106 +1472,265 @@ class Checkers:
         that does not exist, or if the player's name is not valid. Returns the number of pieces captured with this
         move. If the piece reaches the end of the opponent's side it becomes a king, and if it then reaches the player's
         original side it becomes a triple king.
-        """
 
-        starting_row = starting_square_location[0]
-        starting_column = starting_square_location[1]
-        destination_row = destination_square_location[0]
-        destination_column = destination_square_location[1]
-        checker_color = self._players[player_name].get_checker_color() #Holds current player's checker color
-        captured_pieces_this_turn = 0
+        A default game (on a list board, not strict, without metrics or subscribers) is played here directly, reading
+        the pieces from the board's rows as the original play_game did and changing the rows and masks in place. Other
+        games are played by _play_measured, _play_strict or _play_move, which make the same moves. A capture or a man
+        moving can't be undone by later moves, so the position after one can only come up again if a quiet move
+        follows, and its hash isn't worked out here: the board's hash is left out of date and the history gets None,
+        which the next quiet move replaces with the hash before it changes the board (see _fill_history).
+        """
+        self._game_over = None
+        if self._metrics is not None:
+            return self._play_measured(player_name, starting_square_location, destination_square_location)
+        if self._strict:
+            return self._play_strict(player_name, starting_square_location, destination_square_location)
+        board = self._board
+        if self._subscribers or board.__class__ is not ListBoard:
+            return self._play_move(player_name, starting_square_location, destination_square_location)
+        player = self._players.get(player_name)
+        if player is None:
+            raise InvalidPlayer
+        starting_row, starting_column = starting_square_location
+        destination_row, destination_column = destination_square_location
+        checker_color = player._checker_color #Holds current player's checker color
 
         #Exception Tests
-        if starting_row < 0 or starting_column < 0 or destination_row < 0 or destination_column < 0:
+        if not (0 <= starting_row <= 7 and 0 <= starting_column <= 7 and 0 <= destination_row <= 7 and
+                0 <= destination_column <= 7):
             raise InvalidSquare
-        if starting_row > 7 or starting_column > 7 or destination_row > 7 or destination_column > 7:
+        destination_square = SQUARE_GRID[destination_row][destination_column]
+        if destination_square is None: #Pieces can't be moved onto light squares
             raise InvalidSquare
-        elif checker_color != self._player_turn:
+        if checker_color != self._player_turn:
             raise OutofTurn
-        elif checker_color == "Black":
-            if self._current_board[starting_row][starting_column] != "Black" and \
-                    self._current_board[starting_row][starting_column] != "Black_king" and \
-                    self._current_board[starting_row][starting_column] != "Black_Triple_King":
-                raise InvalidSquare
-        elif checker_color == "White":
-            if self._current_board[starting_row][starting_column] != "White" and \
-                    self._current_board[starting_row][starting_column] != "White_king" and \
-                    self._current_board[starting_row][starting_column] != "White_Triple_King":
-                raise InvalidSquare
-        elif self._current_board[starting_row][starting_column] == None:
-            raise InvalidSquare
+        starting_square = SQUARE_GRID[starting_row][starting_column]
+        rows = board._rows
+        code = COLOR_PIECE_CODES[checker_color].get(rows[starting_row][starting_column])
+        if code is None or starting_square is None:
+            raise InvalidSquare #No piece of the player's on the starting square
 
-        #Setting piece equal to piece at starting location, then moving that piece
-        piece = self._current_board[starting_row][starting_column]
-        self.move_piece(piece, starting_row, starting_column, destination_row, destination_column)
-
-        #Determining if a piece has been captured
-        if piece == "Black_king" or piece == "White_king":
-            captured_pieces_this_turn += self.capture_piece_king(player_name, checker_color, starting_row, \
-                                                                 starting_column, destination_row, destination_column)
-        elif piece == "Black_Triple_King" or piece == "White_Triple_King":
-            captured_pieces_this_turn += self.capture_piece_triple_king(player_name, checker_color, starting_row,\
-                                                                   starting_column, destination_row, destination_column)
+        #Finding the opponent pieces captured on the way
+        masks = board._masks
+        between = BETWEEN[starting_square][destination_square]
+        if between:
+            if code < 3:
+                opponents = masks[3] | masks[4] | masks[5]
+            else:
+                opponents = masks[0] | masks[1] | masks[2]
+            captured = _hop_captures(code, between, opponents)
         else:
-            if starting_row - destination_row == -2:
-                if starting_column - destination_column == 2: #Jump down & left
-                    self._players[player_name].add_captured_piece()
-                    captured_pieces_this_turn += 1
-                    self._current_board[starting_row+1][starting_column-1] = None
-                elif starting_column - destination_column == -2: #Jump down & right
-                    self._players[player_name].add_captured_piece()
-                    captured_pieces_this_turn += 1
-                    self._current_board[starting_row+1][starting_column+1] = None
-            elif starting_row - destination_row == 2:
-                if starting_column - destination_column == 2: #Jump up & left
-                    self._players[player_name].add_captured_piece()
-                    captured_pieces_this_turn += 1
-                    self._current_board[starting_row-1][starting_column-1] = None
-                elif starting_column - destination_column == -2: #Jump up & right
-                    self._players[player_name].add_captured_piece()
-                    captured_pieces_this_turn += 1
-                    self._current_board[starting_row-1][starting_column+1] = None
-
-        #Checks for possible moves, True returned if a move is possible, otherwise False
-        if piece == "Black" or piece == "White":
-            moves_possible = self.possible_moves_to_check(checker_color, destination_row, destination_column)
-        elif piece == "Black_king" or piece == "White_king":
-            moves_possible = self.possible_moves_to_check_king(checker_color, destination_row, destination_column)
+            captured = ()
+        quiet = not captured and code != 0 and code != 3
+        if quiet:
+            self._fill_history()
+            position_hash = board.get_hash()
+
+        #Moving the piece, promoted if it lands on the end of the board, and removing the captured pieces
+        if rows[destination_row][destination_column] is not None and destination_square != starting_square:
+            board.set_square(destination_square, None) #The original rules let a piece land on another one
+            position_hash = board._hash
+        promoted_code = PROMOTIONS[code][destination_square]
+        rows[starting_row][starting_column] = None
+        masks[code] ^= 1 << starting_square
+        for square in captured:
+            row, column = SQUARE_LOCATIONS[square]
+            captured_code = PIECE_CODES[rows[row][column]]
+            rows[row][column] = None
+            masks[captured_code] ^= 1 << square
+        rows[destination_row][destination_column] = PIECE_TYPES[promoted_code]
+        masks[promoted_code] |= 1 << destination_square
+        if quiet:
+            board._hash = position_hash ^ ZOBRIST_KEYS[code][starting_square] ^ \
+                ZOBRIST_KEYS[promoted_code][destination_square]
         else:
-            moves_possible = self.moves_to_check_triple_king(checker_color, destination_row, destination_column)
+            board._hash = None
 
+        #After capturing one piece, checks if the piece (before any promotion) can capture again
+        moves_possible = False
+        if len(captured) == 1:
+            if code < 3:
+                opponents = masks[3] | masks[4] | masks[5]
+            else:
+                opponents = masks[0] | masks[1] | masks[2]
+            occupied = masks[0] | masks[1] | masks[2] | masks[3] | masks[4] | masks[5]
+            moves_possible = bool(_find_jumps(code, destination_square, occupied, opponents))
 
-        if moves_possible == True:
-            if captured_pieces_this_turn == 1:
-                pass
+        if captured:
+            player.add_captured_piece(len(captured))
+        if promoted_code != code:
+            if promoted_code == 1 or promoted_code == 4:
+                player.add_king()
             else:
+                player.add_triple_king()
+
+        #Passing the turn and recording the position for finding draws, as _record_position does
+        if not moves_possible:
+            if quiet:
+                self._quiet_moves += 1
                 if self._player_turn == "Black":
-                    self._player_turn = "White"
+                    self._history.append(board._hash)
                 else:
-                    self._player_turn = "Black"
-        elif moves_possible == False:
+                    self._history.append(board._hash ^ ZOBRIST_BLACK_TO_MOVE)
+            else:
+                self._quiet_moves = 0
+                self._history.append(None)
             if self._player_turn == "Black":
                 self._player_turn = "White"
             else:
                 self._player_turn = "Black"
 
-        #If conditions are met, changes a piece to a king or triple king, important that this is last!
-        if checker_color == "White" and destination_row == 7:
-            self._current_board[destination_row][destination_column] = "White_king"
-            self._players[player_name].add_king()
-        elif checker_color == "Black" and destination_row == 0:
-            self._current_board[destination_row][destination_column] = "Black_king"
-            self._players[player_name].add_king()
-        elif self._current_board[destination_row][destination_column] == "White_king" and \
-            destination_row == 0:
-            self._current_board[destination_row][destination_column] = "White_Triple_King"
-            self._players[player_name].add_triple_king()
-        elif self._current_board[destination_row][destination_column] == "Black_king" and \
-                 destination_row == 7:
-            self._current_board[destination_row][destination_column] = "Black_Triple_King"
-            self._players[player_name].add_triple_king()
-
-        return captured_pieces_this_turn
+        return len(captured)
+
+    def enable_metrics(self, registry=None):
+        """
+        Starts recording how long each phase of play_game takes, how often it is called and the exceptions it
+        raises, into registry (a CheckersMetrics.MetricsRegistry, which can be shared between games, or a new one if
+        None). Returns the registry. Without metrics play_game only checks that none are enabled.
+        """
+        if registry is None:
+            from CheckersMetrics import MetricsRegistry
+            registry = MetricsRegistry()
+        self._metrics = registry
+        return registry
+
+    def disable_metrics(self):
+        """Stops recording metrics."""
+        self._metrics = None
+
+    def _play_measured(self, player_name, starting_square_location, destination_square_location):
+        """Plays a move for play_game while metrics are enabled, timing the whole move and counting exceptions."""
+        metrics = self._metrics
+        metrics.increment("play_game")
+        start_time = perf_counter()
+        try:
+            if self._strict:
+                captured_pieces = self._play_strict(player_name, starting_square_location,
+                                                    destination_square_location)
+            else:
+                captured_pieces = self._play_move(player_name, starting_square_location, destination_square_location)
+        except (InvalidSquare, OutofTurn, InvalidPlayer) as error:
+            metrics.count_exception(type(error).__name__)
+            raise
+        metrics.observe("play_game", perf_counter() - start_time)
+        metrics.increment("pieces_captured", captured_pieces)
+        return captured_pieces
+
+    def _play_move(self, player_name, starting_square_location, destination_square_location):
+        """
+        Plays a move for play_game by the rules of the original game, on square numbers: the captured pieces are
+        found with the BETWEEN table (see _hop_captures), the board's masks are changed by piece code and the
+        promotion comes from the PROMOTIONS table. After capturing one piece the turn stays with the player if the
+        piece can capture again from where it landed. When metrics are enabled, the time taken by each phase
+        (checking the move, finding the captured pieces, moving the pieces, checking for another capture, passing the
+        turn and promoting) is recorded.
+        """
+        metrics = self._metrics
+        if metrics is not None:
+            phase_time = perf_counter()
+
+        if player_name not in self._players:
+            raise InvalidPlayer
+        starting_row, starting_column = starting_square_location
+        destination_row, destination_column = destination_square_location
+        player = self._players[player_name]
+        checker_color = player._checker_color #Holds current player's checker color
+
+        #Exception Tests
+        if not (0 <= starting_row <= 7 and 0 <= starting_column <= 7 and 0 <= destination_row <= 7 and
+                0 <= destination_column <= 7):
+            raise InvalidSquare
+        destination_square = SQUARE_GRID[destination_row][destination_column]
+        if destination_square is None: #Pieces can't be moved onto light squares
+            raise InvalidSquare
+        if checker_color != self._player_turn:
+            raise OutofTurn
+        starting_square = SQUARE_GRID[starting_row][starting_column]
+        board = self._board
+        masks = board.get_masks()
+        if starting_square is None:
+            raise InvalidSquare
+        men, kings, triple_kings = COLOR_CODES[checker_color]
+        if masks[men] >> starting_square & 1:
+            code = men
+        elif masks[kings] >> starting_square & 1:
+            code = kings
+        elif masks[triple_kings] >> starting_square & 1:
+            code = triple_kings
+        else:
+            raise InvalidSquare #No piece of the player's on the starting square
+
+        if self._subscribers:
+            masks_before = list(masks)
+            counts_before = self._player_counts(checker_color)
+
+        if metrics is not None:
+            phase_time = metrics.lap("validate", phase_time, perf_counter())
+
+        #Finding the opponent pieces captured on the way
+        if code < 3:
+            own = masks[0] | masks[1] | masks[2]
+            opponents = masks[3] | masks[4] | masks[5]
+        else:
+            own = masks[3] | masks[4] | masks[5]
+            opponents = masks[0] | masks[1] | masks[2]
+        between = BETWEEN[starting_square][destination_square]
+        if between:
+            captured = _hop_captures(code, between, opponents)
+        else:
+            captured = ()
+        if metrics is not None:
+            phase_time = metrics.lap("capture", phase_time, perf_counter())
+
+        #Moving the piece, promoted if it lands on the end of the board, and removing the captured pieces
+        if not (captured or code == 0 or code == 3):
+            self._fill_history()
+        if (own | opponents) >> destination_square & 1 and destination_square != starting_square:
+            board.set_square(destination_square, None) #The original rules let a piece land on another one
+        promoted_code = PROMOTIONS[code][destination_square]
+        board.move_square(starting_square, destination_square, code, promoted_code, captured)
+        if metrics is not None:
+            phase_time = metrics.lap("move_piece", phase_time, perf_counter())
+
+        #After capturing one piece, checks if the piece (before any promotion) can capture again
+        moves_possible = False
+        if len(captured) == 1:
+            if code < 3:
+                opponents = masks[3] | masks[4] | masks[5]
+            else:
+                opponents = masks[0] | masks[1] | masks[2]
+            occupied = masks[0] | masks[1] | masks[2] | masks[3] | masks[4] | masks[5]
+            moves_possible = bool(_find_jumps(code, destination_square, occupied, opponents))
+        if metrics is not None:
+            phase_time = metrics.lap("continuation", phase_time, perf_counter())
+
+        if not moves_possible:
+            if self._player_turn == "Black":
+                self._player_turn = "White"
+            else:
+                self._player_turn = "Black"
+        if metrics is not None:
+            phase_time = metrics.lap("turn", phase_time, perf_counter())
+
+        if captured:
+            player.add_captured_piece(len(captured))
+        if promoted_code != code:
+            if promoted_code == 1 or promoted_code == 4:
+                player.add_king()
+            else:
+                player.add_triple_king()
+        if metrics is not None:
+            phase_time = metrics.lap("promotion", phase_time, perf_counter())
+
+        if not moves_possible:
+            self._record_position(captured or code == 0 or code == 3)
+            if metrics is not None:
+                metrics.lap("history", phase_time, perf_counter())
+
+        if self._subscribers:
+            self._publish_change(masks_before, checker_color, counts_before)
+
+        return len(captured)
 
     def get_checker_details(self, square_location):
         """
@@ -354,7 +1747,7 @@ class Checkers:
         elif board_column > 7:
             raise InvalidSquare
         else:
-            return self._current_board[board_row][board_column]
+            return self._board.get(board_row, board_column)
     def print_board(self):
         """Prints the current board in the form of an array."""
         for element in self._current_board:
@@ -364,8 +1757,18 @@ class Checkers:
         """
         Returns the name of the player who won the game. If the game has not ended, returns message "game has not
         ended." Determines if a player has won the game by counting the number of their opponent's pieces they have
-        using the get_captured_pieces_count method from the Player object.
+        using the get_captured_pieces_count method from the Player object. A player also wins when their opponent
+        has no pieces left or it is their opponent's turn and the opponent can't make any move; if the winning color
+        has no player, the color is returned instead of a name. Returns "Draw" if the game is drawn by repetition or
+        by the move limit (see DRAW_REPETITIONS and DRAW_MOVE_LIMIT). The result is worked out once and kept until
+        the next move, so asking again is a single attribute lookup.
         """
+        if self._game_over is None:
+            self._game_over = self._find_winner()
+        return self._game_over
+
+    def _find_winner(self):
+        """Works out the result returned by game_winner from the board and the players."""
         game_over = False
         winner_of_game = None
         for player in self._players:
@@ -374,8 +1777,19 @@ class Checkers:
                 winner_of_game = player
         if game_over is True:
             return winner_of_game
-        else:
-            return "Game has not ended"
+        for checker_color, opponent_color in (("Black", "White"), ("White", "Black")):
+            if sum(self.get_piece_counts(opponent_color)) == 0 or \
+                    self._player_turn == opponent_color and not self.get_moves():
+                player = self.get_player_by_color(checker_color)
+                if player is None:
+                    return checker_color
+                return player._player_name
+        if self._draw_move_limit is not None and self._quiet_moves >= self._draw_move_limit:
+            return "Draw"
+        if self._quiet_moves and \
+                self._history[-self._quiet_moves - 1:].count(self.get_position_hash()) >= DRAW_REPETITIONS:
+            return "Draw"
+        return "Game has not ended"
 
 
     def move_piece(self, piece, starting_row, starting_column, destination_row, destination_column):
@@ -383,105 +1797,90 @@ class Checkers:
         Moves a piece from its starting location to destination. Takes the piece name (as a string), plus the starting
         row and column and ending row and column of the move as parameters.
         """
-        self._current_board[starting_row][starting_column] = None  # Sets starting square to None
-        self._current_board[destination_row][destination_column] = piece
+        self._board.set(starting_row, starting_column, None)  # Sets starting square to None
+        self._board.set(destination_row, destination_column, piece)
 
     def capture_piece_king(self, player_name, checker_color, starting_row, starting_column, destination_row, \
                            destination_column):
         """
-        Captures a piece based on the rules for a king piece, and changes the square of the captured piece
-        to None.
+        Captures a piece based on the rules for a king piece: the first of the opponent's pieces that the king passes
+        over on a diagonal move is captured and its square changed to None. Returns the number of pieces captured.
         """
         if checker_color == "White":
             opponent_color = "Black"
         else:
             opponent_color = "White"
 
-        if starting_row - destination_row <= -2:
-            if starting_column - destination_column >= 2:  # Jump down & left
-                self._players[player_name].add_captured_piece()
-                self.remove_piece_king(opponent_color, starting_row, starting_column, 1, -1)
-                return 1
-            elif starting_column - destination_column <= -2:  # Jump down & right
-                self._players[player_name].add_captured_piece()
-                self.remove_piece_king(opponent_color, starting_row, starting_column, 1, 1)
-                return 1
-        elif starting_row - destination_row >= 2:
-            if starting_column - destination_column >= 2:  # Jump up & left
-                self._players[player_name].add_captured_piece()
-                self.remove_piece_king(opponent_color, starting_row, starting_column, -1, -1)
-                return 1
-            elif starting_column - destination_column <= -2:  # Jump up & right
-                self._players[player_name].add_captured_piece()
-                self.remove_piece_king(opponent_color, starting_row, starting_column, -1, 1)
-                return 1
-        else:
-            return 0
+        row_distance = destination_row - starting_row
+        column_distance = destination_column - starting_column
+        if abs(row_distance) < 2 or abs(row_distance) != abs(column_distance):
+            return 0 #Not a diagonal move over at least one square
+        if self.remove_piece_king(opponent_color, starting_row, starting_column, row_distance // abs(row_distance),
+                                  column_distance // abs(column_distance), abs(row_distance) - 1):
+            self._players[player_name].add_captured_piece()
+            return 1
+        return 0
 
-    def remove_piece_king(self, opponent_color, starting_row, starting_column, row_direction, column_direction):
-        """Finds the piece to remove for king pieces, after it has been captured by the king."""
-        if self._current_board[starting_row+row_direction][starting_column+column_direction] == opponent_color:
-            self._current_board[starting_row + row_direction][starting_column + column_direction] = None
-            return
+    def remove_piece_king(self, opponent_color, starting_row, starting_column, row_direction, column_direction, \
+                          squares=7):
+        """
+        Finds the piece to remove for king pieces, after it has been captured by the king: the first of the
+        opponent's pieces (men, kings or triple kings) within squares squares of the starting location in the
+        direction given. Returns True if a piece was removed, or False if there is none.
+        """
+        row = starting_row + row_direction
+        column = starting_column + column_direction
+        if squares < 1 or row < 0 or row > 7 or column < 0 or column > 7:
+            return False
+        elif self._has_piece_of(opponent_color, row, column):
+            self._board.set(row, column, None)
+            return True
         else:
-            self.remove_piece_king(opponent_color, starting_row+row_direction, starting_column+column_direction, \
-                              row_direction, column_direction)
+            return self.remove_piece_king(opponent_color, row, column, row_direction, column_direction, squares - 1)
 
     def capture_piece_triple_king(self, player_name, checker_color, starting_row, starting_column, destination_row, \
                            destination_column):
         """
         Captures one or two pieces based on the rules for a triple king piece, and changes the square of the captured
-        piece(s) to None.
+        piece(s) to None. Returns the number of pieces captured.
         """
-        pieces_captured = 0
         if checker_color == "White":
             opponent_color = "Black"
         else:
             opponent_color = "White"
 
-        if starting_row - destination_row <= -2:
-            if starting_column - destination_column >= 2:  # Jump down & left
-                pieces_captured = self.remove_two_pieces(player_name, opponent_color, starting_row, starting_column,\
-                                                         1, -1)
-                return pieces_captured
-            elif starting_column - destination_column <= -2:  # Jump down & right
-                pieces_captured = self.remove_two_pieces(player_name, opponent_color, starting_row, starting_column,\
-                                                         1, 1)
-                return pieces_captured
-        elif starting_row - destination_row >= 2:
-            if starting_column - destination_column >= 2:  # Jump up & left
-                pieces_captured = self.remove_two_pieces(player_name, opponent_color, starting_row, starting_column,\
-                                                         -1, -1)
-                return pieces_captured
-            elif starting_column - destination_column <= -2:  # Jump up & right
-                pieces_captured = self.remove_two_pieces(player_name, opponent_color, starting_row, starting_column,\
-                                                         -1, 1)
-                return pieces_captured
-        else:
-            return 0
+        row_distance = destination_row - starting_row
+        column_distance = destination_column - starting_column
+        if abs(row_distance) < 2 or abs(row_distance) != abs(column_distance):
+            return 0 #Not a diagonal move over at least one square
+        return self.remove_two_pieces(player_name, opponent_color, starting_row, starting_column,
+                                      row_distance // abs(row_distance), column_distance // abs(column_distance),
+                                      abs(row_distance) - 1)
 
     def remove_two_pieces(self, player_name, opponent_color, starting_row, starting_column, row_direction, \
-                          column_direction):
+                          column_direction, squares=7):
         """
-        Checks to see if a triple king has captured two pieces in one move. If so, removes both pieces from the
-        game board.
+        Checks to see if a triple king has captured two pieces in one move. The first of the opponent's pieces within
+        squares squares of the starting location in the direction given is captured, and so is the piece right
+        behind it if that is also an opponent's piece within those squares. Removes the captured pieces from the game
+        board, adds them to the player's captured pieces and returns how many there were.
         """
-        if self._current_board[starting_row+row_direction][starting_column+column_direction] == opponent_color:
-            if self._current_board[starting_row+row_direction+row_direction]\
-                    [starting_column+column_direction+column_direction] == opponent_color:
-                self._current_board[starting_row+row_direction][starting_column+column_direction] = None
-                self._current_board[starting_row+row_direction+row_direction]\
-                    [starting_column+column_direction+column_direction] = None
-                self._players[player_name].add_captured_piece()
+        row = starting_row + row_direction
+        column = starting_column + column_direction
+        if squares < 1 or row < 0 or row > 7 or column < 0 or column > 7:
+            return 0
+        elif self._has_piece_of(opponent_color, row, column):
+            self._board.set(row, column, None)
+            self._players[player_name].add_captured_piece()
+            if squares > 1 and 0 <= row + row_direction <= 7 and 0 <= column + column_direction <= 7 and \
+                    self._has_piece_of(opponent_color, row + row_direction, column + column_direction):
+                self._board.set(row + row_direction, column + column_direction, None)
                 self._players[player_name].add_captured_piece()
                 return 2
-            else:
-                self._current_board[starting_row + row_direction][starting_column + column_direction] = None
-                self._players[player_name].add_captured_piece()
             return 1
         else:
-            self.remove_piece_king(player_name, opponent_color, starting_row+row_direction, \
-                                   starting_column+column_direction, row_direction, column_direction)
+            return self.remove_two_pieces(player_name, opponent_color, row, column, row_direction, column_direction,
+                                          squares - 1)
 
 #def main():
     #"""Runs the below code when called by this file only."""
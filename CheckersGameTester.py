@@ -3,8 +3,84 @@
 # Date: 03/15/2023
 # Description: Unit tests for CheckersGame program.
 
+import random
 import unittest
-from CheckersGame import InvalidSquare, OutofTurn, InvalidPlayer, Checkers, Player
+from CheckersGame import InvalidSquare, OutofTurn, InvalidPlayer, Checkers, Player, BitBoard, ListBoard, \
+    TranspositionTable, zobrist_hash, apply_change, encode_change, decode_change, SQUARE_LOCATIONS, ZOBRIST_KEYS, \
+    ZOBRIST_BLACK_TO_MOVE
+
+#The moves played in test_4 and test_5, as (player name, starting square, destination square)
+TRIPLE_KING_GAME = [
+    ("Ashley", (5, 0), (4, 1)),
+    ("Tiffany", (2, 1), (3, 2)),
+    ("Ashley", (4, 1), (3, 0)),
+    ("Tiffany", (1, 0), (2, 1)),
+    ("Ashley", (5, 6), (4, 7)),
+    ("Tiffany", (3, 2), (4, 3)),
+    ("Ashley", (5, 4), (3, 2)),
+    ("Ashley", (3, 2), (1, 0)),
+    ("Tiffany", (1, 2), (2, 1)),
+    ("Ashley", (3, 0), (1, 2)),
+    ("Tiffany", (0, 3), (2, 1)),
+    ("Ashley", (5, 2), (4, 3)),
+    ("Tiffany", (0, 1), (1, 2)),
+    ("Ashley", (1, 0), (0, 1)),
+    ("Tiffany", (2, 1), (3, 0)),
+    ("Ashley", (6, 1), (5, 2)),
+    ("Tiffany", (1, 2), (2, 1)),
+    ("Ashley", (0, 1), (3, 4)),
+    ("Tiffany", (2, 1), (3, 2)),
+    ("Ashley", (4, 3), (2, 1)),
+    ("Tiffany", (2, 7), (3, 6)),
+    ("Ashley", (3, 4), (4, 3)),
+    ("Tiffany", (1, 6), (2, 7)),
+    ("Ashley", (2, 1), (1, 0)),
+    ("Tiffany", (0, 5), (1, 6)),
+    ("Ashley", (1, 0), (0, 1)),
+    ("Tiffany", (3, 6), (4, 5)),
+    ("Ashley", (0, 1), (5, 6)),
+    ("Tiffany", (2, 7), (3, 6)),
+    ("Ashley", (6, 5), (5, 4)),
+    ("Tiffany", (3, 6), (4, 5)),
+    ("Ashley", (5, 4), (3, 6)),
+    ("Tiffany", (1, 6), (2, 7)),
+    ("Ashley", (4, 3), (1, 6)),
+    ("Tiffany", (0, 7), (2, 5)),
+    ("Ashley", (5, 6), (6, 5)),
+    ("Tiffany", (2, 5), (3, 4)),
+    ("Ashley", (6, 7), (5, 6)),
+    ("Tiffany", (2, 7), (4, 5)),
+    ("Tiffany", (4, 5), (6, 7)),
+    ("Ashley", (6, 3), (5, 4)),
+    ("Tiffany", (1, 4), (2, 5)),
+    ("Ashley", (7, 4), (6, 3)),
+    ("Tiffany", (2, 5), (3, 6)),
+    ("Ashley", (4, 7), (2, 5)),
+    ("Tiffany", (3, 4), (4, 3)),
+    ("Ashley", (6, 5), (7, 4)),
+    ("Tiffany", (4, 3), (6, 5)),
+    ("Ashley", (5, 2), (4, 3)),
+    ("Tiffany", (6, 7), (5, 6)),
+    ("Ashley", (7, 4), (4, 7)),
+    ("Tiffany", (3, 0), (4, 1)),
+    ("Ashley", (7, 0), (6, 1)),
+    ("Tiffany", (4, 1), (5, 2)),
+    ("Ashley", (6, 3), (4, 1))]
+
+def make_game(rows, bitboard=False):
+    """Returns a game between Ashley (Black) and Tiffany (White) set up with the given board rows."""
+    game = Checkers(bitboard)
+    game.create_player("Ashley", "Black")
+    game.create_player("Tiffany", "White")
+    if bitboard:
+        game._set_board(BitBoard(rows))
+    else:
+        game._set_board(ListBoard(rows))
+    return game
+
+def empty_rows():
+    """Returns an empty board as a list of rows."""
+    return [[None] * 8 for _ in range(8)]
 
 class TestCheckers(unittest.TestCase):
     """Contains unit tests for the Checkers function."""
@@ -180,3 +256,499 @@ class TestCheckers(unittest.TestCase):
         result = game.game_winner()
         self.assertEqual(result, "Ashley")
 
+    def test_6(self):
+        """Tests that a game on a bitboard gives the same results and board as a game on a list board."""
+        list_game = Checkers()
+        bitboard_game = Checkers(bitboard=True)
+        for game in (list_game, bitboard_game):
+            game.create_player("Ashley", "Black")
+            game.create_player("Tiffany", "White")
+        for player_name, starting_square, destination_square in TRIPLE_KING_GAME:
+            list_result = list_game.play_game(player_name, starting_square, destination_square)
+            bitboard_result = bitboard_game.play_game(player_name, starting_square, destination_square)
+            self.assertEqual(list_result, bitboard_result)
+            self.assertEqual(list_game._current_board, bitboard_game._current_board)
+        self.assertEqual(bitboard_game.get_checker_details((4, 7)), "Black_Triple_King")
+        self.assertEqual(bitboard_game.game_winner(), "Ashley")
+
+    def test_7(self):
+        """Tests that a bitboard game raises InvalidSquare for a move onto a light square and leaves the board as is."""
+        game = Checkers(bitboard=True)
+        game.create_player("Ashley", "Black")
+        game.create_player("Tiffany", "White")
+        self.assertRaises(InvalidSquare, game.play_game, "Ashley", (5, 0), (4, 0))
+        self.assertEqual(game.get_checker_details((5, 0)), "Black")
+        self.assertEqual(BitBoard().get_rows(), Checkers()._current_board)
+
+    def test_8(self):
+        """Tests the legal moves from the starting position for both players."""
+        game = Checkers()
+        game.create_player("Ashley", "Black")
+        game.create_player("Tiffany", "White")
+        black_moves = game.legal_moves("Ashley")
+        self.assertEqual(len(black_moves), 7)
+        self.assertIn(((5, 0), (4, 1)), black_moves)
+        self.assertEqual(len(game.legal_moves("Tiffany")), 7)
+        self.assertRaises(InvalidPlayer, game.legal_moves, "Nobody")
+
+    def test_9(self):
+        """Tests that captures are forced and that a man's capture sequence lists every landing square."""
+        rows = empty_rows()
+        rows[5][0] = "Black"
+        rows[4][1] = "White"
+        rows[2][3] = "White"
+        rows[7][6] = "Black"
+        for bitboard in (False, True):
+            game = make_game(rows, bitboard)
+            self.assertEqual(game.legal_moves("Ashley"), [((5, 0), (3, 2), (1, 4))])
+
+    def test_10(self):
+        """Tests that a triple king can jump two pieces in a row, ending its turn, and a king can't."""
+        rows = empty_rows()
+        rows[7][0] = "Black_Triple_King"
+        rows[5][2] = "White"
+        rows[4][3] = "White"
+        rows[2][5] = "White"
+        game = make_game(rows)
+        self.assertEqual(game.legal_moves("Ashley"), [((7, 0), (3, 4))])
+        rows[7][0] = "Black_king"
+        game = make_game(rows)
+        self.assertEqual(game.legal_moves("Ashley"), [((7, 0), (6, 1))])
+
+    def test_11(self):
+        """Tests that make_move plays a capture sequence like play_game does, and unmake_move undoes it."""
+        rows = empty_rows()
+        rows[5][0] = "Black"
+        rows[4][1] = "White"
+        rows[2][3] = "White"
+        rows[7][6] = "Black"
+        game = make_game(rows, True)
+        moves = game.get_moves()
+        self.assertEqual(game.make_move(moves[0]), 2)
+        self.assertEqual(game.get_checker_details((1, 4)), "Black")
+        self.assertEqual(game.get_checker_details((4, 1)), None)
+        self.assertEqual(game._players["Ashley"].get_captured_pieces_count(), 2)
+        self.assertEqual(game._player_turn, "White")
+        game.unmake_move()
+        self.assertEqual(game._current_board, rows)
+        self.assertEqual(game._players["Ashley"].get_captured_pieces_count(), 0)
+        self.assertEqual(game._player_turn, "Black")
+
+    def test_12(self):
+        """Tests that unmake_move restores the board and counts through a whole game of random moves."""
+        game = Checkers(bitboard=True)
+        player1 = game.create_player("Ashley", "Black")
+        player2 = game.create_player("Tiffany", "White")
+        random_moves = random.Random(12)
+        history = []
+        for _ in range(120):
+            moves = game.get_moves()
+            if not moves:
+                break
+            history.append((game._current_board, game._player_turn, player1.get_captured_pieces_count(),
+                            player2.get_king_count(), player1.get_triple_king_count()))
+            game.make_move(random_moves.choice(moves))
+        while history:
+            game.unmake_move()
+            self.assertEqual((game._current_board, game._player_turn, player1.get_captured_pieces_count(),
+                              player2.get_king_count(), player1.get_triple_king_count()), history.pop())
+        self.assertEqual(game._current_board, Checkers()._current_board)
+
+    def test_13(self):
+        """Tests that the position hash is kept up to date by play_game and make_move on both kinds of board."""
+        for bitboard in (False, True):
+            game = Checkers(bitboard)
+            game.create_player("Ashley", "Black")
+            game.create_player("Tiffany", "White")
+            start_hash = game.get_position_hash()
+            for player_name, starting_square, destination_square in TRIPLE_KING_GAME:
+                game.play_game(player_name, starting_square, destination_square)
+                self.assertEqual(game.get_position_hash(),
+                                 zobrist_hash(game._board.get_masks(), game._player_turn))
+            self.assertNotEqual(game.get_position_hash(), start_hash)
+            game = Checkers(bitboard)
+            game.create_player("Ashley", "Black")
+            game.create_player("Tiffany", "White")
+            game.make_move(game.get_moves()[0])
+            game.unmake_move()
+            self.assertEqual(game.get_position_hash(), start_hash)
+
+    def test_14(self):
+        """Tests storing and probing the transposition table, and that deeper entries are kept."""
+        table = TranspositionTable(8)
+        self.assertEqual(table.get_size(), 8)
+        self.assertIsNone(table.probe(5))
+        table.store(5, "deep", depth=6)
+        table.store(9, "shallow", depth=1)
+        table.store(13, "newest", depth=2)
+        self.assertEqual(table.probe(5)[3], "deep")
+        self.assertEqual(table.probe(13)[3], "newest")
+        self.assertIsNone(table.probe(9))
+        table.new_search()
+        table.store(9, "new search", depth=1)
+        self.assertEqual(table.probe(9)[3], "new search")
+        self.assertEqual(table.probe(5)[3], "deep")
+
+    def test_15(self):
+        """Tests that an observer applying the changes sent by play_game keeps an exact copy of the board."""
+        for bitboard in (False, True):
+            game = Checkers(bitboard)
+            player1 = game.create_player("Ashley", "Black")
+            player2 = game.create_player("Tiffany", "White")
+            observer_board = [list(row) for row in game._current_board]
+            observer_counts = {"Black": [0, 0, 0], "White": [0, 0, 0]}
+            changes = []
+            game.subscribe(changes.append)
+            for player_name, starting_square, destination_square in TRIPLE_KING_GAME:
+                game.play_game(player_name, starting_square, destination_square)
+                data = encode_change(changes[-1])
+                self.assertLessEqual(len(data), 12)
+                change = decode_change(data)
+                self.assertEqual(change, changes[-1])
+                apply_change(observer_board, change)
+                for index, delta in enumerate(change["counters"]):
+                    observer_counts[change["color"]][index] += delta
+                self.assertEqual(observer_board, game._current_board)
+                self.assertEqual(change["turn"], game._player_turn)
+            self.assertEqual(len(changes), len(TRIPLE_KING_GAME))
+            self.assertEqual(observer_counts["Black"], [player1.get_captured_pieces_count(),
+                                                        player1.get_king_count(), player1.get_triple_king_count()])
+            self.assertEqual(observer_counts["White"], [player2.get_captured_pieces_count(),
+                                                        player2.get_king_count(), player2.get_triple_king_count()])
+            self.assertTrue(any(change["promoted"] for change in changes))
+
+    def test_16(self):
+        """Tests the changes sent by make_move and unmake_move, and that unsubscribed observers get nothing."""
+        rows = empty_rows()
+        rows[1][2] = "Black"
+        rows[2][3] = "White"
+        game = make_game(rows)
+        changes = []
+        callback = game.subscribe(changes.append)
+        game.make_move(game.get_moves()[0])
+        self.assertEqual(changes[-1], {"color": "Black", "vacated": [(1, 2)], "captured": [],
+                                       "placed": [((0, 1), "Black_king")], "promoted": [((0, 1), "Black_king")],
+                                       "turn": "White", "turn_changed": True, "counters": (0, 1, 0)})
+        game.unmake_move()
+        self.assertEqual(changes[-1]["vacated"], [(0, 1)])
+        self.assertEqual(changes[-1]["placed"], [((1, 2), "Black")])
+        self.assertEqual(changes[-1]["counters"], (0, -1, 0))
+        game.unsubscribe(callback)
+        game.make_move(game.get_moves()[0])
+        self.assertEqual(len(changes), 2)
+
+    def test_17(self):
+        """Tests that games, players and boards store their attributes in slots instead of a dictionary."""
+        for bitboard in (False, True):
+            game = Checkers(bitboard)
+            player = game.create_player("Ashley", "Black")
+            for item in (game, player, game._board, TranspositionTable(8)):
+                self.assertFalse(hasattr(item, "__dict__"))
+            with self.assertRaises(AttributeError):
+                game.unknown_attribute = 1
+
+    def test_18(self):
+        """Tests that snapshots are fixed-size bytes that restore the game, and that a fork is independent."""
+        for bitboard in (False, True):
+            game = Checkers(bitboard)
+            player1 = game.create_player("Ashley", "Black")
+            game.create_player("Tiffany", "White")
+            sizes = set()
+            for player_name, starting_square, destination_square in TRIPLE_KING_GAME:
+                game.play_game(player_name, starting_square, destination_square)
+                blob = game.snapshot()
+                self.assertIsInstance(blob, bytes)
+                sizes.add(len(blob))
+            self.assertEqual(sizes, {38})
+            restored = Checkers.restore(blob, ("Ashley", "Tiffany"))
+            self.assertEqual(restored.snapshot(), blob)
+            self.assertEqual(restored._current_board, game._current_board)
+            self.assertEqual(restored.get_position_hash(), game.get_position_hash())
+            self.assertEqual(restored._players["Ashley"].get_triple_king_count(), player1.get_triple_king_count())
+            game = make_game(Checkers()._current_board, bitboard)
+            for player_name, starting_square, destination_square in TRIPLE_KING_GAME[:10]:
+                game.play_game(player_name, starting_square, destination_square)
+            blob = game.snapshot()
+            fork = game.fork()
+            self.assertEqual(fork.snapshot(), blob)
+            fork.make_move(fork.get_moves()[0])
+            fork._players["Ashley"].add_king()
+            self.assertEqual(game.snapshot(), blob)
+            fork.unmake_move()
+            self.assertEqual(fork._current_board, game._current_board)
+        self.assertEqual(Checkers.restore(Checkers().snapshot())._players, {})
+
+    def test_19(self):
+        """Tests that a strict game turns down moves that break the rules and plays legal moves hop by hop."""
+        rows = empty_rows()
+        rows[5][0] = "Black"
+        rows[6][5] = "Black"
+        rows[4][1] = "White"
+        rows[2][3] = "White"
+        game = make_game(rows)
+        game._strict = True
+        with self.assertRaises(InvalidSquare):
+            game.play_game("Ashley", (6, 5), (5, 4)) #a capture is possible, so it is forced
+        with self.assertRaises(InvalidSquare):
+            game.play_game("Ashley", (5, 0), (4, 1)) #can't move onto a piece
+        with self.assertRaises(InvalidSquare):
+            game.play_game("Ashley", (5, 0), (6, 1)) #men don't move backwards
+        with self.assertRaises(OutofTurn):
+            game.play_game("Tiffany", (2, 3), (3, 4))
+        with self.assertRaises(InvalidPlayer):
+            game.play_game("Nobody", (5, 0), (3, 2))
+        self.assertEqual(game.play_game("Ashley", (5, 0), (3, 2)), 1)
+        self.assertEqual(game._player_turn, "Black") #the capture sequence continues
+        with self.assertRaises(InvalidSquare):
+            game.play_game("Ashley", (6, 5), (5, 4)) #only the capturing piece can go on
+        self.assertEqual(game.play_game("Ashley", (3, 2), (1, 4)), 1)
+        self.assertEqual(game._player_turn, "White")
+        self.assertEqual(game._players["Ashley"].get_captured_pieces_count(), 2)
+
+    def test_20(self):
+        """Tests that strict games played hop by hop end the same as make_move on random legal moves."""
+        random_moves = random.Random(16)
+        for game_number in range(30):
+            game = Checkers(bitboard=game_number % 2 == 0, strict=True)
+            game.create_player("Ashley", "Black")
+            game.create_player("Tiffany", "White")
+            reference = Checkers(bitboard=True)
+            reference.create_player("Ashley", "Black")
+            reference.create_player("Tiffany", "White")
+            for ply in range(150):
+                moves = reference.get_moves()
+                if not moves:
+                    break
+                move = random_moves.choice(moves)
+                player_name = "Ashley" if reference._player_turn == "Black" else "Tiffany"
+                captured = 0
+                for starting_square, destination_square in zip(move[0], move[0][1:]):
+                    captured += game.play_game(player_name, SQUARE_LOCATIONS[starting_square],
+                                               SQUARE_LOCATIONS[destination_square])
+                self.assertEqual(captured, reference.make_move(move))
+                self.assertEqual(game._current_board, reference._current_board)
+                self.assertEqual(game._player_turn, reference._player_turn)
+            for player_name in ("Ashley", "Tiffany"):
+                self.assertEqual(game._players[player_name].get_king_count(),
+                                 reference._players[player_name].get_king_count())
+
+    def test_21(self):
+        """Tests that play_game records phase timings, calls and rejected moves once metrics are enabled."""
+        game = Checkers()
+        game.create_player("Ashley", "Black")
+        game.create_player("Tiffany", "White")
+        game.play_game("Ashley", (5, 0), (4, 1))
+        registry = game.enable_metrics()
+        for player_name, starting_square, destination_square in TRIPLE_KING_GAME[1:7]:
+            game.play_game(player_name, starting_square, destination_square)
+        with self.assertRaises(OutofTurn):
+            game.play_game("Tiffany", (2, 7), (3, 6)) #Ashley's capture sequence isn't over
+        with self.assertRaises(InvalidSquare):
+            game.play_game("Ashley", (3, 2), (8, 8))
+        game.disable_metrics()
+        game.play_game(*TRIPLE_KING_GAME[7])
+        metrics = registry.to_dict()
+        self.assertEqual(metrics["counts"], {"play_game": 8, "pieces_captured": 1})
+        self.assertEqual(metrics["exceptions"], {"OutofTurn": 1, "InvalidSquare": 1})
+        for phase in ("play_game", "validate", "move_piece", "capture", "continuation", "turn", "promotion"):
+            self.assertEqual(metrics["timings"][phase]["count"], 6)
+        self.assertIn('checkers_exceptions_total{exception="OutofTurn"} 1', registry.to_prometheus())
+        self.assertEqual(game._players["Ashley"].get_captured_pieces_count(), 2)
+
+    def test_22(self):
+        """Tests the starting masks and hash, the live piece counts, the cached game_winner and a win by no move."""
+        for bitboard in (False, True):
+            game = Checkers(bitboard)
+            game.create_player("Ashley", "Black")
+            game.create_player("Tiffany", "White")
+            self.assertEqual(game.get_piece_counts("White"), (12, 0, 0))
+            #a new game starts from the precomputed masks and hash, which match a scan of its board
+            self.assertEqual(game._board.get_masks(), BitBoard(game._current_board).get_masks())
+            self.assertEqual(game._history, [zobrist_hash(game._board.get_masks(), "Black")])
+            for player_name, starting_square, destination_square in TRIPLE_KING_GAME:
+                self.assertFalse(game.is_game_over())
+                game.play_game(player_name, starting_square, destination_square)
+                for checker_color in ("Black", "White"):
+                    self.assertEqual(game.get_piece_counts(checker_color),
+                                     tuple(sum(row.count(checker_color + suffix) for row in game._current_board)
+                                           for suffix in ("", "_king", "_Triple_King")))
+            self.assertEqual(game.get_piece_counts("White"), (0, 0, 0))
+            self.assertIs(game.game_winner(), game.game_winner())
+            self.assertTrue(game.is_game_over())
+        rows = [[None] * 8 for _ in range(8)]
+        rows[6][1] = "White"
+        rows[7][0] = "Black"
+        rows[7][2] = "Black"
+        for player_turn in ("Black", "White"):
+            game = Checkers()
+            game.create_player("Ashley", "Black")
+            game.create_player("Tiffany", "White")
+            game._set_board(ListBoard(rows), player_turn)
+            if player_turn == "Black":
+                self.assertEqual(game.game_winner(), "Game has not ended")
+                self.assertEqual(game.play_game("Ashley", (7, 0), (5, 2)), 1)
+                self.assertEqual(game.get_piece_counts("White"), (0, 0, 0))
+            self.assertEqual(game.game_winner(), "Ashley") #White has no pieces, or can't move
+
+    def test_23(self):
+        """Tests that kings shuffling back and forth draw by repetition, or by the move limit if it comes first."""
+        rows = [[None] * 8 for _ in range(8)]
+        rows[4][1] = "Black_king"
+        rows[1][6] = "White_king"
+        shuffle = [("Ashley", (4, 1), (3, 2)), ("Tiffany", (1, 6), (2, 5)), ("Ashley", (3, 2), (4, 1)),
+                   ("Tiffany", (2, 5), (1, 6))]
+        for draw_move_limit, moves_to_draw in ((None, 8), (5, 5)):
+            game = Checkers(draw_move_limit=draw_move_limit)
+            game.create_player("Ashley", "Black")
+            game.create_player("Tiffany", "White")
+            game._set_board(ListBoard(rows))
+            for move_number in range(moves_to_draw):
+                self.assertEqual(game.game_winner(), "Game has not ended")
+                game.play_game(*shuffle[move_number % 4])
+            self.assertEqual(game.game_winner(), "Draw")
+            self.assertTrue(game.fork().is_game_over())
+        game = Checkers(bitboard=True)
+        game._set_board(BitBoard(rows))
+        for move_number in range(8):
+            self.assertEqual(game.game_winner(), "Game has not ended")
+            move = [move for move in game.get_moves() if move[0][-1] == SQUARE_LOCATIONS.index(
+                shuffle[move_number % 4][2])][0]
+            game.make_move(move)
+        self.assertEqual(game.game_winner(), "Draw")
+        game.unmake_move()
+        self.assertEqual(game.game_winner(), "Game has not ended")
+        game._board.set(6, 1, "Black") #a man moving starts the count again
+        game._player_turn = "Black"
+        game.make_move(([SQUARE_LOCATIONS.index((6, 1)), SQUARE_LOCATIONS.index((5, 0))], ()))
+        self.assertEqual(game._quiet_moves, 0)
+        game._set_board(BitBoard(rows), "Black") #a new board starts the history for draws again
+        self.assertEqual((game._history, game._quiet_moves, game._undo_stack),
+                         ([game.get_position_hash()], 0, []))
+
+    def test_24(self):
+        """Tests that the Zobrist keys are the numbers random.Random gives for their seed, as before startup changes."""
+        key_random = random.Random(20230315)
+        self.assertEqual(ZOBRIST_KEYS, tuple(tuple(key_random.getrandbits(64) for square in range(32))
+                                             for code in range(6)))
+        self.assertEqual(ZOBRIST_BLACK_TO_MOVE, key_random.getrandbits(64))
+
+    def test_25(self):
+        """
+        Tests that legal_moves played hop by hop with play_game, in games that aren't strict, end the same as
+        make_move, until kings have been captured.
+        """
+        random_moves = random.Random(25)
+        kings_captured = 0
+        game_number = 0
+        while kings_captured < 3:
+            game = Checkers(bitboard=game_number % 2 == 1)
+            game.create_player("Ashley", "Black")
+            game.create_player("Tiffany", "White")
+            reference = Checkers(bitboard=True)
+            reference.create_player("Ashley", "Black")
+            reference.create_player("Tiffany", "White")
+            game_number += 1
+            for ply in range(150):
+                player_name = "Ashley" if game._player_turn == "Black" else "Tiffany"
+                moves = game.legal_moves(player_name)
+                if not moves:
+                    break
+                locations = random_moves.choice(moves)
+                move = [move for move in reference.get_moves()
+                        if tuple(SQUARE_LOCATIONS[square] for square in move[0]) == locations][0]
+                for square in move[1]:
+                    if reference._board.get_square(square).endswith(("_king", "_Triple_King")):
+                        kings_captured += 1
+                captured = 0
+                for starting_square, destination_square in zip(locations, locations[1:]):
+                    captured += game.play_game(player_name, starting_square, destination_square)
+                self.assertEqual(captured, reference.make_move(move))
+                self.assertEqual(game._current_board, reference._current_board)
+                self.assertEqual(game._player_turn, reference._player_turn)
+
+    def test_26(self):
+        """
+        Tests that an unknown player raises InvalidPlayer with or without metrics and strict rules, and that a strict
+        game records the same phase timings.
+        """
+        for strict in (False, True):
+            game = Checkers(strict=strict)
+            game.create_player("Ashley", "Black")
+            game.create_player("Tiffany", "White")
+            self.assertRaises(InvalidPlayer, game.play_game, "Nobody", (5, 0), (4, 1))
+            registry = game.enable_metrics()
+            self.assertRaises(InvalidPlayer, game.play_game, "Nobody", (5, 0), (4, 1))
+            for player_name, starting_square, destination_square in TRIPLE_KING_GAME[:7]:
+                game.play_game(player_name, starting_square, destination_square)
+            metrics = registry.to_dict()
+            self.assertEqual(metrics["exceptions"], {"InvalidPlayer": 1})
+            self.assertEqual(metrics["counts"], {"play_game": 8, "pieces_captured": 1})
+            for phase in ("play_game", "validate", "move_piece", "capture", "continuation", "turn", "promotion"):
+                self.assertEqual(metrics["timings"][phase]["count"], 7)
+            self.assertEqual(metrics["timings"]["history"]["count"], 6)
+
+    def test_27(self):
+        """
+        Tests that the position after a man moves counts towards a draw by repetition on a list board, where
+        play_game doesn't work out its hash, when kings then shuffle back to it with play_game or make_move.
+        """
+        rows = empty_rows()
+        rows[4][1] = "Black_king"
+        rows[1][6] = "White_king"
+        rows[6][7] = "Black"
+        shuffle = [("Tiffany", (1, 6), (2, 5)), ("Ashley", (4, 1), (3, 2)), ("Tiffany", (2, 5), (1, 6)),
+                   ("Ashley", (3, 2), (4, 1))]
+        for first_move_made in (False, True):
+            game = make_game(rows)
+            game.play_game("Ashley", (6, 7), (5, 6))
+            self.assertEqual(game.get_position_hash(), zobrist_hash(game._board.get_masks(), "White"))
+            for move_number in range(8):
+                self.assertEqual(game.game_winner(), "Game has not ended")
+                player_name, starting_square, destination_square = shuffle[move_number % 4]
+                if first_move_made and move_number == 0:
+                    game.make_move(([SQUARE_LOCATIONS.index(starting_square),
+                                     SQUARE_LOCATIONS.index(destination_square)], ()))
+                else:
+                    game.play_game(player_name, starting_square, destination_square)
+                self.assertEqual(game.get_position_hash(),
+                                 zobrist_hash(game._board.get_masks(), game._player_turn))
+            self.assertEqual(game._quiet_moves, 8)
+            self.assertEqual(game.game_winner(), "Draw")
+
+    def test_28(self):
+        """Tests that the winner cached by game_winner is worked out again once players are created."""
+        rows = empty_rows()
+        rows[4][1] = "Black_king"
+        game = Checkers()
+        game._set_board(ListBoard(rows))
+        self.assertEqual(game.game_winner(), "Black") #White has no pieces, and Black has no player yet
+        game.create_player("Ashley", "Black")
+        self.assertEqual(game.game_winner(), "Ashley")
+
+    def test_29(self):
+        """
+        Tests that the Zobrist keys are the ones saved position databases, opening books and tablebases were written
+        with.
+        """
+        self.assertEqual(ZOBRIST_KEYS[0][0], 15728625238818286047)
+        self.assertEqual(ZOBRIST_KEYS[5][31], 2575670683763290052)
+        self.assertEqual(ZOBRIST_BLACK_TO_MOVE, 11826097693515792920)
+
+    def test_30(self):
+        """Tests the accessors for players, whose turn it is, the board and its masks, and that they return copies."""
+        for bitboard in (False, True):
+            game = Checkers(bitboard)
+            ashley = game.create_player("Ashley", "Black")
+            game.create_player("Tiffany", "White")
+            self.assertIs(game.get_player("Ashley"), ashley)
+            self.assertIsNone(game.get_player("Nobody"))
+            self.assertEqual(game.get_player_turn(), "Black")
+            game.play_game("Ashley", (5, 0), (4, 1))
+            self.assertEqual(game.get_player_turn(), "White")
+            board = game.get_board()
+            self.assertEqual(board[4][1], "Black")
+            self.assertEqual(game.get_masks(), BitBoard(board).get_masks())
+            board[4][1] = None
+            game.get_masks()[0] = 0
+            self.assertEqual(game.get_checker_details((4, 1)), "Black")
+            self.assertEqual(game.get_piece_counts("Black"), (12, 0, 0))
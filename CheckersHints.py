@@ -0,0 +1,127 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Move hints for Checkers games, kept in a size-bounded cache shared between games.
+
+import collections
+import time
+from CheckersGame import InvalidSquare, SQUARE_GRID, SQUARE_LOCATIONS
+
+class HintCache:
+    """
+    Keeps hints keyed by position hash, so the same position asked about in any game is only analysed once. Holds at
+    most max_size entries and drops the least recently used one to make room. If ttl is given, entries older than
+    ttl seconds (by clock) are worked out again. Counts hits, misses, evictions and expired entries (see get_stats),
+    and also adds them to a CheckersMetrics.MetricsRegistry if one is given.
+    """
+
+    def __init__(self, max_size=4096, ttl=None, metrics=None, clock=time.monotonic):
+        self._entries = collections.OrderedDict() #key: (value, time stored)
+        self._max_size = max_size
+        self._ttl = ttl
+        self._metrics = metrics
+        self._clock = clock
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _count(self, name):
+        """Adds one to the named statistic, and to the metrics registry if there is one."""
+        self._stats[name] += 1
+        if self._metrics is not None:
+            self._metrics.increment("hint_cache_" + name)
+
+    def get(self, key, compute):
+        """Returns the value kept for the key, or calls compute() for it and keeps the result."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            if self._ttl is None or self._clock() - entry[1] <= self._ttl:
+                self._entries.move_to_end(key)
+                self._count("hits")
+                return entry[0]
+            del self._entries[key]
+            self._count("expired")
+        self._count("misses")
+        value = compute()
+        self._entries[key] = (value, self._clock() if self._ttl is not None else 0)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._count("evictions")
+        return value
+
+    def clear(self):
+        """Drops every entry. The statistics are kept."""
+        self._entries.clear()
+
+    def get_stats(self):
+        """Returns the hits, misses, evictions, expired entries and current size as a dictionary."""
+        return dict(self._stats, size=len(self._entries))
+
+#The cache used by Checkers.get_hint and Checkers.get_destinations when they aren't given one
+DEFAULT_HINT_CACHE = HintCache()
+
+def _destinations(game):
+    """
+    Returns a dictionary from each starting square of the player to move's legal moves to the list of square
+    locations its first hop can land on, in the order of get_moves.
+    """
+    destinations = {}
+    for path, captured in game.get_moves():
+        squares = destinations.setdefault(path[0], [])
+        if SQUARE_LOCATIONS[path[1]] not in squares:
+            squares.append(SQUARE_LOCATIONS[path[1]])
+    return destinations
+
+def get_destinations(game, starting_square_location, cache=None):
+    """
+    Returns the list of square locations the piece on the starting square location can move to next with play_game,
+    for the player whose turn it is: every legal simple move or first jump of a legal capture sequence. The list is
+    empty if there is no piece of theirs there or it can't move. Raises InvalidSquare if the location isn't on the
+    board. The destinations of every square are worked out together once per position and kept in cache
+    (DEFAULT_HINT_CACHE if None).
+    """
+    row, column = starting_square_location
+    if not (0 <= row <= 7 and 0 <= column <= 7):
+        raise InvalidSquare
+    if cache is None:
+        cache = DEFAULT_HINT_CACHE
+    destinations = cache.get((game.get_position_hash(), "destinations"), lambda: _destinations(game))
+    return list(destinations.get(SQUARE_GRID[row][column], ()))
+
+#One engine searches every hint, so its transposition table and history carry over between positions
+_hint_engine = None
+
+def _best_move(game, time_budget_ms, max_depth):
+    """Searches the game's position with the engine and returns the best move's path, or None if there is none."""
+    global _hint_engine
+    from CheckersEngine import Engine, pack_position, unpack_position
+    search_game = unpack_position(pack_position(game))
+    root_moves = search_game.get_moves()
+    if not root_moves:
+        return None
+    best_move = root_moves[0]
+    if len(root_moves) > 1:
+        if _hint_engine is None:
+            _hint_engine = Engine(None, None)
+        results = _hint_engine.search_root_moves(search_game, root_moves, max_depth,
+                                                  time.perf_counter() + time_budget_ms / 1000)
+        if results:
+            best_move = results[-1][2]
+    return best_move[0]
+
+def get_hint(game, time_budget_ms=100, max_depth=64, cache=None):
+    """
+    Returns the best move for the player whose turn it is, as a tuple of square locations in the same form as
+    Checkers.legal_moves, or None if they have no legal move. The position is searched by the engine for at most
+    time_budget_ms milliseconds and max_depth moves ahead the first time, and the hint is kept in cache
+    (DEFAULT_HINT_CACHE if None). The budget and depth are part of the cache key, so a quick hint isn't given for a
+    later, longer search of the same position.
+    """
+    if cache is None:
+        cache = DEFAULT_HINT_CACHE
+    path = cache.get((game.get_position_hash(), "best_move", time_budget_ms, max_depth),
+                     lambda: _best_move(game, time_budget_ms, max_depth))
+    if path is None:
+        return None
+    return tuple(SQUARE_LOCATIONS[square] for square in path)
@@ -0,0 +1,67 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Unit tests for the CheckersHints program.
+
+import unittest
+from CheckersGame import Checkers, BitBoard, InvalidSquare, SNAPSHOT
+from CheckersHints import HintCache
+from CheckersMetrics import MetricsRegistry
+
+class TestHints(unittest.TestCase):
+    """Contains unit tests for move hints and the hint cache."""
+
+    def test_1(self):
+        """Tests legal destinations and best move hints, and that asking again comes from the cache."""
+        registry = MetricsRegistry()
+        cache = HintCache(metrics=registry)
+        game = Checkers()
+        game.create_player("Ashley", "Black")
+        game.create_player("Tiffany", "White")
+        self.assertEqual(game.get_destinations((5, 2), cache), [(4, 1), (4, 3)])
+        self.assertEqual(game.get_destinations((6, 1), cache), [])
+        self.assertEqual(game.get_destinations((2, 1), cache), []) #White's piece, and it is Black's turn
+        with self.assertRaises(InvalidSquare):
+            game.get_destinations((8, 1), cache)
+        self.assertEqual(cache.get_stats(), {"hits": 2, "misses": 1, "evictions": 0, "expired": 0, "size": 1})
+        game.play_game("Ashley", (5, 0), (4, 1))
+        game.play_game("Tiffany", (2, 3), (3, 2))
+        self.assertEqual(game.get_destinations((4, 1), cache), [(2, 3)]) #the capture is forced
+        self.assertEqual(game.get_destinations((5, 2), cache), [])
+        hint = game.get_hint(time_budget_ms=100, max_depth=4, cache=cache)
+        self.assertEqual(hint, ((4, 1), (2, 3)))
+        other_game = Checkers(bitboard=True)
+        other_game.create_player("Ashley", "Black")
+        other_game.create_player("Tiffany", "White")
+        other_game.play_game("Ashley", (5, 0), (4, 1))
+        other_game.play_game("Tiffany", (2, 3), (3, 2))
+        self.assertEqual(other_game.get_hint(time_budget_ms=100, max_depth=4, cache=cache), hint)
+        self.assertEqual(registry.to_dict()["counts"], {"hint_cache_hits": 4, "hint_cache_misses": 3})
+        other_game.get_hint(time_budget_ms=100, max_depth=2, cache=cache) #a shallower search isn't the same hint
+        other_game.get_hint(time_budget_ms=1000, max_depth=4, cache=cache) #nor is a longer one
+        self.assertEqual(registry.to_dict()["counts"], {"hint_cache_hits": 4, "hint_cache_misses": 5})
+
+    def test_2(self):
+        """Tests that the cache drops the least recently used entry when full, and entries older than the ttl."""
+        now = [0.0]
+        cache = HintCache(max_size=2, ttl=10, clock=lambda: now[0])
+        self.assertEqual(cache.get(1, lambda: "one"), "one")
+        self.assertEqual(cache.get(2, lambda: "two"), "two")
+        self.assertEqual(cache.get(1, lambda: "changed"), "one")
+        cache.get(3, lambda: "three")
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(2, lambda: "two again"), "two again") #2 was dropped, not 1
+        now[0] = 5.0
+        self.assertEqual(cache.get(2, lambda: "later"), "two again")
+        now[0] = 20.0
+        self.assertEqual(cache.get(2, lambda: "later"), "later")
+        self.assertEqual(cache.get_stats(), {"hits": 2, "misses": 5, "evictions": 2, "expired": 1, "size": 2})
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        rows = [[None] * 8 for _ in range(8)]
+        rows[0][1] = "White"
+        game = Checkers.restore(SNAPSHOT.pack(*BitBoard(rows).get_masks(), b"B", 0, 0, 0, 0, 0, 0, 0))
+        self.assertIsNone(game.get_hint(cache=cache)) #Black has no pieces to move
+
+if __name__ == '__main__':
+    unittest.main()
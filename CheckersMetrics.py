@@ -0,0 +1,98 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: A registry of timings and counts recorded by Checkers games, exported as Prometheus text or JSON.
+
+import json
+
+#Upper bounds in seconds of the timing histogram buckets. Every timing also counts towards the last, unbounded
+#bucket, which is the timing's count.
+TIMING_BUCKETS = (0.000001, 0.00001, 0.0001, 0.001, 0.01, 0.1)
+
+class MetricsRegistry:
+    """
+    Collects timings of named phases, counts of named events and counts of exceptions by name. One registry can be
+    shared by any number of games (see Checkers.enable_metrics). Each timing keeps its count, total and largest
+    value and a histogram over TIMING_BUCKETS.
+    """
+
+    def __init__(self):
+        self._timings = {} #name: [count, total seconds, largest seconds, bucket counts...]
+        self._counts = {}
+        self._exceptions = {}
+
+    def observe(self, name, seconds):
+        """Records one timing of the named phase."""
+        timing = self._timings.get(name)
+        if timing is None:
+            timing = [0, 0.0, 0.0] + [0] * len(TIMING_BUCKETS)
+            self._timings[name] = timing
+        timing[0] += 1
+        timing[1] += seconds
+        if seconds > timing[2]:
+            timing[2] = seconds
+        for index, bound in enumerate(TIMING_BUCKETS):
+            if seconds <= bound:
+                timing[3 + index] += 1
+
+    def lap(self, name, start_time, now):
+        """Records the time from start_time to now (time.perf_counter values) for the named phase and returns now."""
+        self.observe(name, now - start_time)
+        return now
+
+    def increment(self, name, amount=1):
+        """Adds to the named count."""
+        self._counts[name] = self._counts.get(name, 0) + amount
+
+    def count_exception(self, name):
+        """Adds one to the count of the named exception."""
+        self._exceptions[name] = self._exceptions.get(name, 0) + 1
+
+    def reset(self):
+        """Forgets everything recorded so far."""
+        self._timings.clear()
+        self._counts.clear()
+        self._exceptions.clear()
+
+    def to_dict(self):
+        """
+        Returns everything recorded as a dictionary with "timings" (name: dictionary of "count", "total_seconds",
+        "max_seconds" and "buckets", a list of [bound, count] pairs), "counts" and "exceptions".
+        """
+        timings = {}
+        for name, timing in self._timings.items():
+            timings[name] = {"count": timing[0], "total_seconds": timing[1], "max_seconds": timing[2],
+                             "buckets": [[bound, count] for bound, count in zip(TIMING_BUCKETS, timing[3:])]}
+        return {"timings": timings, "counts": dict(self._counts), "exceptions": dict(self._exceptions)}
+
+    def to_json(self):
+        """Returns to_dict as a JSON string."""
+        return json.dumps(self.to_dict())
+
+    def to_prometheus(self, prefix="checkers"):
+        """
+        Returns everything recorded in the Prometheus text exposition format: a histogram prefix_phase_seconds with a
+        phase label, a counter prefix_events_total with an event label and a counter prefix_exceptions_total with an
+        exception label.
+        """
+        lines = []
+        if self._timings:
+            lines.append("# HELP " + prefix + "_phase_seconds Time spent in each phase of a move.")
+            lines.append("# TYPE " + prefix + "_phase_seconds histogram")
+            for name, timing in sorted(self._timings.items()):
+                for bound, count in zip(TIMING_BUCKETS, timing[3:]):
+                    lines.append('%s_phase_seconds_bucket{phase="%s",le="%r"} %d' % (prefix, name, bound, count))
+                lines.append('%s_phase_seconds_bucket{phase="%s",le="+Inf"} %d' % (prefix, name, timing[0]))
+                lines.append('%s_phase_seconds_sum{phase="%s"} %r' % (prefix, name, timing[1]))
+                lines.append('%s_phase_seconds_count{phase="%s"} %d' % (prefix, name, timing[0]))
+        if self._counts:
+            lines.append("# HELP " + prefix + "_events_total Number of times each event happened.")
+            lines.append("# TYPE " + prefix + "_events_total counter")
+            for name, count in sorted(self._counts.items()):
+                lines.append('%s_events_total{event="%s"} %d' % (prefix, name, count))
+        if self._exceptions:
+            lines.append("# HELP " + prefix + "_exceptions_total Number of moves turned down, by exception.")
+            lines.append("# TYPE " + prefix + "_exceptions_total counter")
+            for name, count in sorted(self._exceptions.items()):
+                lines.append('%s_exceptions_total{exception="%s"} %d' % (prefix, name, count))
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,45 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Unit tests for CheckersMetrics program.
+
+import json
+import unittest
+from CheckersMetrics import MetricsRegistry
+
+class TestCheckersMetrics(unittest.TestCase):
+    """Contains unit tests for the MetricsRegistry class."""
+
+    def test_1(self):
+        """Tests that timings are counted into the right histogram buckets and exported as Prometheus text."""
+        registry = MetricsRegistry()
+        registry.observe("capture", 0.0000005)
+        registry.observe("capture", 0.005)
+        self.assertEqual(registry.lap("promotion", 1.0, 1.5), 1.5)
+        registry.increment("play_game", 3)
+        registry.count_exception("OutofTurn")
+        text = registry.to_prometheus()
+        self.assertIn("# TYPE checkers_phase_seconds histogram", text)
+        self.assertIn('checkers_phase_seconds_bucket{phase="capture",le="1e-06"} 1', text)
+        self.assertIn('checkers_phase_seconds_bucket{phase="capture",le="0.01"} 2', text)
+        self.assertIn('checkers_phase_seconds_bucket{phase="promotion",le="0.1"} 0', text)
+        self.assertIn('checkers_phase_seconds_count{phase="promotion"} 1', text)
+        self.assertIn('checkers_events_total{event="play_game"} 3', text)
+        self.assertIn('checkers_exceptions_total{exception="OutofTurn"} 1', text)
+
+    def test_2(self):
+        """Tests the JSON export and reset."""
+        registry = MetricsRegistry()
+        registry.observe("validate", 0.25)
+        registry.increment("play_game")
+        metrics = json.loads(registry.to_json())
+        self.assertEqual(metrics["timings"]["validate"]["count"], 1)
+        self.assertEqual(metrics["timings"]["validate"]["max_seconds"], 0.25)
+        self.assertEqual(metrics["counts"], {"play_game": 1})
+        self.assertEqual(metrics["exceptions"], {})
+        registry.reset()
+        self.assertEqual(registry.to_dict(), {"timings": {}, "counts": {}, "exceptions": {}})
+        self.assertEqual(registry.to_prometheus(), "\n")
+
+if __name__ == '__main__':
+    unittest.main()
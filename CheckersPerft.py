@@ -0,0 +1,126 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Counts the positions reachable from a Checkers position (perft), to check and time move generation.
+
+import argparse
+import json
+import os
+import time
+from CheckersGame import Checkers, TranspositionTable, SQUARE_LOCATIONS, generate_moves, apply_move, \
+    zobrist_hash
+
+def perft(masks, checker_color, depth, table=None):
+    """
+    Returns the number of positions reached after depth moves (plies) from the position given by the six board masks
+    and the color to move. A whole capture sequence is one move. If a TranspositionTable is given, the count of each
+    subtree is stored under the position's hash, so subtrees reached by different move orders are counted once.
+    """
+    if depth == 0:
+        return 1
+    moves = generate_moves(masks, checker_color)
+    if depth == 1:
+        return len(moves)
+    if table is not None:
+        position_hash = zobrist_hash(masks, checker_color)
+        entry = table.probe(position_hash)
+        if entry is not None and entry[1] == depth:
+            return entry[3]
+    next_color = "White" if checker_color == "Black" else "Black"
+    nodes = 0
+    for move in moves:
+        new_masks = list(masks)
+        apply_move(new_masks, move)
+        nodes += perft(new_masks, next_color, depth - 1, table)
+    if table is not None:
+        table.store(position_hash, nodes, depth)
+    return nodes
+
+def perft_game(game, depth):
+    """
+    Returns the same count as perft for the game's current position, but plays the moves on the game itself with
+    make_move and unmake_move. Comparing the two checks the game's board classes against the move generator.
+    """
+    if depth == 0:
+        return 1
+    moves = game.get_moves()
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        game.make_move(move)
+        try:
+            nodes += perft_game(game, depth - 1)
+        finally:
+            game.unmake_move()
+    return nodes
+
+def _perft_child(masks, checker_color, move, depth, table_size):
+    """Plays the move and counts the positions depth - 1 moves after it. Runs in a worker process for divide."""
+    new_masks = list(masks)
+    apply_move(new_masks, move)
+    table = TranspositionTable(table_size) if table_size else None
+    return perft(new_masks, "White" if checker_color == "Black" else "Black", depth - 1, table)
+
+def divide(masks, checker_color, depth, table_size=0, workers=1):
+    """
+    Returns a list with a (move, count) pair for every legal move in the position, where count is the number of
+    positions depth moves from the position that start with that move. The move is a tuple of square locations as
+    in Checkers.legal_moves. The counts add up to perft of the position. Each move gets a transposition table of
+    table_size entries if table_size isn't 0, and with more than one worker the moves are counted in parallel in
+    worker processes.
+    """
+    if depth < 1:
+        raise ValueError("divide needs a depth of at least 1")
+    moves = generate_moves(masks, checker_color)
+    masks = list(masks)
+    if workers > 1 and len(moves) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(workers) as executor:
+            counts = list(executor.map(_perft_child, [masks] * len(moves), [checker_color] * len(moves), moves,
+                                       [depth] * len(moves), [table_size] * len(moves)))
+    else:
+        counts = [_perft_child(masks, checker_color, move, depth, table_size) for move in moves]
+    return [(tuple(SQUARE_LOCATIONS[square] for square in move[0]), count) for move, count in zip(moves, counts)]
+
+def perft_parallel(masks, checker_color, depth, table_size=0, workers=None):
+    """Returns perft of the position, counting the subtree of each legal move in a separate worker process."""
+    if depth <= 1:
+        return perft(masks, checker_color, depth)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return sum(count for move, count in divide(masks, checker_color, depth, table_size, workers))
+
+def main():
+    """Runs perft from the command line and prints the results as JSON."""
+    parser = argparse.ArgumentParser(description="Count the positions reachable from a Checkers position.")
+    parser.add_argument("depth", type=int, help="number of moves (plies) to look ahead")
+    parser.add_argument("--position", help="hex of a Checkers.snapshot to start from, instead of the start")
+    parser.add_argument("--divide", action="store_true", help="print the count for every root move")
+    parser.add_argument("--hash", type=int, default=0, metavar="SIZE",
+                        help="transposition table entries used to count repeated subtrees once")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes to share the root moves between")
+    arguments = parser.parse_args()
+    if arguments.position:
+        game = Checkers.restore(bytes.fromhex(arguments.position))
+    else:
+        game = Checkers(bitboard=True)
+    masks = game.get_masks()
+    checker_color = game.get_player_turn()
+    start_time = time.perf_counter()
+    if arguments.divide:
+        results = divide(masks, checker_color, arguments.depth, arguments.hash, arguments.workers)
+        for move, count in results:
+            print(json.dumps({"move": move, "nodes": count}))
+        nodes = sum(count for move, count in results)
+    elif arguments.workers > 1:
+        nodes = perft_parallel(masks, checker_color, arguments.depth, arguments.hash, arguments.workers)
+    else:
+        table = TranspositionTable(arguments.hash) if arguments.hash else None
+        nodes = perft(masks, checker_color, arguments.depth, table)
+    seconds = time.perf_counter() - start_time
+    print(json.dumps({"depth": arguments.depth, "nodes": nodes, "seconds": seconds,
+                      "nodes_per_second": nodes / seconds if seconds else 0.0}))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Unit tests for the CheckersPerft program.
+
+import random
+import unittest
+from CheckersGame import Checkers, BitBoard, ListBoard, TranspositionTable
+from CheckersPerft import perft, perft_game, divide, perft_parallel
+
+class TestPerft(unittest.TestCase):
+    """Contains unit tests for counting positions with perft."""
+
+    def test_1(self):
+        """Tests the counts from the starting position, with and without a transposition table."""
+        masks = Checkers(bitboard=True)._board.get_masks()
+        self.assertEqual([perft(masks, "Black", depth) for depth in range(6)], [1, 7, 49, 302, 1469, 7361])
+        self.assertEqual(perft(masks, "Black", 6, TranspositionTable(4096)), perft(masks, "Black", 6))
+
+    def test_2(self):
+        """Tests that the divide counts add up to perft, and are the same counted in worker processes."""
+        masks = Checkers(bitboard=True)._board.get_masks()
+        results = divide(masks, "Black", 4)
+        self.assertEqual(len(results), 7)
+        self.assertEqual(results[0], (((5, 0), (4, 1)), 237))
+        self.assertEqual(sum(count for move, count in results), 1469)
+        self.assertEqual(divide(masks, "Black", 4, table_size=1024, workers=2), results)
+        self.assertEqual(perft_parallel(masks, "Black", 4, workers=2), 1469)
+
+    def test_3(self):
+        """Tests that playing the moves on games with make_move gives the same counts as the move generator."""
+        random_moves = random.Random(18)
+        for game_number in range(20):
+            game = Checkers(bitboard=True)
+            for ply in range(random_moves.randrange(10, 60)):
+                moves = game.get_moves()
+                if not moves:
+                    break
+                game.make_move(random_moves.choice(moves))
+            masks = list(game._board.get_masks())
+            expected = perft(masks, game._player_turn, 3)
+            self.assertEqual(perft_game(game, 3), expected)
+            game._set_board(ListBoard(game._current_board))
+            self.assertEqual(perft_game(game, 3), expected)
+            self.assertEqual(game._board.get_masks(), BitBoard(game._current_board).get_masks())
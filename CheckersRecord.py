@@ -0,0 +1,233 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Reads and writes Checkers games in a compact binary record format.
+
+import struct
+from CheckersGame import Checkers, InvalidSquare, SQUARE_GRID, SQUARE_LOCATIONS, SNAPSHOT, SNAPSHOT_BITBOARD, \
+    SNAPSHOT_BLACK_PLAYER, SNAPSHOT_WHITE_PLAYER
+
+#A record file is laid out as:
+#  header      RECORD_MAGIC, the checkpoint interval (2 bytes), then the Black and White player names, each as a
+#              length byte followed by UTF-8 text
+#  entries     one entry per move, with a checkpoint entry before move 0 and after every checkpoint interval moves.
+#              A move is 2 bytes: (starting square << 5 | destination square) as a big-endian number, using the
+#              square numbers of SQUARE_LOCATIONS. A checkpoint is CHECKPOINT_MARKER then a CHECKPOINT record. Move
+#              entries never start with the marker byte, as their first byte is at most 3.
+#  index       written by close: INDEX_MAGIC, the number of checkpoints, then an INDEX_ENTRY for each one, and last
+#              an INDEX_TRAILER holding where the index starts. Files without an index (for example from a writer
+#              that was never closed) can still be read; the checkpoints are then found by scanning the entries.
+RECORD_MAGIC = b"CKREC1"
+INDEX_MAGIC = b"CKIDX1"
+INDEX_END_MAGIC = b"CKEND1"
+CHECKPOINT_MARKER = 0xFF
+
+#Move number, the six board masks, whose turn it is (b"B" or b"W"), then the captured pieces, kings and triple kings
+#counts of the Black player and then the White player
+CHECKPOINT = struct.Struct("<I6Ic6H")
+INDEX_ENTRY = struct.Struct("<IQ")
+INDEX_TRAILER = struct.Struct("<Q6s")
+
+def _player_counts(player):
+    """Returns the captured pieces, king and triple king counts of the player, or zeros if there is no player."""
+    if player is None:
+        return 0, 0, 0
+    return player.get_captured_pieces_count(), player.get_king_count(), player.get_triple_king_count()
+
+class RecordWriter:
+    """
+    Writes a game to a record file as it is played. Create the writer once the players have been added to the game,
+    call write_move after each successful play_game call, and call close at the end of the game (or use the writer in
+    a with statement). A checkpoint of the whole game is written every checkpoint_interval moves so that readers can
+    jump into the middle of a game.
+    """
+
+    def __init__(self, path, game, checkpoint_interval=32):
+        self._file = open(path, "wb")
+        self._game = game
+        self._checkpoint_interval = checkpoint_interval
+        self._move_count = 0
+        self._checkpoints = []
+        header = bytearray(RECORD_MAGIC)
+        header += struct.pack("<H", checkpoint_interval)
+        for checker_color in ("Black", "White"):
+            player = game.get_player_by_color(checker_color)
+            name = player.get_player_name().encode("utf-8") if player is not None else b""
+            if len(name) > 255:
+                raise ValueError("player names must be at most 255 bytes long")
+            header.append(len(name))
+            header += name
+        self._file.write(header)
+        self._write_checkpoint()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write_checkpoint(self):
+        """Writes a checkpoint of the game as it is now."""
+        game = self._game
+        self._checkpoints.append((self._move_count, self._file.tell()))
+        if game.get_player_turn() == "Black":
+            turn = b"B"
+        else:
+            turn = b"W"
+        self._file.write(bytes((CHECKPOINT_MARKER,)))
+        self._file.write(CHECKPOINT.pack(self._move_count, *game.get_masks(), turn,
+                                         *_player_counts(game.get_player_by_color("Black")),
+                                         *_player_counts(game.get_player_by_color("White"))))
+
+    def write_move(self, starting_square_location, destination_square_location):
+        """
+        Adds a move, given as the same starting and destination square locations passed to play_game, after it has
+        been played. Raises InvalidSquare if either location is not a dark square.
+        """
+        starting_square = SQUARE_GRID[starting_square_location[0]][starting_square_location[1]]
+        destination_square = SQUARE_GRID[destination_square_location[0]][destination_square_location[1]]
+        if starting_square is None or destination_square is None:
+            raise InvalidSquare
+        self._file.write(struct.pack(">H", starting_square << 5 | destination_square))
+        self._move_count += 1
+        if self._move_count % self._checkpoint_interval == 0:
+            self._write_checkpoint()
+
+    def close(self):
+        """Writes the checkpoint index and closes the file."""
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        self._file.write(INDEX_MAGIC + struct.pack("<I", len(self._checkpoints)))
+        for move_number, offset in self._checkpoints:
+            self._file.write(INDEX_ENTRY.pack(move_number, offset))
+        self._file.write(INDEX_TRAILER.pack(index_offset, INDEX_END_MAGIC))
+        self._file.close()
+
+class RecordReader:
+    """
+    Reads a record file written by RecordWriter. The header is read when the reader is created. moves() is a
+    generator over the moves of the game, and replay() sets up a game at any move number, starting from the nearest
+    checkpoint so only the moves after it are played again.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        if self._file.read(len(RECORD_MAGIC)) != RECORD_MAGIC:
+            self._file.close()
+            raise ValueError("not a Checkers record file")
+        self._checkpoint_interval = struct.unpack("<H", self._file.read(2))[0]
+        self._player_names = []
+        for _ in range(2):
+            length = self._file.read(1)[0]
+            self._player_names.append(self._file.read(length).decode("utf-8"))
+        self._entries_offset = self._file.tell()
+        self._entries_end, self._checkpoints = self._read_index()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Closes the file."""
+        self._file.close()
+
+    def get_player_names(self):
+        """Returns the (Black player name, White player name) pair from the header."""
+        return tuple(self._player_names)
+
+    def get_checkpoints(self):
+        """Returns the list of (move number, file offset) pairs of the checkpoints in the file."""
+        return list(self._checkpoints)
+
+    def _read_index(self):
+        """
+        Returns the offset where the move entries end and the list of checkpoints, from the index at the end of the
+        file or, if there is none, by scanning the entries.
+        """
+        self._file.seek(0, 2)
+        file_size = self._file.tell()
+        if file_size - self._entries_offset >= INDEX_TRAILER.size:
+            self._file.seek(file_size - INDEX_TRAILER.size)
+            index_offset, end_magic = INDEX_TRAILER.unpack(self._file.read(INDEX_TRAILER.size))
+            if end_magic == INDEX_END_MAGIC:
+                self._file.seek(index_offset)
+                if self._file.read(len(INDEX_MAGIC)) == INDEX_MAGIC:
+                    count = struct.unpack("<I", self._file.read(4))[0]
+                    data = self._file.read(count * INDEX_ENTRY.size)
+                    return index_offset, [INDEX_ENTRY.unpack_from(data, entry * INDEX_ENTRY.size)
+                                          for entry in range(count)]
+        checkpoints = []
+        for kind, offset, value in self._entries(self._entries_offset, file_size):
+            if kind == "checkpoint":
+                checkpoints.append((value[0], offset))
+        return file_size, checkpoints
+
+    def _entries(self, start_offset, end_offset):
+        """
+        Yields the entries between the offsets as (kind, offset, value) triples: ("move", offset, (starting square,
+        destination square)) with square numbers, or ("checkpoint", offset, unpacked CHECKPOINT tuple).
+        """
+        self._file.seek(start_offset)
+        data = self._file.read(end_offset - start_offset)
+        position = 0
+        while position + 2 <= len(data):
+            if data[position] == CHECKPOINT_MARKER:
+                if position + 1 + CHECKPOINT.size > len(data):
+                    return
+                yield "checkpoint", start_offset + position, CHECKPOINT.unpack_from(data, position + 1)
+                position += 1 + CHECKPOINT.size
+            else:
+                value = data[position] << 8 | data[position + 1]
+                yield "move", start_offset + position, (value >> 5, value & 31)
+                position += 2
+
+    def moves(self, start_offset=None):
+        """
+        Generator that yields the moves of the game in order, as (starting square location, destination square
+        location) pairs in the form play_game takes.
+        """
+        if start_offset is None:
+            start_offset = self._entries_offset
+        for kind, offset, value in self._entries(start_offset, self._entries_end):
+            if kind == "move":
+                yield SQUARE_LOCATIONS[value[0]], SQUARE_LOCATIONS[value[1]]
+
+    def find_checkpoint(self, move_number):
+        """Returns the (move number, file offset) of the last checkpoint at or before the move number."""
+        best = self._checkpoints[0]
+        for checkpoint in self._checkpoints:
+            if checkpoint[0] <= move_number:
+                best = checkpoint
+            else:
+                break
+        return best
+
+    def replay(self, move_number=None, bitboard=False):
+        """
+        Returns a new Checkers game set up as it was after move_number moves (the whole game if move_number is
+        None). The game is restored from the nearest checkpoint at or before that move and only the moves after the
+        checkpoint are played with play_game.
+        """
+        if move_number is None:
+            move_number = float("inf")
+        checkpoint_move, checkpoint_offset = self.find_checkpoint(move_number)
+        self._file.seek(checkpoint_offset + 1)
+        checkpoint = CHECKPOINT.unpack(self._file.read(CHECKPOINT.size))
+        #A checkpoint holds the same masks, turn and counts as a snapshot, so the game is restored from one
+        flags = SNAPSHOT_BLACK_PLAYER | SNAPSHOT_WHITE_PLAYER
+        if bitboard:
+            flags |= SNAPSHOT_BITBOARD
+        game = Checkers.restore(SNAPSHOT.pack(*checkpoint[1:], flags), self._player_names)
+        played = checkpoint_move
+        for starting_square_location, destination_square_location in self.moves(checkpoint_offset):
+            if played >= move_number:
+                break
+            if game.get_player_turn() == "Black":
+                game.play_game(self._player_names[0], starting_square_location, destination_square_location)
+            else:
+                game.play_game(self._player_names[1], starting_square_location, destination_square_location)
+            played += 1
+        return game
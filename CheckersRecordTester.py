@@ -0,0 +1,71 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Unit tests for the CheckersRecord program.
+
+import os
+import tempfile
+import unittest
+from CheckersGame import Checkers, InvalidSquare
+from CheckersRecord import RecordWriter, RecordReader
+from CheckersGameTester import TRIPLE_KING_GAME
+
+def play_moves(move_count, bitboard=False):
+    """Returns a game with the first move_count moves of TRIPLE_KING_GAME played."""
+    game = Checkers(bitboard)
+    game.create_player("Ashley", "Black")
+    game.create_player("Tiffany", "White")
+    for player_name, starting_square, destination_square in TRIPLE_KING_GAME[:move_count]:
+        game.play_game(player_name, starting_square, destination_square)
+    return game
+
+class TestRecord(unittest.TestCase):
+    """Contains unit tests for writing, reading and replaying game records."""
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, "game.rec")
+        game = Checkers()
+        game.create_player("Ashley", "Black")
+        game.create_player("Tiffany", "White")
+        with RecordWriter(self._path, game, checkpoint_interval=8) as writer:
+            for player_name, starting_square, destination_square in TRIPLE_KING_GAME:
+                game.play_game(player_name, starting_square, destination_square)
+                writer.write_move(starting_square, destination_square)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_1(self):
+        """Tests that the moves and player names read back are the ones written."""
+        with RecordReader(self._path) as reader:
+            self.assertEqual(reader.get_player_names(), ("Ashley", "Tiffany"))
+            self.assertEqual(list(reader.moves()), [(start, end) for name, start, end in TRIPLE_KING_GAME])
+            self.assertEqual([move for move, offset in reader.get_checkpoints()], [0, 8, 16, 24, 32, 40, 48])
+
+    def test_2(self):
+        """Tests that replaying to a move number gives the same game as playing the moves, from a checkpoint."""
+        with RecordReader(self._path) as reader:
+            self.assertEqual(reader.find_checkpoint(20)[0], 16)
+            for move_number in (0, 5, 20, 48, len(TRIPLE_KING_GAME)):
+                expected = play_moves(move_number)
+                game = reader.replay(move_number, bitboard=True)
+                self.assertEqual(game._current_board, expected._current_board)
+                self.assertEqual(game._player_turn, expected._player_turn)
+                self.assertEqual(game._players["Ashley"].get_captured_pieces_count(),
+                                 expected._players["Ashley"].get_captured_pieces_count())
+        game = Checkers.from_record(self._path)
+        self.assertEqual(game.game_winner(), "Ashley")
+        self.assertEqual(game._players["Ashley"].get_triple_king_count(), 1)
+        self.assertEqual(game.get_player_by_color("White").get_player_name(), "Tiffany")
+
+    def test_3(self):
+        """Tests that a record without its index can still be read, and that light squares can't be recorded."""
+        with open(self._path, "rb") as record_file:
+            data = record_file.read()
+        with open(self._path, "wb") as record_file:
+            record_file.write(data[:data.index(b"CKIDX1")])
+        game = Checkers.from_record(self._path, 30)
+        self.assertEqual(game._current_board, play_moves(30)._current_board)
+        with RecordWriter(self._path, Checkers()) as writer:
+            self.assertRaises(InvalidSquare, writer.write_move, (5, 0), (4, 0))
@@ -0,0 +1,142 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Replays and validates archives of Checkers games in bulk, spread over worker processes.
+
+import argparse
+import collections
+import itertools
+import json
+import os
+import sys
+import time
+from CheckersGame import Checkers, InvalidSquare, OutofTurn, InvalidPlayer
+from CheckersRecord import RecordReader
+
+def read_games(paths):
+    """
+    Generator that yields (game id, moves) for every game in the files, one at a time so an archive of any size can
+    be read. Files ending in .jsonl hold one game per line as a JSON list of [[row, column], [row, column]] moves,
+    and the game id is the path and line number. Any other file is a record file (see CheckersRecord) holding one
+    game, and the game id is the path. The moves of a line that isn't a list of moves, each a pair of [row, column]
+    squares of whole numbers, are None.
+    """
+    for path in paths:
+        if not path.endswith(".jsonl"):
+            with RecordReader(path) as reader:
+                yield path, list(reader.moves())
+            continue
+        with open(path) as archive_file:
+            for line_number, line in enumerate(archive_file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    moves = [(tuple(starting_square), tuple(destination_square))
+                             for starting_square, destination_square in json.loads(line)]
+                    if not all(len(square) == 2 and type(square[0]) is int and type(square[1]) is int
+                               for move in moves for square in move):
+                        moves = None
+                except (ValueError, TypeError):
+                    moves = None
+                yield path + ":" + str(line_number), moves
+
+def _new_game(bitboard):
+    """Returns a strict game between players named "Black" and "White", for replays to fork."""
+    game = Checkers(bitboard, strict=True)
+    game.create_player("Black", "Black")
+    game.create_player("White", "White")
+    return game
+
+def replay_game(moves, template=None):
+    """
+    Plays the moves, (starting square location, destination square location) pairs, with play_game by whichever
+    player's turn it is, in a fork of the template game (a strict game from _new_game; a new list board one if None).
+    As the game is strict, any move against the rules raises an exception and the board is left as it was before
+    it. Stops at the first such move, so a bad game costs one exception however long it is. Returns a dictionary
+    with "board" (the hex of the final game's snapshot, see Checkers.restore), "winner" (the color that won or None),
+    "captured" (the pieces captured by Black and by White), "moves" (the number of moves played) and "illegal" (None,
+    or the "move_number", "move" and "error" of the first move that couldn't be played).
+    """
+    if template is None:
+        template = _new_game(False)
+    game = template.fork()
+    illegal = None
+    move_number = 0
+    if moves is None:
+        illegal = {"move_number": 0, "move": None, "error": "unreadable"}
+    else:
+        for starting_square_location, destination_square_location in moves:
+            try:
+                game.play_game(game.get_player_turn(), starting_square_location, destination_square_location)
+            except (InvalidSquare, OutofTurn, InvalidPlayer) as error:
+                illegal = {"move_number": move_number,
+                           "move": [starting_square_location, destination_square_location],
+                           "error": type(error).__name__}
+                break
+            move_number += 1
+    winner = game.game_winner()
+    return {"board": game.snapshot().hex(), "winner": winner if winner in ("Black", "White") else None,
+            "captured": [game.get_player_by_color("Black").get_captured_pieces_count(),
+                         game.get_player_by_color("White").get_captured_pieces_count()],
+            "moves": move_number, "illegal": illegal}
+
+def _replay_chunk(chunk, bitboard):
+    """Replays a list of (game id, moves) and returns a list of (game id, result). Runs in a worker process."""
+    template = _new_game(bitboard)
+    return [(game_id, replay_game(moves, template)) for game_id, moves in chunk]
+
+def replay_archive(games, workers=None, chunk_size=256, max_pending=None, bitboard=False):
+    """
+    Generator that replays games, an iterable of (game id, moves) such as read_games, and yields (game id, result)
+    pairs (see replay_game) in the same order. Games are sent to worker processes (one per core unless workers is
+    given; workers=1 replays them in this process) in chunks of chunk_size. No more than max_pending chunks (twice
+    the number of workers if None) are waiting at once: games are only read from the iterable as earlier chunks
+    come back, so memory stays bounded however many games there are and however slowly the results are used.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = 2 * workers
+    games = iter(games)
+    chunks = iter(lambda: list(itertools.islice(games, chunk_size)), [])
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _replay_chunk(chunk, bitboard)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    pending = collections.deque()
+    with ProcessPoolExecutor(workers) as executor:
+        for chunk in chunks:
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_replay_chunk, chunk, bitboard))
+        while pending:
+            yield from pending.popleft().result()
+
+def main():
+    """
+    Replays archive files from the command line, printing one JSON line per game and a summary line to standard
+    error.
+    """
+    parser = argparse.ArgumentParser(description="Replay and validate archived Checkers games.")
+    parser.add_argument("archive", nargs="+", help=".jsonl archives or record files to replay")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--chunk-size", type=int, default=256, help="games sent to a worker at a time")
+    parser.add_argument("--max-pending", type=int, default=None, help="chunks waiting for a worker at most")
+    parser.add_argument("--bitboard", action="store_true", help="replay on bitboards")
+    arguments = parser.parse_args()
+    start_time = time.perf_counter()
+    game_count = 0
+    illegal_count = 0
+    for game_id, result in replay_archive(read_games(arguments.archive), arguments.workers, arguments.chunk_size,
+                                          arguments.max_pending, arguments.bitboard):
+        game_count += 1
+        if result["illegal"] is not None:
+            illegal_count += 1
+        print(json.dumps(dict(result, game=game_id)))
+    seconds = time.perf_counter() - start_time
+    print(json.dumps({"games": game_count, "illegal": illegal_count, "seconds": seconds,
+                      "games_per_second": game_count / seconds if seconds else 0.0}), file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Unit tests for the CheckersReplay program.
+
+import json
+import os
+import random
+import tempfile
+import unittest
+from CheckersGame import Checkers
+from CheckersRecord import RecordWriter
+from CheckersReplay import read_games, replay_game, replay_archive
+from CheckersGameTester import TRIPLE_KING_GAME
+
+def legal_game(seed, plies=120):
+    """Returns the hops, (starting square, destination square) pairs, of a random game of legal moves."""
+    random_moves = random.Random(seed)
+    game = Checkers()
+    game.create_player("Black", "Black")
+    game.create_player("White", "White")
+    hops = []
+    for ply in range(plies):
+        moves = game.legal_moves(game._player_turn)
+        if not moves:
+            break
+        locations = random_moves.choice(moves)
+        for starting_square, destination_square in zip(locations, locations[1:]):
+            game.play_game(game._player_turn, starting_square, destination_square)
+            hops.append((starting_square, destination_square))
+    return hops
+
+class TestReplay(unittest.TestCase):
+    """Contains unit tests for replaying archived games."""
+
+    def test_1(self):
+        """Tests the final board, captures and first illegal move of replayed games."""
+        moves = legal_game(21)
+        result = replay_game(moves)
+        game = Checkers()
+        game.create_player("Ashley", "Black")
+        game.create_player("Tiffany", "White")
+        for starting_square, destination_square in moves:
+            game.play_game("Ashley" if game._player_turn == "Black" else "Tiffany", starting_square,
+                           destination_square)
+        self.assertEqual(Checkers.restore(bytes.fromhex(result["board"]))._current_board, game._current_board)
+        self.assertEqual(result["captured"], [game._players["Ashley"].get_captured_pieces_count(),
+                                              game._players["Tiffany"].get_captured_pieces_count()])
+        self.assertEqual(result["moves"], len(moves))
+        self.assertIsNone(result["illegal"])
+        self.assertEqual(result["winner"], {"Ashley": "Black", "Tiffany": "White"}.get(game.game_winner()))
+        bad_result = replay_game([((5, 0), (4, 1)), ((5, 2), (4, 3)), ((2, 1), (3, 2))])
+        self.assertEqual(bad_result["illegal"], {"move_number": 1, "move": [(5, 2), (4, 3)], "error": "InvalidSquare"})
+        self.assertEqual(bad_result["moves"], 1)
+        self.assertEqual(replay_game(None)["illegal"]["error"], "unreadable")
+        #A move that the original rules allow but that passes up a capture is illegal, and isn't played
+        triple_king_moves = [starting_and_destination for player_name, *starting_and_destination in TRIPLE_KING_GAME]
+        triple_king_result = replay_game(triple_king_moves)
+        self.assertEqual(triple_king_result["illegal"], {"move_number": 20, "move": [(2, 7), (3, 6)],
+                                                         "error": "InvalidSquare"})
+        self.assertEqual(triple_king_result["board"], replay_game(triple_king_moves[:20])["board"])
+
+    def test_2(self):
+        """Tests that archives are read from files and replayed in order, the same with and without workers."""
+        moves = [[list(starting_square), list(destination_square)] for starting_square, destination_square
+                 in legal_game(2)]
+        with tempfile.TemporaryDirectory() as directory:
+            archive_path = os.path.join(directory, "games.jsonl")
+            with open(archive_path, "w") as archive_file:
+                for game_number in range(50):
+                    archive_file.write(json.dumps(moves[:game_number % len(moves)]) + "\n")
+                archive_file.write("not json\n")
+                archive_file.write(json.dumps([[[5, 0], [4, 1]], [[4, 1], [3, 2]]]) + "\n")
+                archive_file.write(json.dumps([[[5, 0], [4, 1]], [[2, 1], ["3", 2]]]) + "\n")
+            record_path = os.path.join(directory, "game.ckr")
+            game = Checkers()
+            game.create_player("Ashley", "Black")
+            game.create_player("Tiffany", "White")
+            with RecordWriter(record_path, game) as writer:
+                for player_name, starting_square, destination_square in TRIPLE_KING_GAME[:6]:
+                    game.play_game(player_name, starting_square, destination_square)
+                    writer.write_move(starting_square, destination_square)
+            paths = [archive_path, record_path]
+            results = list(replay_archive(read_games(paths), workers=1, chunk_size=7))
+            self.assertEqual(results, list(replay_archive(read_games(paths), workers=2, chunk_size=7, max_pending=1)))
+        self.assertEqual(len(results), 54)
+        self.assertEqual([game_id for game_id, result in results][:2], [archive_path + ":1", archive_path + ":2"])
+        self.assertEqual([result["moves"] for game_id, result in results[:50]],
+                         [game_number % len(moves) for game_number in range(50)])
+        self.assertEqual(results[50][1]["illegal"]["error"], "unreadable")
+        self.assertEqual(results[51][1]["illegal"], {"move_number": 1, "move": [(4, 1), (3, 2)],
+                                                  "error": "InvalidSquare"})
+        self.assertEqual(results[52][1]["illegal"]["error"], "unreadable")
+        self.assertEqual(results[53], (record_path, replay_game([(starting_square, destination_square) for
+                                                                 player_name, starting_square, destination_square
+                                                                 in TRIPLE_KING_GAME[:6]])))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,334 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: An asyncio server that hosts many Checkers games at once, and a load generator to measure it.
+
+import argparse
+import asyncio
+import json
+import time
+from CheckersGame import Checkers, InvalidSquare, OutofTurn, InvalidPlayer
+
+#The server speaks JSON lines over TCP: each request and reply is one JSON object followed by a newline. Requests
+#have an "op" and, except for "ping", a "game" id, and may have an "id" that is copied into the reply:
+#  {"op": "join", "game": id, "player": name, "color": "Black" or "White"}  creates the game if needed, adds the
+#                                                                           player and watches the game
+#  {"op": "move", "game": id, "player": name, "from": [row, column], "to": [row, column]}  calls play_game
+#  {"op": "watch", "game": id}                                              sends the game's moves from now on
+#  {"op": "board", "game": id}                                              replies with the board and turn
+#  {"op": "winner", "game": id}                                             replies with game_winner()
+#  {"op": "ping"}
+#Replies have "ok": true and the results, or "ok": false and an "error" name. Watchers get {"event": "move", ...}
+#after every move by someone else, with a "change" (see CheckersGame.board_change) holding only the squares and
+#counts the move changed, and {"event": "evicted", "game": id} when an idle game is removed. When a move ends the
+#game (won or drawn, see game_winner), its reply and event also have the "winner" and the game is removed.
+
+#The moves played by each game of the load generator, as (color, starting square, destination square)
+LOAD_GAME = [
+    ("Black", (5, 0), (4, 1)),
+    ("White", (2, 1), (3, 2)),
+    ("Black", (4, 1), (3, 0)),
+    ("White", (1, 0), (2, 1)),
+    ("Black", (5, 6), (4, 7)),
+    ("White", (3, 2), (4, 3)),
+    ("Black", (5, 4), (3, 2)),
+    ("Black", (3, 2), (1, 0)),
+    ("White", (1, 2), (2, 1)),
+    ("Black", (3, 0), (1, 2)),
+    ("White", (0, 3), (2, 1)),
+    ("Black", (5, 2), (4, 3)),
+    ("White", (0, 1), (1, 2)),
+    ("Black", (1, 0), (0, 1)),
+    ("White", (2, 1), (3, 0)),
+    ("Black", (6, 1), (5, 2)),
+    ("White", (1, 2), (2, 1)),
+    ("Black", (0, 1), (3, 4)),
+    ("White", (2, 1), (3, 2)),
+    ("Black", (4, 3), (2, 1))]
+
+class GameSession:
+    """
+    One hosted game: the Checkers game, the connections watching it and when it was last used. The game is strict, so
+    a move against the rules is turned down before anything on the board changes.
+    """
+
+    def __init__(self, game_id, bitboard=False):
+        self._game_id = game_id
+        self._game = Checkers(bitboard, strict=True)
+        self._watchers = set()
+        self._last_active = time.monotonic()
+        self._changes = []
+        self._game.subscribe(self._changes.append)
+
+    def get_game(self):
+        """Returns the session's Checkers game."""
+        return self._game
+
+class Connection:
+    """
+    A client connected to the server and the games it watches. The writer is None for a client making requests from
+    inside this process, which gets replies but no watcher events.
+    """
+
+    def __init__(self, writer):
+        self._writer = writer
+        self._watching = set()
+
+class GameServer:
+    """
+    Hosts Checkers games for clients connecting over TCP (see the protocol above). Requests are handled one at a time
+    on the event loop, and a move is played and sent to the game's watchers before the next request is read, so
+    every watcher sees a game's moves in the order the server played them. Games nobody has used for idle_timeout
+    seconds are removed. A watcher whose unsent messages pass max_buffer bytes is disconnected rather than letting
+    it hold up the server. Games are also removed as soon as they are won or drawn.
+    """
+
+    def __init__(self, idle_timeout=300, bitboard=False, max_buffer=1 << 20):
+        self._idle_timeout = idle_timeout
+        self._bitboard = bitboard
+        self._max_buffer = max_buffer
+        self._sessions = {}
+        self._server = None
+        self._eviction_task = None
+
+    def get_session_count(self):
+        """Returns the number of games being hosted."""
+        return len(self._sessions)
+
+    def get_session(self, game_id):
+        """Returns the GameSession of the game id, or None if there is no such game."""
+        return self._sessions.get(game_id)
+
+    async def start(self, host="127.0.0.1", port=0):
+        """Starts listening and returns the (host, port) the server is listening on."""
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        self._eviction_task = asyncio.create_task(self._evict_periodically())
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        """Stops listening and stops evicting games."""
+        if self._eviction_task is not None:
+            self._eviction_task.cancel()
+            self._eviction_task = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle_connection(self, reader, writer):
+        """Reads requests from one client and writes the replies until the client disconnects."""
+        connection = Connection(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    request = None
+                if isinstance(request, dict):
+                    reply = self.handle_request(connection, request)
+                    if "id" in request:
+                        reply["id"] = request["id"]
+                else:
+                    reply = {"ok": False, "error": "BadRequest"}
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for game_id in connection._watching:
+                session = self._sessions.get(game_id)
+                if session is not None:
+                    session._watchers.discard(connection)
+            writer.close()
+
+    def handle_request(self, connection, request):
+        """Carries out one request from the connection and returns the reply as a dictionary."""
+        operation = request.get("op")
+        if operation == "ping":
+            return {"ok": True}
+        game_id = request.get("game")
+        if operation == "join":
+            return self._join(connection, game_id, request.get("player"), request.get("color"))
+        session = self._sessions.get(game_id)
+        if session is None:
+            return {"ok": False, "error": "UnknownGame"}
+        session._last_active = time.monotonic()
+        game = session._game
+        if operation == "move":
+            return self._move(connection, session, request)
+        if operation == "watch":
+            session._watchers.add(connection)
+            connection._watching.add(game_id)
+            return {"ok": True, "board": game.get_board(), "turn": game.get_player_turn()}
+        if operation == "board":
+            return {"ok": True, "board": game.get_board(), "turn": game.get_player_turn()}
+        if operation == "winner":
+            return {"ok": True, "winner": game.game_winner()}
+        return {"ok": False, "error": "UnknownOperation"}
+
+    def _join(self, connection, game_id, player_name, color):
+        """Adds a player to the game, creating the game if it doesn't exist, and has the connection watch it."""
+        if not isinstance(game_id, str) or not isinstance(player_name, str):
+            return {"ok": False, "error": "BadRequest"}
+        if color != "Black" and color != "White":
+            return {"ok": False, "error": "InvalidColor"}
+        session = self._sessions.get(game_id)
+        if session is None:
+            session = GameSession(game_id, self._bitboard)
+            self._sessions[game_id] = session
+        session._last_active = time.monotonic()
+        game = session._game
+        if game.get_player(player_name) is not None:
+            return {"ok": False, "error": "NameTaken"}
+        if game.get_player_by_color(color) is not None:
+            return {"ok": False, "error": "ColorTaken"}
+        game.create_player(player_name, color)
+        session._watchers.add(connection)
+        connection._watching.add(game_id)
+        return {"ok": True, "game": game_id, "color": color}
+
+    def _move(self, connection, session, request):
+        """Plays a move with play_game and sends it to the game's other watchers."""
+        game = session._game
+        player_name = request.get("player")
+        session._changes.clear()
+        try:
+            starting_square_location = tuple(request["from"])
+            destination_square_location = tuple(request["to"])
+        except (KeyError, TypeError):
+            return {"ok": False, "error": "BadRequest"}
+        if not all(len(location) == 2 and type(location[0]) is int and type(location[1]) is int
+                   for location in (starting_square_location, destination_square_location)):
+            return {"ok": False, "error": "BadRequest"}
+        try:
+            captured = game.play_game(player_name, starting_square_location, destination_square_location)
+        except (InvalidSquare, OutofTurn, InvalidPlayer) as error:
+            return {"ok": False, "error": type(error).__name__}
+        event = {"event": "move", "game": session._game_id, "player": player_name, "from": starting_square_location,
+                 "to": destination_square_location, "captured": captured, "turn": game.get_player_turn(),
+                 "change": session._changes[-1] if session._changes else None}
+        reply = {"ok": True, "captured": captured, "turn": game.get_player_turn()}
+        if game.is_game_over():
+            event["winner"] = reply["winner"] = game.game_winner()
+        data = json.dumps(event).encode() + b"\n"
+        for watcher in list(session._watchers):
+            if watcher is not connection:
+                self._send(watcher, data)
+        if "winner" in reply:
+            self._remove_session(session._game_id)
+        return reply
+
+    def _remove_session(self, game_id):
+        """Stops hosting the game and returns its session. Its watchers stop watching it."""
+        session = self._sessions.pop(game_id)
+        for watcher in session._watchers:
+            watcher._watching.discard(game_id)
+        return session
+
+    def _send(self, connection, data):
+        """Queues data to a connection without waiting, and disconnects it if it has fallen too far behind."""
+        writer = connection._writer
+        if writer is None or writer.is_closing():
+            return
+        writer.write(data)
+        if writer.transport.get_write_buffer_size() > self._max_buffer:
+            writer.close()
+
+    def evict_idle(self, now=None):
+        """Removes the games that haven't been used for idle_timeout seconds and returns their ids."""
+        if now is None:
+            now = time.monotonic()
+        evicted = [game_id for game_id, session in self._sessions.items()
+                   if now - session._last_active > self._idle_timeout]
+        for game_id in evicted:
+            session = self._remove_session(game_id)
+            event = json.dumps({"event": "evicted", "game": game_id}).encode() + b"\n"
+            for watcher in session._watchers:
+                self._send(watcher, event)
+        return evicted
+
+    async def _evict_periodically(self):
+        """Evicts idle games every quarter of the idle timeout."""
+        while True:
+            await asyncio.sleep(self._idle_timeout / 4)
+            self.evict_idle()
+
+async def _play_load_games(host, port, game_ids, latencies, errors):
+    """Plays LOAD_GAME once for each game id over one connection, adding each move's round trip time to latencies."""
+    reader, writer = await asyncio.open_connection(host, port)
+
+    async def call(request):
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        while True:
+            reply = json.loads(await reader.readline())
+            if "event" not in reply:
+                return reply
+
+    try:
+        for game_id in game_ids:
+            for color in ("Black", "White"):
+                await call({"op": "join", "game": game_id, "player": color, "color": color})
+            for color, starting_square_location, destination_square_location in LOAD_GAME:
+                start_time = time.perf_counter()
+                reply = await call({"op": "move", "game": game_id, "player": color,
+                                    "from": starting_square_location, "to": destination_square_location})
+                latencies.append(time.perf_counter() - start_time)
+                if not reply["ok"]:
+                    errors.append(reply["error"])
+    finally:
+        writer.close()
+
+async def run_load(host, port, games=1000, connections=100):
+    """
+    Plays games copies of LOAD_GAME against the server at host and port over the given number of connections at
+    once, and returns a dictionary with the number of moves played, moves per second, the median and 99th percentile
+    move round trip in milliseconds, and the number of moves the server rejected.
+    """
+    connections = max(1, min(connections, games))
+    run_id = str(time.monotonic_ns())
+    game_ids = ["load-" + run_id + "-" + str(number) for number in range(games)]
+    latencies = []
+    errors = []
+    start_time = time.perf_counter()
+    await asyncio.gather(*(_play_load_games(host, port, game_ids[number::connections], latencies, errors)
+                           for number in range(connections)))
+    seconds = time.perf_counter() - start_time
+    latencies.sort()
+    return {"games": games, "connections": connections, "moves": len(latencies), "seconds": seconds,
+            "moves_per_second": len(latencies) / seconds if seconds else 0.0,
+            "p50_ms": latencies[len(latencies) // 2] * 1000 if latencies else 0.0,
+            "p99_ms": latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] * 1000 if latencies else 0.0,
+            "errors": len(errors)}
+
+async def _serve(host, port, idle_timeout):
+    """Runs a server until it is interrupted."""
+    server = GameServer(idle_timeout)
+    host, port = await server.start(host, port)
+    print("serving on", host, port)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+def main():
+    """Runs the server or the load generator from the command line."""
+    parser = argparse.ArgumentParser(description="Host Checkers games over TCP, or measure a server.")
+    parser.add_argument("mode", choices=("serve", "load"))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--idle-timeout", type=float, default=300, help="seconds before an unused game is removed")
+    parser.add_argument("--games", type=int, default=1000, help="games for the load generator to play")
+    parser.add_argument("--connections", type=int, default=100, help="connections the load generator uses at once")
+    arguments = parser.parse_args()
+    if arguments.mode == "serve":
+        asyncio.run(_serve(arguments.host, arguments.port, arguments.idle_timeout))
+    else:
+        print(json.dumps(asyncio.run(run_load(arguments.host, arguments.port, arguments.games,
+                                              arguments.connections))))
+
+if __name__ == '__main__':
+    main()
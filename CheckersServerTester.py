@@ -0,0 +1,104 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Unit tests for the CheckersServer program.
+
+import asyncio
+import json
+import unittest
+from CheckersGame import ListBoard
+from CheckersServer import GameServer, Connection, LOAD_GAME, run_load
+
+class TestServer(unittest.TestCase):
+    """Contains unit tests for the game server and load generator."""
+
+    def test_1(self):
+        """Tests joining, moving and the errors returned for bad requests, without a network connection."""
+        server = GameServer()
+        connection = Connection(None)
+        self.assertEqual(server.handle_request(connection, {"op": "move", "game": "g"}),
+                         {"ok": False, "error": "UnknownGame"})
+        self.assertTrue(server.handle_request(connection, {"op": "join", "game": "g", "player": "Lucy",
+                                                           "color": "Black"})["ok"])
+        self.assertEqual(server.handle_request(connection, {"op": "join", "game": "g", "player": "Adam",
+                                                            "color": "Black"})["error"], "ColorTaken")
+        self.assertEqual(server.handle_request(connection, {"op": "join", "game": "g", "player": "Lucy",
+                                                            "color": "White"})["error"], "NameTaken")
+        server.handle_request(connection, {"op": "join", "game": "g", "player": "Adam", "color": "White"})
+        self.assertEqual(server.handle_request(connection, {"op": "move", "game": "g", "player": "Adam",
+                                                            "from": [2, 1], "to": [3, 2]})["error"], "OutofTurn")
+        self.assertEqual(server.handle_request(connection, {"op": "move", "game": "g", "player": "Eve",
+                                                            "from": [5, 0], "to": [4, 1]})["error"], "InvalidPlayer")
+        board_before = server.get_session("g").get_game().get_board()
+        self.assertEqual(server.handle_request(connection, {"op": "move", "game": "g", "player": "Lucy",
+                                                            "from": [5, 0], "to": [3, 2]})["error"], "InvalidSquare")
+        self.assertEqual(server.handle_request(connection, {"op": "move", "game": "g", "player": "Lucy",
+                                                            "from": [5, 0], "to": [4, "1"]})["error"], "BadRequest")
+        self.assertEqual(server.handle_request(connection, {"op": "move", "game": "g", "player": "Lucy",
+                                                            "from": [5, 0, 1], "to": [4, 1]})["error"], "BadRequest")
+        self.assertEqual(server.get_session("g").get_game().get_board(), board_before)
+        self.assertEqual(server.handle_request(connection, {"op": "move", "game": "g", "player": "Lucy",
+                                                            "from": [5, 0], "to": [4, 1]}),
+                         {"ok": True, "captured": 0, "turn": "White"})
+        self.assertEqual(server.handle_request(connection, {"op": "winner", "game": "g"})["winner"],
+                         "Game has not ended")
+        self.assertEqual(server.evict_idle(), [])
+        self.assertEqual(server.evict_idle(float("inf")), ["g"])
+        self.assertEqual(server.get_session_count(), 0)
+
+    def test_2(self):
+        """Tests that a spectator sees every move of a game in order, and that the load generator runs cleanly."""
+
+        async def run():
+            server = GameServer()
+            host, port = await server.start()
+            try:
+                reader, writer = await asyncio.open_connection(host, port)
+                writer.write(b'{"op": "join", "game": "watched", "player": "Black", "color": "Black"}\n')
+                writer.write(b'{"op": "join", "game": "watched", "player": "White", "color": "White"}\n')
+                spectator_reader, spectator_writer = await asyncio.open_connection(host, port)
+                await reader.readline()
+                await reader.readline()
+                spectator_writer.write(b'{"op": "watch", "game": "watched", "id": 7}\n')
+                reply = json.loads(await spectator_reader.readline())
+                self.assertEqual((reply["ok"], reply["id"], reply["turn"]), (True, 7, "Black"))
+                for color, starting_square_location, destination_square_location in LOAD_GAME:
+                    writer.write(json.dumps({"op": "move", "game": "watched", "player": color,
+                                             "from": starting_square_location,
+                                             "to": destination_square_location}).encode() + b"\n")
+                for color, starting_square_location, destination_square_location in LOAD_GAME:
+                    self.assertTrue(json.loads(await reader.readline())["ok"])
+                    event = json.loads(await spectator_reader.readline())
+                    self.assertEqual((event["player"], event["from"], event["to"]),
+                                     (color, list(starting_square_location), list(destination_square_location)))
+                    self.assertEqual(event["change"]["vacated"], [list(starting_square_location)])
+                writer.close()
+                spectator_writer.close()
+                results = await run_load(host, port, games=20, connections=4)
+                self.assertEqual(results["errors"], 0)
+                self.assertEqual(results["moves"], 20 * len(LOAD_GAME))
+                self.assertGreater(results["p99_ms"], 0)
+            finally:
+                await server.close()
+
+        asyncio.run(run())
+
+    def test_3(self):
+        """Tests that a move that ends the game replies with the result and stops hosting the game."""
+        server = GameServer()
+        connection = Connection(None)
+        server.handle_request(connection, {"op": "join", "game": "g", "player": "Lucy", "color": "Black"})
+        server.handle_request(connection, {"op": "join", "game": "g", "player": "Adam", "color": "White"})
+        rows = [[None] * 8 for _ in range(8)]
+        rows[4][1] = "Black_king"
+        rows[1][6] = "White_king"
+        game = server.get_session("g").get_game()
+        game._set_board(ListBoard(rows))
+        game._draw_move_limit = 2
+        self.assertNotIn("winner", server.handle_request(connection, {"op": "move", "game": "g", "player": "Lucy",
+                                                                      "from": [4, 1], "to": [3, 2]}))
+        self.assertEqual(server.handle_request(connection, {"op": "move", "game": "g", "player": "Adam",
+                                                            "from": [1, 6], "to": [2, 5]}),
+                         {"ok": True, "captured": 0, "turn": "Black", "winner": "Draw"})
+        self.assertEqual(server.get_session_count(), 0)
+        self.assertEqual(connection._watching, set())
@@ -0,0 +1,171 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Plays large numbers of Checkers games automatically and records how they ended.
+
+import random
+import struct
+import time
+from array import array
+from CheckersGame import Checkers, BitBoard, STARTING_BOARD, SNAPSHOT, SNAPSHOT_BITBOARD, generate_moves, apply_move
+
+#Each results file starts with this header, then holds one fixed-size record per game
+RESULTS_MAGIC = b"CKSIM1"
+
+#Winner, number of moves (plies), then captures, kings and triple kings made by Black and by White
+RESULT_RECORD = struct.Struct("<BHBBBBBB")
+
+#Values of the winner field in a result record
+BLACK_WON = 0
+WHITE_WON = 1
+DRAW = 2
+
+class ResultsWriter:
+    """Writes game results to a binary results file: the RESULTS_MAGIC header then one RESULT_RECORD per game."""
+
+    def __init__(self, path):
+        self._file = open(path, "wb")
+        self._file.write(RESULTS_MAGIC)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, winner, plies, captures, kings, triple_kings):
+        """
+        Writes the result of one game. Captures, kings and triple kings are (Black, White) pairs of counts, in the
+        same sense as the Player get_*_count methods.
+        """
+        self._file.write(RESULT_RECORD.pack(winner, plies, captures[0], captures[1], kings[0], kings[1],
+                                            triple_kings[0], triple_kings[1]))
+
+    def close(self):
+        """Closes the file."""
+        self._file.close()
+
+def read_results(path):
+    """
+    Reads a results file written by simulate and yields one dictionary per game, with the keys "winner" ("Black",
+    "White" or "Draw"), "plies", "captures", "kings" and "triple_kings". The last three are (Black, White) pairs.
+    """
+    winner_names = ("Black", "White", "Draw")
+    with open(path, "rb") as results_file:
+        if results_file.read(len(RESULTS_MAGIC)) != RESULTS_MAGIC:
+            raise ValueError("not a Checkers results file")
+        while True:
+            record = results_file.read(RESULT_RECORD.size)
+            if len(record) < RESULT_RECORD.size:
+                return
+            winner, plies, black_captures, white_captures, black_kings, white_kings, black_triple_kings, \
+                white_triple_kings = RESULT_RECORD.unpack(record)
+            yield {"winner": winner_names[winner], "plies": plies, "captures": (black_captures, white_captures),
+                   "kings": (black_kings, white_kings), "triple_kings": (black_triple_kings, white_triple_kings)}
+
+def random_policy(seed=None):
+    """Returns a policy that picks a random legal move, using its own random number generator."""
+    choose = random.Random(seed).choice
+
+    def policy(masks, checker_color, moves):
+        return choose(moves)
+
+    return policy
+
+def engine_policy(depth=2):
+    """Returns a policy that picks the move found by an engine search to the given depth."""
+    from CheckersEngine import Engine
+    engine = Engine(None, None)
+
+    def policy(masks, checker_color, moves):
+        if len(moves) == 1:
+            return moves[0]
+        search_game = Checkers.restore(SNAPSHOT.pack(*masks, checker_color[0].encode(), 0, 0, 0, 0, 0, 0,
+                                                     SNAPSHOT_BITBOARD))
+        results = engine.search_root_moves(search_game, moves, depth, float("inf"))
+        return results[-1][2]
+
+    return policy
+
+def simulate(n_games, policy="random", output_path=None, batch_size=1024, max_plies=400, seed=None):
+    """
+    Plays n_games games from the starting position and returns a summary of the results. Policy chooses the moves:
+    "random", "engine", or a function taking the six board masks, the color to move and the list of legal moves
+    from generate_moves and returning one of them. The games are played in lockstep batches of batch_size, each
+    game's board stored as six masks in one shared array, and every finished game is streamed to the results file at
+    output_path (see read_results) if one is given.
+
+    A game is won, as in game_winner, when a player has captured 12 pieces, and also when the player to move has no
+    legal move. A game still going after max_plies moves is a draw.
+    """
+    if policy == "random":
+        policy = random_policy(seed)
+    elif policy == "engine":
+        policy = engine_policy()
+    writer = None
+    if output_path is not None:
+        writer = ResultsWriter(output_path)
+    starting_masks = BitBoard(STARTING_BOARD).get_masks()
+    summary = {"games": 0, "black_wins": 0, "white_wins": 0, "draws": 0, "plies": 0, "seconds": 0.0}
+    start_time = time.perf_counter()
+    try:
+        games_left = n_games
+        while games_left > 0:
+            batch = min(batch_size, games_left)
+            games_left -= batch
+            _simulate_batch(batch, policy, starting_masks, max_plies, writer, summary)
+    finally:
+        if writer is not None:
+            writer.close()
+    summary["seconds"] = time.perf_counter() - start_time
+    return summary
+
+def _simulate_batch(batch, policy, starting_masks, max_plies, writer, summary):
+    """Plays one batch of games in lockstep, one move of every unfinished game per round, adding to the summary."""
+    masks = array("I", starting_masks * batch)
+    #Per game counts, Black's at index 2 * game and White's at 2 * game + 1
+    captures = array("B", bytes(2 * batch))
+    kings = array("B", bytes(2 * batch))
+    triple_kings = array("B", bytes(2 * batch))
+    active_games = list(range(batch))
+    plies = 0
+    while active_games:
+        checker_color = "Black" if plies % 2 == 0 else "White"
+        side = plies % 2
+        still_active = []
+        for game in active_games:
+            offset = 6 * game
+            game_masks = masks[offset:offset + 6]
+            moves = generate_moves(game_masks, checker_color)
+            if not moves:
+                _finish_game(game, 1 - side, plies, captures, kings, triple_kings, writer, summary)
+                continue
+            captured, kings_added, triple_kings_added = apply_move(game_masks, policy(game_masks, checker_color,
+                                                                                     moves))
+            masks[offset:offset + 6] = game_masks
+            counter = 2 * game + side
+            captures[counter] += captured
+            kings[counter] += kings_added
+            triple_kings[counter] += triple_kings_added
+            if captures[counter] >= 12:
+                _finish_game(game, side, plies + 1, captures, kings, triple_kings, writer, summary)
+            elif plies + 1 >= max_plies:
+                _finish_game(game, DRAW, plies + 1, captures, kings, triple_kings, writer, summary)
+            else:
+                still_active.append(game)
+        active_games = still_active
+        plies += 1
+
+def _finish_game(game, winner, plies, captures, kings, triple_kings, writer, summary):
+    """Adds a finished game to the summary and writes it to the results file, if there is one."""
+    summary["games"] += 1
+    summary["plies"] += plies
+    if winner == BLACK_WON:
+        summary["black_wins"] += 1
+    elif winner == WHITE_WON:
+        summary["white_wins"] += 1
+    else:
+        summary["draws"] += 1
+    if writer is not None:
+        writer.write(winner, plies, captures[2 * game:2 * game + 2], kings[2 * game:2 * game + 2],
+                     triple_kings[2 * game:2 * game + 2])
@@ -0,0 +1,46 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Unit tests for the CheckersSimulator program.
+
+import os
+import tempfile
+import unittest
+from CheckersSimulator import simulate, read_results
+
+class TestSimulator(unittest.TestCase):
+    """Contains unit tests for the simulate function and results files."""
+
+    def test_1(self):
+        """Tests that every simulated game is written to the results file and the summary matches it."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.bin")
+            summary = simulate(50, output_path=path, batch_size=16, seed=7)
+            results = list(read_results(path))
+        self.assertEqual(summary["games"], 50)
+        self.assertEqual(len(results), 50)
+        self.assertEqual(summary["black_wins"], sum(1 for result in results if result["winner"] == "Black"))
+        self.assertEqual(summary["plies"], sum(result["plies"] for result in results))
+        for result in results:
+            if result["winner"] == "Black":
+                self.assertTrue(result["captures"][0] == 12 or result["plies"] % 2 == 1)
+            self.assertLessEqual(max(result["captures"]), 12)
+
+    def test_2(self):
+        """Tests that the same seed plays the same games, and that a move limit ends games in a draw."""
+        self.assertEqual(simulate(20, seed=3)["plies"], simulate(20, seed=3)["plies"])
+        summary = simulate(10, max_plies=4, seed=3)
+        self.assertEqual(summary["draws"], 10)
+        self.assertEqual(summary["plies"], 40)
+
+    def test_3(self):
+        """Tests that a custom policy function is used to choose the moves."""
+        chosen = []
+
+        def first_move_policy(masks, checker_color, moves):
+            chosen.append(checker_color)
+            return moves[0]
+
+        summary = simulate(3, policy=first_move_policy, max_plies=6)
+        self.assertEqual(len(chosen), summary["plies"])
+        self.assertEqual(chosen[:2], ["Black", "Black"])
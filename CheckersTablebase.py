@@ -0,0 +1,300 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Generates and reads endgame tablebases for the triple king variant of Checkers.
+
+import argparse
+import itertools
+import math
+import os
+from CheckersGame import generate_moves, apply_move
+
+#Each table file holds one material signature: the number of pieces of each code in PIECE_TYPES. It is TABLE_MAGIC,
+#the six counts as bytes, then one value byte per position with Black to move followed by one per position with White
+#to move. Positions are numbered by the squares of each code in turn (see position_index).
+TABLE_MAGIC = b"CKTBL2"
+
+#Value bytes, from the point of view of the side to move, counting distances in moves (plies) by both sides:
+#  WIN + distance (1 to MAX_DISTANCE)   a win in that many moves; a win always takes at least one move
+#  DRAW                                  a draw with best play
+#  LOSS + distance (0 to MAX_DISTANCE)  a loss in that many moves
+#  UNUSED                                a number that would put two pieces on one square
+WIN = 0
+DRAW = 127
+LOSS = 128
+UNUSED = 255
+MAX_DISTANCE = 126
+
+#COMBINATIONS[n][k] is n choose k, for ranking the squares of each code
+COMBINATIONS = tuple(tuple(math.comb(n, k) for k in range(33)) for n in range(33))
+
+def material_signature(masks):
+    """Returns the number of pieces of each code on the board as a tuple of six counts."""
+    return tuple(mask.bit_count() for mask in masks)
+
+def table_size(signature):
+    """Returns the number of position numbers for one side to move with the signature."""
+    size = 1
+    for count in signature:
+        size *= COMBINATIONS[32][count]
+    return size
+
+def table_file_name(signature):
+    """Returns the file name of the table for the signature, for example "100_010.ckt"."""
+    return "".join(str(count) for count in signature[:3]) + "_" + "".join(str(count) for count in signature[3:]) + \
+        ".ckt"
+
+def position_index(masks, signature):
+    """
+    Returns the number of the position within its signature's table. The squares of each code are ranked as a
+    combination (the sum of square choose k over the code's k-th lowest square) and the ranks are combined code by code.
+    """
+    index = 0
+    for code in range(6):
+        index *= COMBINATIONS[32][signature[code]]
+        mask = masks[code]
+        k = 1
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            index += COMBINATIONS[bit.bit_length() - 1][k]
+            k += 1
+    return index
+
+def _slice_positions(signature):
+    """Yields (position number, masks) for every position with the signature that has one piece per square."""
+    choices = []
+    for count in signature:
+        masks = [sum(1 << square for square in squares) for squares in itertools.combinations(range(32), count)]
+        masks.sort(key=lambda mask: position_index((mask, 0, 0, 0, 0, 0), (count, 0, 0, 0, 0, 0)))
+        choices.append(masks)
+    for index, masks in enumerate(itertools.product(*choices)):
+        occupied = 0
+        for mask in masks:
+            if occupied & mask:
+                break
+            occupied |= mask
+        else:
+            yield index, masks
+
+def signatures(max_pieces):
+    """
+    Returns every signature with one to max_pieces - 1 pieces per side and at most max_pieces pieces in all, in the
+    order they have to be generated. Moves only ever lead to a signature with fewer pieces or with a man or king
+    promoted, so each signature only depends on ones before it.
+    """
+    per_side = [counts for total in range(1, max_pieces) for counts in itertools.product(range(total + 1), repeat=3)
+                if sum(counts) == total]
+    result = [black + white for black in per_side for white in per_side if sum(black) + sum(white) <= max_pieces]
+    result.sort(key=_generation_order)
+    return result
+
+def _generation_order(signature):
+    """Returns the sort key of a signature: its number of pieces, then how many promotions its pieces have left."""
+    return sum(signature), 2 * (signature[0] + signature[3]) + signature[1] + signature[4]
+
+class Tablebase:
+    """
+    Probes the tables in a directory written by generate_tablebase. Tables are read the first time a position with
+    their signature is probed and then kept in memory.
+    """
+
+    def __init__(self, directory):
+        self._directory = directory
+        self._tables = {}
+        self._max_pieces = 0
+        if os.path.isdir(directory):
+            for file_name in os.listdir(directory):
+                if file_name.endswith(".ckt"):
+                    self._max_pieces = max(self._max_pieces, sum(int(count) for count in file_name[:-4]
+                                                                 if count.isdigit()))
+
+    def get_max_pieces(self):
+        """Returns the largest number of pieces of any table in the directory."""
+        return self._max_pieces
+
+    def get_directory(self):
+        """Returns the directory the tables are read from."""
+        return self._directory
+
+    def _load_table(self, signature):
+        """Returns the values of the signature's table, or None if there is no table for it."""
+        if signature not in self._tables:
+            path = os.path.join(self._directory, table_file_name(signature))
+            table = None
+            if os.path.exists(path):
+                with open(path, "rb") as table_file:
+                    data = table_file.read()
+                if data[:6] != TABLE_MAGIC or tuple(data[6:12]) != signature:
+                    raise ValueError("not a Checkers tablebase file: " + path)
+                table = memoryview(data)[12:]
+            self._tables[signature] = table
+        return self._tables[signature]
+
+    def probe_value(self, masks, checker_color):
+        """
+        Returns the value byte of the position for the checker color to move (see WIN, LOSS and DRAW), or None if
+        it isn't in the tablebase. A side to move with no pieces left has lost in 0 moves.
+        """
+        signature = material_signature(masks)
+        if checker_color == "Black":
+            own_pieces, side = sum(signature[:3]), 0
+        else:
+            own_pieces, side = sum(signature[3:]), 1
+        if own_pieces == 0:
+            return LOSS
+        table = self._load_table(signature)
+        if table is None:
+            return None
+        return table[side * table_size(signature) + position_index(masks, signature)]
+
+    def probe(self, masks, checker_color):
+        """
+        Returns the result of the position for the checker color to move as ("win", distance), ("loss", distance) or
+        ("draw", 0), where distance is the number of moves (plies) to the end of the game with best play, or None if
+        the position isn't in the tablebase. A position where the other side has no pieces left is ("win", 0).
+        """
+        if checker_color == "Black" and not (masks[3] | masks[4] | masks[5]) or \
+                checker_color == "White" and not (masks[0] | masks[1] | masks[2]):
+            return "win", 0
+        value = self.probe_value(masks, checker_color)
+        if value is None or value == UNUSED:
+            return None
+        if value == DRAW:
+            return "draw", 0
+        if value >= LOSS:
+            return "loss", value - LOSS
+        return "win", value - WIN
+
+    def probe_game(self, game):
+        """Returns the result (see probe) of the game's current position for the player whose turn it is."""
+        return self.probe(game.get_masks(), game.get_player_turn())
+
+def solve_signature(directory, signature):
+    """
+    Works out the value of every position with the signature by retrograde analysis and writes its table file to the
+    directory. The tables of every signature its moves can lead to must already be there. Returns the signature.
+
+    Each position's moves are generated once. Moves that capture or promote are looked up in the smaller tables,
+    and moves that stay within the signature are linked backwards, from the position they reach to the position they
+    came from. Positions are then settled in order of distance: a position is a win once any move reaches a loss,
+    and a loss once every move reaches a win. Positions never settled are draws.
+    """
+    tablebase = Tablebase(directory)
+    size = table_size(signature)
+    values = bytearray([UNUSED]) * (2 * size)
+    predecessors = {}
+    remaining = {} #number of moves within the signature that haven't reached a win yet
+    longest_win = {} #longest win reached so far, which the position loses in one move more
+    blocked = set() #positions with a move to a draw or a loss, which can't be a loss
+    buckets = [[] for _ in range(MAX_DISTANCE + 2)]
+
+    def settle(entry, value, distance):
+        if distance > MAX_DISTANCE:
+            raise ValueError("distance to win too long to store for signature " + table_file_name(signature))
+        buckets[distance].append((entry, value + distance))
+
+    for index, masks in _slice_positions(signature):
+        for side, checker_color in enumerate(("Black", "White")):
+            entry = side * size + index
+            values[entry] = DRAW
+            moves = generate_moves(masks, checker_color)
+            if not moves:
+                settle(entry, LOSS, 0)
+                continue
+            opponent_color = "White" if side == 0 else "Black"
+            inside = 0
+            best_win = None
+            loss_distance = 0
+            for move in moves:
+                new_masks = list(masks)
+                apply_move(new_masks, move)
+                new_signature = material_signature(new_masks)
+                if new_signature == signature:
+                    inside += 1
+                    predecessors.setdefault((1 - side) * size + position_index(new_masks, signature), []).append(entry)
+                    continue
+                value = tablebase.probe_value(new_masks, opponent_color)
+                if value is None:
+                    raise ValueError("missing table " + table_file_name(new_signature))
+                if value >= LOSS:
+                    blocked.add(entry)
+                    if best_win is None or value - LOSS + 1 < best_win:
+                        best_win = value - LOSS + 1
+                elif value == DRAW:
+                    blocked.add(entry)
+                else:
+                    loss_distance = max(loss_distance, value - WIN)
+            if best_win is not None:
+                settle(entry, WIN, best_win)
+            remaining[entry] = inside
+            longest_win[entry] = loss_distance
+            if inside == 0 and entry not in blocked:
+                settle(entry, LOSS, loss_distance + 1)
+    settled = set()
+    for distance in range(MAX_DISTANCE + 1):
+        for entry, value in buckets[distance]:
+            if entry in settled:
+                continue
+            settled.add(entry)
+            values[entry] = value
+            for predecessor in predecessors.get(entry, ()):
+                if predecessor in settled:
+                    continue
+                if value >= LOSS:
+                    settle(predecessor, WIN, distance + 1)
+                else:
+                    remaining[predecessor] -= 1
+                    longest_win[predecessor] = max(longest_win[predecessor], distance)
+                    if remaining[predecessor] == 0 and predecessor not in blocked:
+                        settle(predecessor, LOSS, longest_win[predecessor] + 1)
+    if buckets[MAX_DISTANCE + 1]:
+        raise ValueError("distance to win too long to store for signature " + table_file_name(signature))
+    path = os.path.join(directory, table_file_name(signature))
+    with open(path + ".tmp", "wb") as table_file:
+        table_file.write(TABLE_MAGIC + bytes(signature) + values)
+    os.replace(path + ".tmp", path)
+    return signature
+
+def generate_tablebase(directory, max_pieces=3, workers=None):
+    """
+    Generates the tables for every signature with up to max_pieces pieces into the directory and returns the list of
+    signatures generated. Signatures that only depend on tables already written are solved at the same time in
+    worker processes (one per core unless workers is given; workers=1 solves them in this process). Each table is
+    written to a temporary file and renamed when it is complete, so an interrupted run can be resumed by calling
+    this again: tables that are already there are skipped.
+    """
+    os.makedirs(directory, exist_ok=True)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    todo = [signature for signature in signatures(max_pieces)
+            if not os.path.exists(os.path.join(directory, table_file_name(signature)))]
+    generated = []
+    executor = None
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(workers)
+    try:
+        for order, group in itertools.groupby(todo, key=_generation_order):
+            group = list(group)
+            if executor is None:
+                generated.extend(solve_signature(directory, signature) for signature in group)
+            else:
+                generated.extend(executor.map(solve_signature, [directory] * len(group), group))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return generated
+
+def main():
+    """Generates a tablebase from the command line."""
+    parser = argparse.ArgumentParser(description="Generate Checkers endgame tablebases.")
+    parser.add_argument("directory", help="directory to write the tables to")
+    parser.add_argument("--pieces", type=int, default=3, help="largest number of pieces on the board")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    arguments = parser.parse_args()
+    for signature in generate_tablebase(arguments.directory, arguments.pieces, arguments.workers):
+        print("generated", table_file_name(signature))
+
+if __name__ == '__main__':
+    main()
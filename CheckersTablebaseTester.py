@@ -0,0 +1,80 @@
+# Author: Ashley Morrow
+# GitHub username: morrowas
+# Date: 10/18/2026
+# Description: Unit tests for the CheckersTablebase program.
+
+import os
+import shutil
+import tempfile
+import unittest
+from CheckersGame import Checkers, BitBoard, generate_moves, apply_move
+from CheckersEngine import Engine, ParallelEngine, WIN_SCORE
+from CheckersTablebase import Tablebase, generate_tablebase, signatures, table_file_name, _slice_positions
+
+class TestTablebase(unittest.TestCase):
+    """Contains unit tests for generating and probing endgame tablebases."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.generated = generate_tablebase(cls.directory, 2, workers=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def test_1(self):
+        """Tests that every position's result agrees with the best result of its moves."""
+        tablebase = Tablebase(self.directory)
+        self.assertEqual(tablebase.get_max_pieces(), 2)
+        for signature in signatures(2):
+            for index, masks in _slice_positions(signature):
+                for checker_color, opponent_color in (("Black", "White"), ("White", "Black")):
+                    results = []
+                    for move in generate_moves(masks, checker_color):
+                        new_masks = list(masks)
+                        apply_move(new_masks, move)
+                        results.append(tablebase.probe(new_masks, opponent_color))
+                    if any(result[0] == "loss" for result in results):
+                        expected = ("win", min(result[1] for result in results if result[0] == "loss") + 1)
+                    elif all(result[0] == "win" for result in results):
+                        expected = ("loss", max([result[1] for result in results], default=-1) + 1)
+                    else:
+                        expected = ("draw", 0)
+                    self.assertEqual(tablebase.probe(masks, checker_color), expected)
+
+    def test_2(self):
+        """Tests that generating again only writes tables that are missing."""
+        self.assertEqual(len(self.generated), len(signatures(2)))
+        self.assertEqual(generate_tablebase(self.directory, 2, workers=1), [])
+        signature = (1, 0, 0, 1, 0, 0)
+        os.remove(os.path.join(self.directory, table_file_name(signature)))
+        self.assertEqual(generate_tablebase(self.directory, 2, workers=1), [signature])
+
+    def test_3(self):
+        """Tests probing a game and an engine using the tablebase to score the position."""
+        rows = [[None] * 8 for _ in range(8)]
+        rows[0][1] = "White"
+        rows[2][1] = "Black_king"
+        game = Checkers()
+        game._set_board(BitBoard(rows), "White")
+        white_player = game.create_player("Adam", "White")
+        game.create_player("Lucy", "Black")
+        self.assertEqual(Tablebase(self.directory).probe_game(game), ("loss", 4))
+        self.assertIsNone(Tablebase(tempfile.gettempdir() + "/no_tables").probe_game(game))
+        engine = Engine(game, white_player, tablebase=Tablebase(self.directory))
+        engine.choose_move(max_depth=1)
+        self.assertEqual(engine.get_search_info()["score"], -WIN_SCORE + 4)
+
+    def test_4(self):
+        """Tests that a parallel engine's workers score the position from the tablebase too."""
+        rows = [[None] * 8 for _ in range(8)]
+        rows[0][1] = "White"
+        rows[2][1] = "Black_king"
+        game = Checkers()
+        game._set_board(BitBoard(rows), "White")
+        white_player = game.create_player("Adam", "White")
+        game.create_player("Lucy", "Black")
+        with ParallelEngine(game, white_player, workers=2, tablebase=Tablebase(self.directory)) as engine:
+            engine.choose_move(max_depth=1)
+            self.assertEqual(engine.get_search_info()["score"], -WIN_SCORE + 4)